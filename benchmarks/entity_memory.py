@@ -0,0 +1,113 @@
+"""Per-instance memory of the domain entities and list DTOs.
+
+Compares the slotted classes with equivalent `__dict__`-backed dataclasses
+that allocate their `Notification` eagerly, which is how the entities were
+laid out before.
+
+    python -m benchmarks.entity_memory [instances]
+"""
+
+import sys
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field, fields, make_dataclass
+from decimal import Decimal
+
+from src.core.cast_member.application.use_cases.list_cast_members import (
+    CastMemberData,
+)
+from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
+from src.core.category.application.use_cases.list_category import CategoryOutput
+from src.core.category.domain.category import Category
+from src.core.genre.application.use_cases.list_genre import GenreData
+from src.core.genre.domain.genre import Genre
+from src.core.video.domain.value_objects import Rating
+from src.core.video.domain.video import Video
+
+
+@dataclass
+class _Notification:
+    """`Notification` as it was before it got `__slots__`."""
+
+    def __init__(self) -> None:
+        self._errors: list[str] = []
+
+
+def unslotted(cls):
+    """Rebuild `cls` as a plain dataclass holding the same fields."""
+    attributes = [
+        (f.name, f.type, field(default=f.default, default_factory=f.default_factory))
+        for f in fields(cls)
+    ]
+    return make_dataclass(f"Unslotted{cls.__name__}", attributes, kw_only=True)
+
+
+def bytes_per_instance(factory, instances: int) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [factory() for _ in range(instances)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # The list holding the objects is not part of the per-instance cost.
+    return (after - before - sys.getsizeof(objects)) / instances
+
+
+def category_attributes():
+    return dict(id=uuid.uuid4(), name="Movie", description="Movies", is_active=True)
+
+
+def genre_attributes():
+    return dict(id=uuid.uuid4(), name="Drama", is_active=True, categories=set())
+
+
+def cast_member_attributes():
+    return dict(id=uuid.uuid4(), name="John Doe", type=CastMemberType.ACTOR)
+
+
+def video_attributes():
+    return dict(
+        id=uuid.uuid4(),
+        title="Movie",
+        description="Description",
+        launch_year=2024,
+        duration=Decimal("120.5"),
+        rating=Rating.L,
+        categories=set(),
+        genres=set(),
+        cast_members=set(),
+    )
+
+
+CASES = [
+    (Category, category_attributes, True),
+    (Genre, genre_attributes, False),
+    (CastMember, cast_member_attributes, False),
+    (Video, video_attributes, True),
+    (CategoryOutput, category_attributes, False),
+    (GenreData, genre_attributes, False),
+    (CastMemberData, cast_member_attributes, False),
+]
+
+
+def main(instances: int) -> None:
+    print(f"{'class':<16}{'before (B)':>12}{'after (B)':>12}{'saved':>8}")
+    for cls, attributes, had_notification in CASES:
+        before_cls = unslotted(cls)
+        notification_field = "_notification" if had_notification else None
+
+        def before_factory():
+            obj = before_cls(**attributes())
+            if notification_field:
+                setattr(obj, notification_field, _Notification())
+            return obj
+
+        # Entities are timed through the validating constructor so the lazy
+        # Notification is part of what gets measured.
+        after = bytes_per_instance(lambda: cls(**attributes()), instances)
+        before = bytes_per_instance(before_factory, instances)
+        saved = 1 - after / before
+        print(f"{cls.__name__:<16}{before:>12.0f}{after:>12.0f}{saved:>8.0%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
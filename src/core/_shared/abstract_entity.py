@@ -1,14 +1,30 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from datetime import datetime
 import uuid
 
 from src.core._shared.notification import Notification
+from src.core._shared.reconstitution import Reconstitutable
 
 
-@dataclass(kw_only=True)
-class AbstractEntity(ABC):
+@dataclass(kw_only=True, slots=True)
+class AbstractEntity(Reconstitutable, ABC):
     id: uuid.UUID = field(default_factory=uuid.uuid4)
-    notification: Notification = field(default_factory=Notification)
+    _notification: Notification | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    version: int = 1
+    updated_at: datetime | None = None
+
+    @property
+    def notification(self) -> Notification:
+        if self._notification is None:
+            self._notification = Notification()
+        return self._notification
+
+    def _raise_if_invalid(self) -> None:
+        if self._notification is not None and self._notification.has_errors:
+            raise ValueError(self._notification.messages)
 
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
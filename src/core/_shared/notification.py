@@ -3,6 +3,8 @@ from dataclasses import dataclass
 
 @dataclass
 class Notification:
+    __slots__ = ("_errors",)
+
     def __init__(self) -> None:
         self._errors: list[str] = []
 
@@ -0,0 +1,74 @@
+import base64
+import heapq
+import json
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Generic, Iterable, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+
+class InvalidCursorException(Exception): ...
+
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T]
+    total_items: int
+
+
+@dataclass
+class CursorMeta:
+    page_size: int
+    next_cursor: str | None
+
+
+@dataclass(frozen=True)
+class Cursor:
+    value: Any
+    id: UUID
+
+
+def sort_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def sort_key(entity, order_by: str) -> tuple:
+    return (sort_value(getattr(entity, order_by)), entity.id)
+
+
+def encode_cursor(entity, order_by: str) -> str:
+    value, id = sort_key(entity, order_by)
+    payload = json.dumps([order_by, value, str(id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(token: str, order_by: str) -> Cursor:
+    try:
+        cursor_order_by, value, id = json.loads(base64.urlsafe_b64decode(token))
+        cursor = Cursor(value=value, id=UUID(id))
+    except (ValueError, TypeError, AttributeError) as error:
+        raise InvalidCursorException(f"Invalid cursor: {token}") from error
+    if cursor_order_by != order_by:
+        raise InvalidCursorException(
+            f"Cursor was issued for order_by '{cursor_order_by}', not '{order_by}'."
+        )
+    return cursor
+
+
+def seek(
+    entities: Iterable[T], order_by: str, cursor: Cursor | None, limit: int
+) -> list[T]:
+    if cursor is not None:
+        position = (cursor.value, cursor.id)
+        entities = (
+            entity for entity in entities if sort_key(entity, order_by) > position
+        )
+    return heapq.nsmallest(
+        limit, entities, key=lambda entity: sort_key(entity, order_by)
+    )
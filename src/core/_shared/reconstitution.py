@@ -0,0 +1,53 @@
+from dataclasses import MISSING, fields
+
+
+def _build_reconstitute(cls):
+    """Compile a keyword-only constructor that assigns fields and nothing else.
+
+    It is generated per class, the way `dataclasses` builds `__init__`, so the
+    trusted path stays cheaper than the validating one.
+    """
+    namespace = {"_cls": cls, "_new": object.__new__, "_MISSING": MISSING}
+    params, body = [], []
+    for field in fields(cls):
+        name = field.name
+        if field.default is not MISSING:
+            namespace[f"_default_{name}"] = field.default
+            params.append(f"{name}=_default_{name}")
+        elif field.default_factory is not MISSING:
+            namespace[f"_factory_{name}"] = field.default_factory
+            params.append(f"{name}=_MISSING")
+            body.append(
+                f"    if {name} is _MISSING:\n        {name} = _factory_{name}()"
+            )
+        else:
+            params.append(name)
+        body.append(f"    entity.{name} = {name}")
+    source = (
+        f"def reconstitute(cls, *, {', '.join(params)}):\n"
+        "    entity = _new(_cls)\n" + "\n".join(body) + "\n    return entity\n"
+    )
+    exec(source, namespace)
+    return namespace["reconstitute"]
+
+
+class Reconstitutable:
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Never inherit a constructor compiled for a parent's fields.
+        cls.reconstitute = Reconstitutable.__dict__["reconstitute"]
+
+    @classmethod
+    def reconstitute(cls, **attributes):
+        """Rebuild an entity from state that was already validated on write.
+
+        Repositories use this when mapping rows, so `__post_init__` and the
+        domain validation it triggers are skipped. Omitted fields get their
+        declared defaults. The first call compiles a constructor for `cls` and
+        installs it in place of this method.
+        """
+        reconstitute = _build_reconstitute(cls)
+        cls.reconstitute = classmethod(reconstitute)
+        return reconstitute(cls, **attributes)
@@ -0,0 +1,37 @@
+import bisect
+from uuid import UUID
+
+from src.core._shared.pagination import Cursor, sort_key
+
+
+class SortedIndex:
+    """Entity ids kept sorted by `(attribute, id)`, the order the ORM lists in.
+
+    The key each entity was indexed under is remembered, so an entity that was
+    mutated in place can still be found and re-indexed on update.
+    """
+
+    def __init__(self, attribute: str):
+        self.attribute = attribute
+        self._keys: list[tuple] = []
+        self._key_by_id: dict[UUID, tuple] = {}
+
+    def add(self, entity) -> None:
+        self.discard(entity.id)
+        key = sort_key(entity, self.attribute)
+        self._key_by_id[entity.id] = key
+        bisect.insort(self._keys, key)
+
+    def discard(self, id: UUID) -> None:
+        key = self._key_by_id.pop(id, None)
+        if key is not None:
+            del self._keys[bisect.bisect_left(self._keys, key)]
+
+    def ids(self, offset: int, limit: int) -> list[UUID]:
+        return [id for _, id in self._keys[offset : offset + limit]]
+
+    def ids_after(self, cursor: Cursor | None, limit: int) -> list[UUID]:
+        start = 0
+        if cursor is not None:
+            start = bisect.bisect_right(self._keys, (cursor.value, cursor.id))
+        return [id for _, id in self._keys[start : start + limit]]
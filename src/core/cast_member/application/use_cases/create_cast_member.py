@@ -3,6 +3,7 @@ from uuid import UUID
 
 from src.core.cast_member.application.use_cases.exceptions import (
     InvalidCastMemberDataException,
+    InvalidCastMembersDataException,
 )
 from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
 
@@ -37,3 +38,38 @@ class CreateCastMember:
             name=created_cast_member.name,
             type=created_cast_member.type,
         )
+
+
+@dataclass
+class CreateCastMembers:
+    @dataclass
+    class Input:
+        items: list[CreateCastMember.Input]
+
+    @dataclass
+    class Output:
+        data: list[CreateCastMember.Output]
+
+    def __init__(self, repository):
+        self.repository = repository
+
+    def execute(self, input: Input) -> Output:
+        cast_members, errors = [], {}
+        for index, item in enumerate(input.items):
+            try:
+                cast_members.append(CastMember(name=item.name, type=item.type))
+            except (ValueError, TypeError) as e:
+                errors[index] = str(e)
+        if errors:
+            raise InvalidCastMembersDataException(errors)
+        created_cast_members = self.repository.save_many(cast_members)
+        return self.Output(
+            data=[
+                CreateCastMember.Output(
+                    id=cast_member.id,
+                    name=cast_member.name,
+                    type=cast_member.type,
+                )
+                for cast_member in created_cast_members
+            ]
+        )
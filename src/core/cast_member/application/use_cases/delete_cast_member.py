@@ -28,3 +28,22 @@ class DeleteCastMember:
             )
         self.repository.delete(input.id)
         return self.Output(detail="Cast member deleted successfully")
+
+
+@dataclass
+class DeleteCastMembers:
+    @dataclass
+    class Input:
+        ids: set[UUID]
+
+    @dataclass
+    class Output:
+        deleted_ids: set[UUID]
+        missing_ids: set[UUID]
+
+    def __init__(self, repository: CastMemberRepository):
+        self.repository = repository
+
+    def execute(self, input) -> Output:
+        deleted_ids = self.repository.delete_many(input.ids)
+        return self.Output(deleted_ids=deleted_ids, missing_ids=input.ids - deleted_ids)
@@ -2,3 +2,12 @@ class InvalidCastMemberDataException(Exception): ...
 
 
 class CastMemberNotFoundException(Exception): ...
+
+
+class CastMemberVersionConflictException(Exception): ...
+
+
+class InvalidCastMembersDataException(InvalidCastMemberDataException):
+    def __init__(self, errors: dict[int, str]):
+        super().__init__(f"Invalid cast members at positions {sorted(errors)}.")
+        self.errors = errors
@@ -1,11 +1,17 @@
 from dataclasses import dataclass
 from uuid import UUID
 
-from src.core.cast_member.domain.cast_member import CastMemberType
+from src.core._shared.pagination import (
+    Cursor,
+    CursorMeta,
+    decode_cursor,
+    encode_cursor,
+)
+from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
 from src.core.cast_member.domain.cast_member_repository import CastMemberRepository
 
 
-@dataclass
+@dataclass(slots=True)
 class CastMemberData:
     id: UUID
     name: str
@@ -25,7 +31,12 @@ class ListCastMember:
         self.repository = repository
 
     def execute(self, input: Input) -> Output:
-        cast_members = self.repository.list()
+        return self._output(self.repository.list())
+
+    async def aexecute(self, input: Input) -> Output:
+        return self._output(await self.repository.alist())
+
+    def _output(self, cast_members: list[CastMember]) -> Output:
         return ListCastMember.Output(
             data=[
                 CastMemberData(
@@ -36,3 +47,61 @@ class ListCastMember:
                 for cast_member in cast_members
             ]
         )
+
+
+@dataclass
+class ListCastMemberWithCursor:
+    @dataclass
+    class Input:
+        order_by: str = "name"
+        cursor: str | None = None
+        page_size: int = 2
+
+    @dataclass
+    class Output:
+        data: list[CastMemberData]
+        meta: CursorMeta
+
+    def __init__(self, repository: CastMemberRepository):
+        self.repository = repository
+
+    def execute(self, input: Input) -> Output:
+        cast_members = self.repository.list_after(
+            order_by=input.order_by,
+            cursor=self._cursor(input),
+            limit=input.page_size + 1,
+        )
+        return self._output(input, cast_members)
+
+    async def aexecute(self, input: Input) -> Output:
+        cast_members = await self.repository.alist_after(
+            order_by=input.order_by,
+            cursor=self._cursor(input),
+            limit=input.page_size + 1,
+        )
+        return self._output(input, cast_members)
+
+    def _cursor(self, input: Input) -> Cursor | None:
+        return decode_cursor(input.cursor, input.order_by) if input.cursor else None
+
+    def _output(self, input: Input, cast_members: list[CastMember]) -> Output:
+        cast_members_page = cast_members[: input.page_size]
+        has_next_page = len(cast_members) > input.page_size
+        return ListCastMemberWithCursor.Output(
+            data=[
+                CastMemberData(
+                    id=cast_member.id,
+                    name=cast_member.name,
+                    type=cast_member.type,
+                )
+                for cast_member in cast_members_page
+            ],
+            meta=CursorMeta(
+                page_size=input.page_size,
+                next_cursor=(
+                    encode_cursor(cast_members_page[-1], input.order_by)
+                    if has_next_page
+                    else None
+                ),
+            ),
+        )
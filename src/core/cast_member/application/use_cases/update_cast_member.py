@@ -3,6 +3,7 @@ from uuid import UUID
 
 from src.core.cast_member.application.use_cases.exceptions import (
     CastMemberNotFoundException,
+    CastMemberVersionConflictException,
     InvalidCastMemberDataException,
 )
 from src.core.cast_member.domain.cast_member import CastMemberType
@@ -16,12 +17,14 @@ class UpdateCastMember:
         id: UUID
         name: str | None = None
         type: CastMemberType | None = None
+        version: int | None = None
 
     @dataclass
     class Output:
         id: UUID
         name: str
         type: CastMemberType
+        version: int
 
     def __init__(self, repository: CastMemberRepository):
         self.repository = repository
@@ -32,14 +35,25 @@ class UpdateCastMember:
             raise CastMemberNotFoundException(
                 f"Can not update cast member with id: {input.id}. Cast member not found."
             )
+        if input.version is not None and input.version != cast_member.version:
+            raise CastMemberVersionConflictException(
+                f"Can not update cast member with id: {input.id}. "
+                f"Expected version {input.version}, found {cast_member.version}."
+            )
         try:
             cast_member.change_name(input.name) if input.name else None
             cast_member.change_type(input.type) if input.type else None
         except (ValueError, TypeError) as error:
             raise InvalidCastMemberDataException(str(error))
         updated_cast_member = self.repository.update(cast_member)
+        if updated_cast_member is None:
+            raise CastMemberVersionConflictException(
+                f"Can not update cast member with id: {input.id}. "
+                "Cast member was modified concurrently."
+            )
         return self.Output(
             id=updated_cast_member.id,
             name=updated_cast_member.name,
             type=updated_cast_member.type,
+            version=updated_cast_member.version,
         )
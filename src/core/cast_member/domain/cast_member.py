@@ -1,18 +1,23 @@
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
 from uuid import UUID, uuid4
 
+from src.core._shared.reconstitution import Reconstitutable
+
 
 class CastMemberType(Enum):
     DIRECTOR = "DIRECTOR"
     ACTOR = "ACTOR"
 
 
-@dataclass
-class CastMember:
+@dataclass(slots=True)
+class CastMember(Reconstitutable):
     name: str
     type: CastMemberType
     id: UUID = field(default_factory=uuid4)
+    version: int = 1
+    updated_at: datetime | None = None
 
     def __post_init__(self):
         self._validate()
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 
+from src.core._shared.pagination import Cursor
 from src.core.cast_member.domain.cast_member import CastMember
 
 
@@ -9,14 +10,33 @@ class CastMemberRepository(ABC):
     def save(self, cast_member: CastMember) -> CastMember:
         raise NotImplementedError
 
+    @abstractmethod
+    def save_many(self, cast_members: list[CastMember]) -> list[CastMember]:
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_id(self, id: UUID) -> CastMember | None:
         raise NotImplementedError
 
+    @abstractmethod
+    def find_existing_ids(self, ids: set[UUID]) -> set[UUID]:
+        raise NotImplementedError
+
     @abstractmethod
     def delete(self, id: UUID) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        """Delete the given ids and return the ones that existed."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_after(
+        self, order_by: str, cursor: Cursor | None, limit: int
+    ) -> list[CastMember]:
+        raise NotImplementedError
+
     @abstractmethod
     def list(self) -> list[CastMember]:
         raise NotImplementedError
@@ -24,3 +44,21 @@ class CastMemberRepository(ABC):
     @abstractmethod
     def update(self, cast_member: CastMember) -> CastMember | None:
         raise NotImplementedError
+
+
+class AsyncCastMemberRepository(ABC):
+    """Read side of `CastMemberRepository` for code running on an event loop."""
+
+    @abstractmethod
+    async def aget_by_id(self, id: UUID) -> CastMember | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def alist_after(
+        self, order_by: str, cursor: Cursor | None, limit: int
+    ) -> list[CastMember]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def alist(self) -> list[CastMember]:
+        raise NotImplementedError
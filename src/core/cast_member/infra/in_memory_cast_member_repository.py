@@ -1,29 +1,59 @@
+from src.core._shared.pagination import seek
+from src.core._shared.sorted_index import SortedIndex
 from src.core.cast_member.domain.cast_member_repository import CastMemberRepository
 
 
 class InMemoryCastMemberRepository(CastMemberRepository):
-    def __init__(self, cast_members=None):
-        self.cast_members = cast_members or []
+    def __init__(self, cast_members=None, sorted_indexes=("name",)):
+        self._cast_members = {}
+        self._indexes = {field: SortedIndex(field) for field in sorted_indexes}
+        for cast_member in cast_members or []:
+            self.save(cast_member)
+
+    @property
+    def cast_members(self):
+        return list(self._cast_members.values())
 
     def save(self, cast_member):
-        self.cast_members.append(cast_member)
+        self._cast_members[cast_member.id] = cast_member
+        for index in self._indexes.values():
+            index.add(cast_member)
         return cast_member
 
+    def save_many(self, cast_members):
+        return [self.save(cast_member) for cast_member in cast_members]
+
     def get_by_id(self, id):
-        return next(
-            (cast_member for cast_member in self.cast_members if cast_member.id == id),
-            None,
-        )
+        return self._cast_members.get(id)
+
+    def find_existing_ids(self, ids):
+        return {id for id in ids if id in self._cast_members}
 
     def delete(self, id):
-        self.cast_members = [
-            cast_member for cast_member in self.cast_members if cast_member.id != id
-        ]
+        self._cast_members.pop(id, None)
+        for index in self._indexes.values():
+            index.discard(id)
+
+    def delete_many(self, ids):
+        existing_ids = self.find_existing_ids(ids)
+        for id in existing_ids:
+            self.delete(id)
+        return existing_ids
 
     def update(self, cast_member):
-        self.cast_members.remove(cast_member)
-        self.cast_members.append(cast_member)
-        return cast_member
+        if cast_member.id not in self._cast_members:
+            return None
+        self.delete(cast_member.id)
+        cast_member.version += 1
+        return self.save(cast_member)
+
+    def list_after(self, order_by, cursor, limit):
+        if order_by in self._indexes:
+            return [
+                self._cast_members[id]
+                for id in self._indexes[order_by].ids_after(cursor, limit)
+            ]
+        return seek(self._cast_members.values(), order_by, cursor, limit)
 
     def list(self):
-        return [cast_member for cast_member in self.cast_members]
+        return [cast_member for cast_member in self._cast_members.values()]
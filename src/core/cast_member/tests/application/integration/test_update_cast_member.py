@@ -50,6 +50,7 @@ class TestUpdateCastMember(CommonFixtures):
             id=cast_member_actor.id,
             name="John Doe Director",
             type=cast_member_actor.type,
+            version=2,
         )
 
     def test_update_cast_member_only_name(
@@ -67,6 +68,7 @@ class TestUpdateCastMember(CommonFixtures):
             id=cast_member_actor.id,
             name="John Doe Updated",
             type=cast_member_actor.type,
+            version=2,
         )
 
     def test_update_cast_member_only_type(
@@ -84,6 +86,7 @@ class TestUpdateCastMember(CommonFixtures):
             id=cast_member_actor.id,
             name=cast_member_actor.name,
             type=CastMemberType.DIRECTOR,
+            version=2,
         )
 
     def test_update_cast_member_not_found(
@@ -5,9 +5,11 @@ import pytest
 
 from src.core.cast_member.application.use_cases.create_cast_member import (
     CreateCastMember,
+    CreateCastMembers,
 )
 from src.core.cast_member.application.use_cases.exceptions import (
     InvalidCastMemberDataException,
+    InvalidCastMembersDataException,
 )
 from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
 from src.core.cast_member.domain.cast_member_repository import CastMemberRepository
@@ -112,3 +114,40 @@ class TestCreateCastMember(CommonFixtures):
             match=re.escape(error_message),
         ):
             use_case.execute(input)
+
+
+class TestCreateCastMembers(CommonFixtures):
+    def test_saves_all_cast_members_in_one_call(self, cast_member_repository):
+        cast_member_repository.save_many.side_effect = lambda items: items
+        use_case = CreateCastMembers(repository=cast_member_repository)
+
+        output = use_case.execute(
+            CreateCastMembers.Input(
+                items=[
+                    CreateCastMember.Input(name="John", type=CastMemberType.ACTOR),
+                    CreateCastMember.Input(name="Jane", type=CastMemberType.DIRECTOR),
+                ]
+            )
+        )
+
+        assert [(item.name, item.type) for item in output.data] == [
+            ("John", CastMemberType.ACTOR),
+            ("Jane", CastMemberType.DIRECTOR),
+        ]
+        cast_member_repository.save_many.assert_called_once()
+
+    def test_reports_invalid_items_by_position(self, cast_member_repository):
+        use_case = CreateCastMembers(repository=cast_member_repository)
+
+        with pytest.raises(InvalidCastMembersDataException) as exc_info:
+            use_case.execute(
+                CreateCastMembers.Input(
+                    items=[
+                        CreateCastMember.Input(name="", type=CastMemberType.ACTOR),
+                        CreateCastMember.Input(name="John", type=CastMemberType.ACTOR),
+                    ]
+                )
+            )
+
+        assert list(exc_info.value.errors) == [0]
+        cast_member_repository.save_many.assert_not_called()
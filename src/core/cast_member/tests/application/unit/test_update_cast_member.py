@@ -60,6 +60,7 @@ class TestUpdateCastMember(CommonFixtures):
             id=cast_member_actor.id,
             name="John Doe Director",
             type=cast_member_actor.type,
+            version=1,
         )
         cast_member_repository_with_instances_created.update.assert_called_once_with(
             cast_member_actor
@@ -87,6 +88,7 @@ class TestUpdateCastMember(CommonFixtures):
             id=cast_member_actor.id,
             name="John Doe Updated",
             type=cast_member_actor.type,
+            version=1,
         )
 
     def test_update_cast_member_only_type(
@@ -111,6 +113,7 @@ class TestUpdateCastMember(CommonFixtures):
             id=cast_member_actor.id,
             name=cast_member_actor.name,
             type=CastMemberType.DIRECTOR,
+            version=1,
         )
 
     def test_update_cast_member_not_found(
@@ -87,3 +87,11 @@ class TestCastMemberUpdate:
             match=re.escape(error_message),
         ):
             cast_member.change_type("INVALID")
+
+
+class TestCastMemberReconstitution:
+    def test_reconstitute_skips_validation(self):
+        cast_member = CastMember.reconstitute(name="", type=CastMemberType.ACTOR)
+        assert cast_member.name == ""
+        assert cast_member.type == CastMemberType.ACTOR
+        assert isinstance(cast_member.id, uuid.UUID)
@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 from uuid import UUID
 
-from src.core.category.application.use_cases.exceptions import InvalidCategoryDataException
+from src.core.category.application.use_cases.exceptions import (
+    InvalidCategoriesDataException,
+    InvalidCategoryDataException,
+)
 from src.core.category.domain.category import Category
 from src.core.category.domain.category_repository import CategoryRepository
 
@@ -41,3 +44,46 @@ class CreateCategory:
             description=created_category.description,
             is_active=created_category.is_active,
         )
+
+
+@dataclass
+class CreateCategoriesInput:
+    items: list[CreateCategoryInput]
+
+
+@dataclass
+class CreateCategoriesOutput:
+    data: list[CreateCategoryOutput]
+
+
+class CreateCategories:
+    def __init__(self, repository: CategoryRepository):
+        self.repository = repository
+
+    def execute(self, request: CreateCategoriesInput) -> CreateCategoriesOutput:
+        categories, errors = [], {}
+        for index, item in enumerate(request.items):
+            try:
+                categories.append(
+                    Category(
+                        name=item.name,
+                        description=item.description,
+                        is_active=item.is_active,
+                    )
+                )
+            except ValueError as error:
+                errors[index] = str(error)
+        if errors:
+            raise InvalidCategoriesDataException(errors)
+        created_categories = self.repository.save_many(categories)
+        return CreateCategoriesOutput(
+            data=[
+                CreateCategoryOutput(
+                    id=category.id,
+                    name=category.name,
+                    description=category.description,
+                    is_active=category.is_active,
+                )
+                for category in created_categories
+            ]
+        )
@@ -27,3 +27,26 @@ class DeleteCategory:
             )
         self.repository.delete(category.id)
         return DeleteCategoryOutput(detail="Category deleted successfully.")
+
+
+@dataclass
+class DeleteCategoriesInput:
+    ids: set[UUID]
+
+
+@dataclass
+class DeleteCategoriesOutput:
+    deleted_ids: set[UUID]
+    missing_ids: set[UUID]
+
+
+class DeleteCategories:
+    def __init__(self, repository: CategoryRepository):
+        self.repository = repository
+
+    def execute(self, request: DeleteCategoriesInput) -> DeleteCategoriesOutput:
+        deleted_ids = self.repository.delete_many(request.ids)
+        return DeleteCategoriesOutput(
+            deleted_ids=deleted_ids,
+            missing_ids=request.ids - deleted_ids,
+        )
@@ -4,3 +4,13 @@ class InvalidCategoryDataException(Exception):
 
 class CategoryNotFoundException(Exception):
     pass
+
+
+class CategoryVersionConflictException(Exception):
+    pass
+
+
+class InvalidCategoriesDataException(InvalidCategoryDataException):
+    def __init__(self, errors: dict[int, str]):
+        super().__init__(f"Invalid categories at positions {sorted(errors)}.")
+        self.errors = errors
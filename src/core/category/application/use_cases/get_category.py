@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 
 from src.core.category.application.use_cases.exceptions import CategoryNotFoundException
@@ -16,6 +17,8 @@ class GetCategoryResponse:
     name: str
     description: str
     is_active: bool
+    version: int
+    updated_at: datetime | None = None
 
 
 class GetCategory:
@@ -23,7 +26,12 @@ class GetCategory:
         self.repository = repository
 
     def execute(self, request: GetCategoryInput) -> GetCategoryResponse:
-        category = self.repository.get_by_id(request.id)
+        return self._response(request, self.repository.get_by_id(request.id))
+
+    async def aexecute(self, request: GetCategoryInput) -> GetCategoryResponse:
+        return self._response(request, await self.repository.aget_by_id(request.id))
+
+    def _response(self, request: GetCategoryInput, category) -> GetCategoryResponse:
         if category is None:
             raise CategoryNotFoundException(f"Category with {request.id} not found.")
         return GetCategoryResponse(
@@ -31,4 +39,6 @@ class GetCategory:
             name=category.name,
             description=category.description,
             is_active=category.is_active,
+            version=category.version,
+            updated_at=category.updated_at,
         )
@@ -1,10 +1,19 @@
+import math
 from dataclasses import dataclass, field
 from uuid import UUID
 
+from src.core._shared.pagination import (
+    Cursor,
+    CursorMeta,
+    Page,
+    decode_cursor,
+    encode_cursor,
+)
+from src.core.category.domain.category import Category
 from src.core.category.domain.category_repository import CategoryRepository
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryOutput:
     id: UUID
     name: str
@@ -36,37 +45,96 @@ class ListCategory:
         meta: Meta = field(default_factory=Meta)
 
     def execute(self, request: Input) -> Output:
-        categories = self.repository.list()
-        sorted_categories = sorted(
-            [
+        page = self.repository.list_page(
+            order_by=request.order_by,
+            offset=(request.current_page - 1) * request.page_size,
+            limit=request.page_size,
+        )
+        return self._output(request, page)
+
+    async def aexecute(self, request: Input) -> Output:
+        page = await self.repository.alist_page(
+            order_by=request.order_by,
+            offset=(request.current_page - 1) * request.page_size,
+            limit=request.page_size,
+        )
+        return self._output(request, page)
+
+    def _output(self, request: Input, page: Page[Category]) -> Output:
+        return ListCategory.Output(
+            data=[
                 CategoryOutput(
                     id=category.id,
                     name=category.name,
                     description=category.description,
                     is_active=category.is_active,
                 )
-                for category in categories
+                for category in page.items
             ],
-            key=lambda category: getattr(category, request.order_by),
-        )
-        page_offset = (request.current_page - 1) * request.page_size
-        categories_page = sorted_categories[
-            page_offset : page_offset + request.page_size
-        ]
-        total_pages = (
-            len(sorted_categories) // request.page_size
-            if self._is_list_length_even(sorted_categories)
-            else (len(sorted_categories) // request.page_size) + 1
-        )
-        return ListCategory.Output(
-            data=categories_page,
             meta=Meta(
                 current_page=request.current_page,
                 page_size=request.page_size,
-                total_items=len(sorted_categories),
-                total_pages=total_pages,
+                total_items=page.total_items,
+                total_pages=math.ceil(page.total_items / request.page_size),
             ),
         )
 
-    def _is_list_length_even(self, list: list) -> bool:
-        return len(list) % 2 == 0
+
+class ListCategoryWithCursor:
+    def __init__(self, repository: CategoryRepository):
+        self.repository = repository
+
+    @dataclass
+    class Input:
+        order_by: str = "name"
+        cursor: str | None = None
+        page_size: int = 2
+
+    @dataclass
+    class Output:
+        data: list[CategoryOutput]
+        meta: CursorMeta
+
+    def execute(self, request: Input) -> Output:
+        categories = self.repository.list_after(
+            order_by=request.order_by,
+            cursor=self._cursor(request),
+            limit=request.page_size + 1,
+        )
+        return self._output(request, categories)
+
+    async def aexecute(self, request: Input) -> Output:
+        categories = await self.repository.alist_after(
+            order_by=request.order_by,
+            cursor=self._cursor(request),
+            limit=request.page_size + 1,
+        )
+        return self._output(request, categories)
+
+    def _cursor(self, request: Input) -> Cursor | None:
+        return (
+            decode_cursor(request.cursor, request.order_by) if request.cursor else None
+        )
+
+    def _output(self, request: Input, categories: list[Category]) -> Output:
+        categories_page = categories[: request.page_size]
+        has_next_page = len(categories) > request.page_size
+        return ListCategoryWithCursor.Output(
+            data=[
+                CategoryOutput(
+                    id=category.id,
+                    name=category.name,
+                    description=category.description,
+                    is_active=category.is_active,
+                )
+                for category in categories_page
+            ],
+            meta=CursorMeta(
+                page_size=request.page_size,
+                next_cursor=(
+                    encode_cursor(categories_page[-1], request.order_by)
+                    if has_next_page
+                    else None
+                ),
+            ),
+        )
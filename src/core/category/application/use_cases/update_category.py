@@ -3,6 +3,7 @@ from uuid import UUID
 
 from src.core.category.application.use_cases.exceptions import (
     CategoryNotFoundException,
+    CategoryVersionConflictException,
     InvalidCategoryDataException,
 )
 from src.core.category.domain.category_repository import CategoryRepository
@@ -14,6 +15,7 @@ class UpdateCategoryInput:
     name: str | None = None
     description: str | None = None
     is_active: bool = True
+    version: int | None = None
 
 
 @dataclass
@@ -22,6 +24,7 @@ class UpdateCategoryOutput:
     name: str
     description: str
     is_active: bool
+    version: int
 
 
 class UpdateCategory:
@@ -34,6 +37,11 @@ class UpdateCategory:
             raise CategoryNotFoundException(
                 f"Can not update category with id: {request.id}. Category not found."
             )
+        if request.version is not None and request.version != category.version:
+            raise CategoryVersionConflictException(
+                f"Can not update category with id: {request.id}. "
+                f"Expected version {request.version}, found {category.version}."
+            )
         category_name = request.name if request.name else category.name
         category_description = (
             request.description if request.description else category.description
@@ -43,10 +51,46 @@ class UpdateCategory:
         except ValueError as error:
             raise InvalidCategoryDataException(str(error))
         category.activate() if request.is_active else category.deactivate()
-        self.repository.update(category)
+        if self.repository.update(category) is None:
+            raise CategoryVersionConflictException(
+                f"Can not update category with id: {request.id}. "
+                "Category was modified concurrently."
+            )
         return UpdateCategoryOutput(
             id=category.id,
             name=category.name,
             description=category.description,
             is_active=category.is_active,
+            version=category.version,
+        )
+
+
+@dataclass
+class UpdateCategoriesInput:
+    ids: set[UUID]
+    is_active: bool
+
+
+@dataclass
+class UpdateCategoriesOutput:
+    updated_ids: set[UUID]
+    missing_ids: set[UUID]
+
+
+class UpdateCategories:
+    """Activate or deactivate many categories at once.
+
+    `is_active` is the only attribute that makes sense to set on a batch, and
+    it carries no invariant, so the repository writes it without loading the
+    entities.
+    """
+
+    def __init__(self, repository: CategoryRepository):
+        self.repository = repository
+
+    def execute(self, request: UpdateCategoriesInput) -> UpdateCategoriesOutput:
+        updated_ids = self.repository.update_many(request.ids, request.is_active)
+        return UpdateCategoriesOutput(
+            updated_ids=updated_ids,
+            missing_ids=request.ids - updated_ids,
         )
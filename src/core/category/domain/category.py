@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from src.core._shared.abstract_entity import AbstractEntity
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class Category(AbstractEntity):
     name: str
     description: str = ""
@@ -26,8 +26,7 @@ class Category(AbstractEntity):
     def _validate(self):
         self._validate_name()
         self._validate_description()
-        if self.notification.has_errors:
-            raise ValueError(self.notification.messages)
+        self._raise_if_invalid()
 
     def _validate_name(self):
         if not self.name:
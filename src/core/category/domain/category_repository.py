@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 
+from src.core._shared.pagination import Cursor, Page
 from src.core.category.domain.category import Category
 
 
@@ -9,14 +10,37 @@ class CategoryRepository(ABC):
     def save(self, category: Category) -> Category:
         raise NotImplementedError
 
+    @abstractmethod
+    def save_many(self, categories: list[Category]) -> list[Category]:
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_id(self, id: UUID) -> Category | None:
         raise NotImplementedError
 
+    @abstractmethod
+    def find_existing_ids(self, ids: set[UUID]) -> set[UUID]:
+        raise NotImplementedError
+
     @abstractmethod
     def delete(self, id: UUID) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        """Delete the given ids and return the ones that existed."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_page(self, order_by: str, offset: int, limit: int) -> Page[Category]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_after(
+        self, order_by: str, cursor: Cursor | None, limit: int
+    ) -> list[Category]:
+        raise NotImplementedError
+
     @abstractmethod
     def list(self) -> list[Category]:
         raise NotImplementedError
@@ -24,3 +48,28 @@ class CategoryRepository(ABC):
     @abstractmethod
     def update(self, category: Category) -> Category | None:
         raise NotImplementedError
+
+    @abstractmethod
+    def update_many(self, ids: set[UUID], is_active: bool) -> set[UUID]:
+        """Set `is_active` on the given ids and return the ones that existed."""
+        raise NotImplementedError
+
+
+class AsyncCategoryRepository(ABC):
+    """Read side of `CategoryRepository` for code running on an event loop."""
+
+    @abstractmethod
+    async def aget_by_id(self, id: UUID) -> Category | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def alist_page(
+        self, order_by: str, offset: int, limit: int
+    ) -> Page[Category]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def alist_after(
+        self, order_by: str, cursor: Cursor | None, limit: int
+    ) -> list[Category]:
+        raise NotImplementedError
@@ -1,31 +1,88 @@
+import heapq
 from uuid import UUID
 
+from src.core._shared.pagination import Cursor, Page, seek
+from src.core._shared.sorted_index import SortedIndex
+
 from src.core.category.domain.category import Category
 from src.core.category.domain.category_repository import CategoryRepository
 
 
 class InMemoryCategoryRepository(CategoryRepository):
-    def __init__(self, categories=None):
-        self.categories = categories or []
+    def __init__(self, categories=None, sorted_indexes=("name",)):
+        self._categories: dict[UUID, Category] = {}
+        self._indexes = {field: SortedIndex(field) for field in sorted_indexes}
+        for category in categories or []:
+            self.save(category)
+
+    @property
+    def categories(self) -> list[Category]:
+        return list(self._categories.values())
 
     def save(self, category: Category) -> Category:
-        self.categories.append(category)
+        self._categories[category.id] = category
+        for index in self._indexes.values():
+            index.add(category)
         return category
 
+    def save_many(self, categories: list[Category]) -> list[Category]:
+        return [self.save(category) for category in categories]
+
     def get_by_id(self, id: UUID) -> Category | None:
-        return next(
-            (category for category in self.categories if category.id == id), None
-        )
+        return self._categories.get(id)
+
+    def find_existing_ids(self, ids: set[UUID]) -> set[UUID]:
+        return {id for id in ids if id in self._categories}
 
     def delete(self, id: UUID) -> None:
-        self.categories = [
-            category for category in self.categories if category.id != id
-        ]
+        self._categories.pop(id, None)
+        for index in self._indexes.values():
+            index.discard(id)
 
-    def update(self, category: Category) -> Category:
-        self.categories.remove(category)
-        self.categories.append(category)
-        return category
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        existing_ids = self.find_existing_ids(ids)
+        for id in existing_ids:
+            self.delete(id)
+        return existing_ids
+
+    def update(self, category: Category) -> Category | None:
+        if category.id not in self._categories:
+            return None
+        self.delete(category.id)
+        category.version += 1
+        return self.save(category)
+
+    def update_many(self, ids: set[UUID], is_active: bool) -> set[UUID]:
+        existing_ids = self.find_existing_ids(ids)
+        for id in existing_ids:
+            category = self._categories[id]
+            category.is_active = is_active
+            self.update(category)
+        return existing_ids
+
+    def list_page(self, order_by: str, offset: int, limit: int) -> Page[Category]:
+        if order_by in self._indexes:
+            categories = [
+                self._categories[id]
+                for id in self._indexes[order_by].ids(offset, limit)
+            ]
+        else:
+            categories = heapq.nsmallest(
+                offset + limit,
+                self._categories.values(),
+                key=lambda category: (getattr(category, order_by), category.id),
+            )[offset:]
+        return Page(items=categories, total_items=len(self._categories))
+
+    def list_after(
+        self, order_by: str, cursor: Cursor | None, limit: int
+    ) -> list[Category]:
+        if order_by in self._indexes:
+            return [
+                self._categories[id]
+                for id in self._indexes[order_by].ids_after(cursor, limit)
+            ]
+        return seek(self._categories.values(), order_by, cursor, limit)
 
     def list(self) -> list[Category]:
-        return [category for category in self.categories]
+        return [category for category in self._categories.values()]
@@ -1,4 +1,8 @@
+import uuid
+
 from src.core.category.application.use_cases.delete_category import (
+    DeleteCategories,
+    DeleteCategoriesInput,
     DeleteCategory,
     DeleteCategoryInput,
     DeleteCategoryOutput,
@@ -24,3 +28,20 @@ class TestDeleteCategory:
         assert repository.get_by_id(category_filme.id) is None
         assert len(repository.categories) == 1
         assert response == DeleteCategoryOutput(detail="Category deleted successfully.")
+
+
+class TestDeleteCategories:
+    def test_deletes_existing_categories_and_reports_missing_ids(self):
+        movie = Category(name="Movie")
+        series = Category(name="Series")
+        documentary = Category(name="Documentary")
+        repository = InMemoryCategoryRepository([movie, series, documentary])
+        missing_id = uuid.uuid4()
+
+        output = DeleteCategories(repository).execute(
+            DeleteCategoriesInput(ids={movie.id, series.id, missing_id})
+        )
+
+        assert output.deleted_ids == {movie.id, series.id}
+        assert output.missing_ids == {missing_id}
+        assert repository.categories == [documentary]
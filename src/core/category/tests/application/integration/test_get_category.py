@@ -31,6 +31,7 @@ class TestGetCategory:
             name="Filme",
             description="Categoria para filmes",
             is_active=True,
+            version=1,
         )
 
     def test_when_category_does_not_exist_then_raise_exception(self):
@@ -1,6 +1,10 @@
+import pytest
+
+from src.core._shared.pagination import CursorMeta, InvalidCursorException
 from src.core.category.application.use_cases.list_category import (
     CategoryOutput,
     ListCategory,
+    ListCategoryWithCursor,
     Meta,
 )
 from src.core.category.domain.category import Category
@@ -64,3 +68,72 @@ class TestListCategory:
                     total_pages=1,
                 ),
             )
+
+
+class TestListCategoryWithCursor:
+    def test_walks_all_pages_following_next_cursor(self):
+        category_filme = Category(name="Filme")
+        category_serie = Category(name="Série")
+        category_anime = Category(name="Anime")
+        repository = InMemoryCategoryRepository(
+            categories=[category_filme, category_serie, category_anime]
+        )
+        use_case = ListCategoryWithCursor(repository)
+
+        first_page = use_case.execute(ListCategoryWithCursor.Input())
+        assert [category.id for category in first_page.data] == [
+            category_anime.id,
+            category_filme.id,
+        ]
+        assert first_page.meta.next_cursor is not None
+
+        second_page = use_case.execute(
+            ListCategoryWithCursor.Input(cursor=first_page.meta.next_cursor)
+        )
+        assert second_page == ListCategoryWithCursor.Output(
+            data=[
+                CategoryOutput(
+                    id=category_serie.id,
+                    name=category_serie.name,
+                    description=category_serie.description,
+                    is_active=category_serie.is_active,
+                )
+            ],
+            meta=CursorMeta(page_size=2, next_cursor=None),
+        )
+
+    def test_breaks_ties_on_order_by_value_with_id(self):
+        categories = [Category(name="Filme") for _ in range(3)]
+        repository = InMemoryCategoryRepository(categories=list(categories))
+        use_case = ListCategoryWithCursor(repository)
+
+        first_page = use_case.execute(ListCategoryWithCursor.Input(page_size=2))
+        second_page = use_case.execute(
+            ListCategoryWithCursor.Input(
+                page_size=2, cursor=first_page.meta.next_cursor
+            )
+        )
+        listed_ids = [category.id for category in first_page.data + second_page.data]
+        assert listed_ids == sorted(category.id for category in categories)
+
+    def test_when_cursor_is_malformed_then_raise_invalid_cursor(self):
+        use_case = ListCategoryWithCursor(InMemoryCategoryRepository())
+        with pytest.raises(InvalidCursorException):
+            use_case.execute(ListCategoryWithCursor.Input(cursor="not-a-cursor"))
+
+    def test_when_cursor_was_issued_for_another_order_then_raise_invalid_cursor(
+        self,
+    ):
+        repository = InMemoryCategoryRepository(
+            categories=[Category(name="Filme"), Category(name="Série")]
+        )
+        use_case = ListCategoryWithCursor(repository)
+        page = use_case.execute(ListCategoryWithCursor.Input(page_size=1))
+        with pytest.raises(InvalidCursorException):
+            use_case.execute(
+                ListCategoryWithCursor.Input(
+                    order_by="description",
+                    page_size=1,
+                    cursor=page.meta.next_cursor,
+                )
+            )
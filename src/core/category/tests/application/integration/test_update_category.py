@@ -1,4 +1,8 @@
+import uuid
+
 from src.core.category.application.use_cases.update_category import (
+    UpdateCategories,
+    UpdateCategoriesInput,
     UpdateCategory,
     UpdateCategoryInput,
     UpdateCategoryOutput,
@@ -27,9 +31,28 @@ class TestUpdateCategory:
             name="Category 1 Updated",
             description="Description 1 Updated",
             is_active=category.is_active,
+            version=2,
         )
         updated_category = repository.get_by_id(category.id)
         if updated_category:
             assert updated_category.id == category.id
             assert updated_category.name == "Category 1 Updated"
             assert updated_category.description == "Description 1 Updated"
+
+
+class TestUpdateCategories:
+    def test_deactivates_existing_categories_and_reports_missing_ids(self):
+        movie = Category(name="Movie")
+        series = Category(name="Series")
+        repository = InMemoryCategoryRepository([movie, series])
+        missing_id = uuid.uuid4()
+
+        output = UpdateCategories(repository).execute(
+            UpdateCategoriesInput(ids={movie.id, missing_id}, is_active=False)
+        )
+
+        assert output.updated_ids == {movie.id}
+        assert output.missing_ids == {missing_id}
+        assert repository.get_by_id(movie.id).is_active is False
+        assert repository.get_by_id(movie.id).version == 2
+        assert repository.get_by_id(series.id).is_active is True
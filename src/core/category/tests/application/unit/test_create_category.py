@@ -4,8 +4,16 @@ from uuid import UUID
 
 import pytest
 
-from src.core.category.application.use_cases.create_category import CreateCategory, CreateCategoryInput
-from src.core.category.application.use_cases.exceptions import InvalidCategoryDataException
+from src.core.category.application.use_cases.create_category import (
+    CreateCategories,
+    CreateCategoriesInput,
+    CreateCategory,
+    CreateCategoryInput,
+)
+from src.core.category.application.use_cases.exceptions import (
+    InvalidCategoriesDataException,
+    InvalidCategoryDataException,
+)
 from src.core.category.domain.category import Category
 from src.core.category.domain.category_repository import CategoryRepository
 
@@ -43,3 +51,44 @@ class TestCreateCategory:
             )
             use_case.execute(request)
             assert repository.save.called
+
+
+class TestCreateCategories:
+    def test_saves_all_categories_in_one_call(self):
+        repository = create_autospec(CategoryRepository)
+        repository.save_many.side_effect = lambda categories: categories
+        use_case = CreateCategories(repository)
+
+        output = use_case.execute(
+            CreateCategoriesInput(
+                items=[
+                    CreateCategoryInput(name="Filme"),
+                    CreateCategoryInput(name="Serie", is_active=False),
+                ]
+            )
+        )
+
+        saved_categories = repository.save_many.call_args[0][0]
+        assert [category.name for category in saved_categories] == ["Filme", "Serie"]
+        assert [category.id for category in output.data] == [
+            category.id for category in saved_categories
+        ]
+        assert output.data[1].is_active is False
+
+    def test_reports_invalid_items_by_position_and_saves_nothing(self):
+        repository = create_autospec(CategoryRepository)
+        use_case = CreateCategories(repository)
+
+        with pytest.raises(InvalidCategoriesDataException) as exc_info:
+            use_case.execute(
+                CreateCategoriesInput(
+                    items=[
+                        CreateCategoryInput(name="Filme"),
+                        CreateCategoryInput(name=""),
+                        CreateCategoryInput(name="a" * 256),
+                    ]
+                )
+            )
+
+        assert set(exc_info.value.errors) == {1, 2}
+        repository.save_many.assert_not_called()
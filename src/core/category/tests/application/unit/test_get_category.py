@@ -1,8 +1,16 @@
+import asyncio
+import uuid
 from unittest.mock import create_autospec
 
+import pytest
+
+from src.core.category.application.use_cases.exceptions import CategoryNotFoundException
 from src.core.category.application.use_cases.get_category import GetCategory, GetCategoryInput, GetCategoryResponse
 from src.core.category.domain.category import Category
-from src.core.category.domain.category_repository import CategoryRepository
+from src.core.category.domain.category_repository import (
+    AsyncCategoryRepository,
+    CategoryRepository,
+)
 
 
 class TestGetCategory:
@@ -22,4 +30,30 @@ class TestGetCategory:
             name="Filme",
             description="Categoria para filmes",
             is_active=True,
+            version=1,
+        )
+
+    def test_aexecute_returns_found_category(self):
+        category = Category(name="Filme", description="Categoria para filmes")
+        repository = create_autospec(AsyncCategoryRepository)
+        repository.aget_by_id.return_value = category
+        use_case = GetCategory(repository)
+
+        response = asyncio.run(use_case.aexecute(GetCategoryInput(id=category.id)))
+
+        assert response == GetCategoryResponse(
+            id=category.id,
+            name="Filme",
+            description="Categoria para filmes",
+            is_active=True,
+            version=1,
         )
+        repository.aget_by_id.assert_awaited_once_with(category.id)
+
+    def test_aexecute_raises_when_category_does_not_exist(self):
+        repository = create_autospec(AsyncCategoryRepository)
+        repository.aget_by_id.return_value = None
+        use_case = GetCategory(repository)
+
+        with pytest.raises(CategoryNotFoundException):
+            asyncio.run(use_case.aexecute(GetCategoryInput(id=uuid.uuid4())))
@@ -1,19 +1,24 @@
+import asyncio
 import uuid
 from unittest.mock import create_autospec
 
+from src.core._shared.pagination import Page
 from src.core.category.application.use_cases.list_category import (
     CategoryOutput,
     ListCategory,
     Meta,
 )
 from src.core.category.domain.category import Category
-from src.core.category.domain.category_repository import CategoryRepository
+from src.core.category.domain.category_repository import (
+    AsyncCategoryRepository,
+    CategoryRepository,
+)
 
 
 class TestListCategory:
     def test_when_no_categories_in_database_return_empty_list(self):
         repository = create_autospec(CategoryRepository)
-        repository.list.return_value = []
+        repository.list_page.return_value = Page(items=[], total_items=0)
         use_case = ListCategory(repository)
         request = ListCategory.Input()
         response = use_case.execute(request)
@@ -39,7 +44,10 @@ class TestListCategory:
             description="Categoria de séries",
         )
         repository = create_autospec(CategoryRepository)
-        repository.list.return_value = [category_filme, category_serie]
+        repository.list_page.return_value = Page(
+            items=[category_filme, category_serie],
+            total_items=2,
+        )
         use_case = ListCategory(repository)
         request = ListCategory.Input()
         response = use_case.execute(request)
@@ -68,3 +76,51 @@ class TestListCategory:
         if response:
             assert response == expected_response
             assert len(response.data) == 2
+
+    def test_requests_only_the_current_page_from_repository(self):
+        category_documentario = Category(name="Documentário")
+        repository = create_autospec(CategoryRepository)
+        repository.list_page.return_value = Page(
+            items=[category_documentario],
+            total_items=5,
+        )
+        use_case = ListCategory(repository)
+        request = ListCategory.Input(order_by="name", current_page=3)
+        response = use_case.execute(request)
+        repository.list_page.assert_called_once_with(
+            order_by="name",
+            offset=4,
+            limit=2,
+        )
+        repository.list.assert_not_called()
+        assert response.meta == Meta(
+            current_page=3,
+            page_size=2,
+            total_items=5,
+            total_pages=3,
+        )
+
+    def test_aexecute_reads_the_page_asynchronously(self):
+        category = Category(name="Filme", description="Categoria de filmes")
+        repository = create_autospec(AsyncCategoryRepository)
+        repository.alist_page.return_value = Page(items=[category], total_items=3)
+        use_case = ListCategory(repository)
+
+        response = asyncio.run(
+            use_case.aexecute(ListCategory.Input(current_page=2, page_size=1))
+        )
+
+        assert response == ListCategory.Output(
+            data=[
+                CategoryOutput(
+                    id=category.id,
+                    name="Filme",
+                    description="Categoria de filmes",
+                    is_active=True,
+                )
+            ],
+            meta=Meta(current_page=2, page_size=1, total_items=3, total_pages=3),
+        )
+        repository.alist_page.assert_awaited_once_with(
+            order_by="name", offset=1, limit=1
+        )
@@ -3,7 +3,10 @@ from unittest.mock import create_autospec
 
 import pytest
 
-from src.core.category.application.use_cases.exceptions import CategoryNotFoundException
+from src.core.category.application.use_cases.exceptions import (
+    CategoryNotFoundException,
+    CategoryVersionConflictException,
+)
 from src.core.category.application.use_cases.update_category import (
     UpdateCategory,
     UpdateCategoryInput,
@@ -32,6 +35,7 @@ class TestUpdateCategory:
             name="Filme updated",
             description=category.description,
             is_active=category.is_active,
+            version=1,
         )
         response = use_case.execute(request)
         assert response == UpdateCategoryOutput(
@@ -39,6 +43,7 @@ class TestUpdateCategory:
             name="Filme updated",
             description=category.description,
             is_active=category.is_active,
+            version=1,
         )
         repository.update.assert_called_once_with(category)
 
@@ -60,6 +65,7 @@ class TestUpdateCategory:
             name=category.name,
             description="Categoria de filmes updated",
             is_active=category.is_active,
+            version=1,
         )
         response = use_case.execute(request)
         assert response == UpdateCategoryOutput(
@@ -67,6 +73,7 @@ class TestUpdateCategory:
             name=category.name,
             description="Categoria de filmes updated",
             is_active=category.is_active,
+            version=1,
         )
         repository.update.assert_called_once_with(category)
 
@@ -88,6 +95,7 @@ class TestUpdateCategory:
             name=category.name,
             description=category.description,
             is_active=True,
+            version=1,
         )
         response = use_case.execute(request)
         assert response == UpdateCategoryOutput(
@@ -95,6 +103,7 @@ class TestUpdateCategory:
             name=category.name,
             description=category.description,
             is_active=True,
+            version=1,
         )
         repository.update.assert_called_once_with(category)
 
@@ -116,6 +125,7 @@ class TestUpdateCategory:
             name=category.name,
             description=category.description,
             is_active=False,
+            version=1,
         )
         response = use_case.execute(request)
         assert response == UpdateCategoryOutput(
@@ -123,6 +133,7 @@ class TestUpdateCategory:
             name=category.name,
             description=category.description,
             is_active=False,
+            version=1,
         )
         repository.update.assert_called_once_with(category)
 
@@ -139,3 +150,29 @@ class TestUpdateCategory:
             match=f"Can not update category with id: {request.id}. Category not found.",
         ):
             use_case.execute(request)
+
+    def test_update_category_raise_exception_when_version_does_not_match(self):
+        category = Category(name="Filme", version=2)
+        repository = create_autospec(CategoryRepository)
+        repository.get_by_id.return_value = category
+        use_case = UpdateCategory(repository)
+        request = UpdateCategoryInput(id=category.id, name="Filme updated", version=1)
+        with pytest.raises(
+            CategoryVersionConflictException,
+            match="Expected version 1, found 2.",
+        ):
+            use_case.execute(request)
+        repository.update.assert_not_called()
+
+    def test_update_category_raise_exception_when_repository_update_loses_race(self):
+        category = Category(name="Filme")
+        repository = create_autospec(CategoryRepository)
+        repository.get_by_id.return_value = category
+        repository.update.return_value = None
+        use_case = UpdateCategory(repository)
+        request = UpdateCategoryInput(id=category.id, name="Filme updated")
+        with pytest.raises(
+            CategoryVersionConflictException,
+            match="Category was modified concurrently.",
+        ):
+            use_case.execute(request)
@@ -174,3 +174,39 @@ class TestEquality:
         category_1 = Category("Filme", id=common_id)
         category_2 = Category("Séries", id=common_id)
         assert category_1 == category_2
+
+
+class TestCategoryReconstitution:
+    def test_reconstitute_does_not_validate(self):
+        with patch.object(Category, "_validate") as mock_validate:
+            category = Category.reconstitute(id=uuid.uuid4(), name="Filme")
+        mock_validate.assert_not_called()
+        assert category.name == "Filme"
+        assert category.description == ""
+        assert category.is_active is True
+        assert category.version == 1
+
+    def test_reconstitute_allocates_notification_lazily(self):
+        category = Category.reconstitute(name="Filme")
+        assert category._notification is None
+        assert category.notification.has_errors is False
+        assert category._notification is not None
+
+    def test_reconstituted_category_is_equal_to_validated_one(self):
+        category = Category(name="Filme", description="Filmes")
+        assert (
+            Category.reconstitute(id=category.id, name="Filme", description="Filmes")
+            == category
+        )
+
+    def test_reconstitute_requires_fields_without_defaults(self):
+        with pytest.raises(TypeError, match="'name'"):
+            Category.reconstitute(id=uuid.uuid4())
+
+
+class TestCategoryMemoryLayout:
+    def test_category_has_no_instance_dict(self):
+        assert not hasattr(Category(name="Filme"), "__dict__")
+
+    def test_valid_category_does_not_allocate_notification(self):
+        assert Category(name="Filme")._notification is None
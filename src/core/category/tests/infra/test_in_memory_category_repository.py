@@ -1,3 +1,4 @@
+from src.core._shared.pagination import Cursor
 from src.core.category.domain.category import Category
 from src.core.category.infra.in_memory_category_repository import (
     InMemoryCategoryRepository,
@@ -42,3 +43,75 @@ class TestDeleteCategory:
         repository.delete(category_filme.id)
         assert repository.get_by_id(category_filme.id) is None
         assert len(repository.categories) == 1
+
+
+class TestListCategoryPage:
+    def test_returns_requested_page_ordered_by_field(self):
+        category_filme = Category(name="Filme")
+        category_serie = Category(name="Serie")
+        category_anime = Category(name="Anime")
+        repository = InMemoryCategoryRepository(
+            categories=[category_filme, category_serie, category_anime]
+        )
+        first_page = repository.list_page(order_by="name", offset=0, limit=2)
+        second_page = repository.list_page(order_by="name", offset=2, limit=2)
+        assert first_page.items == [category_anime, category_filme]
+        assert first_page.total_items == 3
+        assert second_page.items == [category_serie]
+        assert second_page.total_items == 3
+
+    def test_returns_empty_page_when_offset_is_past_the_end(self):
+        repository = InMemoryCategoryRepository(categories=[Category(name="Filme")])
+        page = repository.list_page(order_by="name", offset=2, limit=2)
+        assert page.items == []
+        assert page.total_items == 1
+
+    def test_falls_back_to_scanning_when_field_is_not_indexed(self):
+        category_filme = Category(name="Filme", description="b")
+        category_serie = Category(name="Serie", description="a")
+        repository = InMemoryCategoryRepository(
+            categories=[category_filme, category_serie]
+        )
+        page = repository.list_page(order_by="description", offset=0, limit=2)
+        assert page.items == [category_serie, category_filme]
+
+
+class TestUpdateCategory:
+    def test_update_moves_category_in_name_order(self):
+        category_filme = Category(name="Filme")
+        category_serie = Category(name="Serie")
+        repository = InMemoryCategoryRepository(
+            categories=[category_filme, category_serie]
+        )
+        category_filme.update_category(name="Zumbi", description="")
+        repository.update(category_filme)
+        page = repository.list_page(order_by="name", offset=0, limit=2)
+        assert page.items == [category_serie, category_filme]
+        assert repository.get_by_id(category_filme.id).version == 2
+
+    def test_update_returns_none_when_category_does_not_exist(self):
+        repository = InMemoryCategoryRepository()
+        assert repository.update(Category(name="Filme")) is None
+
+
+class TestListCategoriesAfterCursor:
+    def test_returns_categories_after_cursor_in_name_order(self):
+        categories = [Category(name=name) for name in ["Serie", "Anime", "Filme"]]
+        repository = InMemoryCategoryRepository(categories=categories)
+        anime, filme = repository.list_after(order_by="name", cursor=None, limit=2)
+        assert [anime.name, filme.name] == ["Anime", "Filme"]
+        remaining = repository.list_after(
+            order_by="name", cursor=Cursor(value=filme.name, id=filme.id), limit=2
+        )
+        assert [category.name for category in remaining] == ["Serie"]
+
+    def test_deleted_categories_are_not_listed(self):
+        category_filme = Category(name="Filme")
+        category_serie = Category(name="Serie")
+        repository = InMemoryCategoryRepository(
+            categories=[category_filme, category_serie]
+        )
+        repository.delete(category_filme.id)
+        assert repository.list_after(order_by="name", cursor=None, limit=2) == [
+            category_serie
+        ]
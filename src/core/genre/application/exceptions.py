@@ -5,3 +5,12 @@ class InvalidGenreDataException(Exception): ...
 
 
 class GenreNotFoundException(Exception): ...
+
+
+class GenreVersionConflictException(Exception): ...
+
+
+class InvalidGenresDataException(InvalidGenreDataException):
+    def __init__(self, errors: dict[int, str]):
+        super().__init__(f"Invalid genres at positions {sorted(errors)}.")
+        self.errors = errors
@@ -3,6 +3,7 @@ from uuid import UUID
 
 from src.core.genre.application.exceptions import (
     InvalidGenreDataException,
+    InvalidGenresDataException,
     RelatedCategoriesNotFoundException,
 )
 from src.core.genre.domain.genre import Genre
@@ -27,10 +28,12 @@ class CreateGenre:
         self.category_repository = category_repository
 
     def execute(self, input: Input) -> Output:
-        category_ids = {category.id for category in self.category_repository.list()}
-        if not input.category_ids.issubset(category_ids):
+        missing_category_ids = input.category_ids - (
+            self.category_repository.find_existing_ids(input.category_ids)
+        )
+        if missing_category_ids:
             raise RelatedCategoriesNotFoundException(
-                f"Related categories not found: {input.category_ids - category_ids}. Cannot create genre."
+                f"Related categories not found: {missing_category_ids}. Cannot create genre."
             )
         try:
             genre = Genre(
@@ -47,3 +50,53 @@ class CreateGenre:
             categories=genre.categories,
             is_active=genre.is_active,
         )
+
+
+class CreateGenres:
+    @dataclass
+    class Input:
+        items: list[CreateGenre.Input]
+
+    @dataclass
+    class Output:
+        data: list[CreateGenre.Output]
+
+    def __init__(self, genre_repository, category_repository):
+        self.genre_repository = genre_repository
+        self.category_repository = category_repository
+
+    def execute(self, input: Input) -> Output:
+        # One lookup covers the categories referenced by every item.
+        existing_category_ids = self.category_repository.find_existing_ids(
+            set().union(*(item.category_ids for item in input.items))
+        )
+        genres, errors = [], {}
+        for index, item in enumerate(input.items):
+            missing_category_ids = item.category_ids - existing_category_ids
+            if missing_category_ids:
+                errors[index] = f"Related categories not found: {missing_category_ids}."
+                continue
+            try:
+                genres.append(
+                    Genre(
+                        name=item.name,
+                        is_active=item.is_active,
+                        categories=set(item.category_ids),
+                    )
+                )
+            except ValueError as e:
+                errors[index] = str(e)
+        if errors:
+            raise InvalidGenresDataException(errors)
+        self.genre_repository.save_many(genres)
+        return self.Output(
+            data=[
+                CreateGenre.Output(
+                    id=genre.id,
+                    name=genre.name,
+                    categories=genre.categories,
+                    is_active=genre.is_active,
+                )
+                for genre in genres
+            ]
+        )
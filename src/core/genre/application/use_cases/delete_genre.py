@@ -25,3 +25,21 @@ class DeleteGenre:
             )
         self.repository.delete(genre.id)
         return self.Output(detail="Genre deleted successfully.")
+
+
+class DeleteGenres:
+    @dataclass
+    class Input:
+        ids: set[UUID]
+
+    @dataclass
+    class Output:
+        deleted_ids: set[UUID]
+        missing_ids: set[UUID]
+
+    def __init__(self, repository: GenreRepository):
+        self.repository = repository
+
+    def execute(self, input: Input) -> Output:
+        deleted_ids = self.repository.delete_many(input.ids)
+        return self.Output(deleted_ids=deleted_ids, missing_ids=input.ids - deleted_ids)
@@ -19,7 +19,12 @@ class GetGenre:
         self.repository = repository
 
     def execute(self, input: Input) -> Output:
-        genre = self.repository.get_by_id(input.id)
+        return self._output(input, self.repository.get_by_id(input.id))
+
+    async def aexecute(self, input: Input) -> Output:
+        return self._output(input, await self.repository.aget_by_id(input.id))
+
+    def _output(self, input: Input, genre: Genre | None) -> Output:
         if genre is None:
             raise GenreNotFoundException(f"Genre with id {input.id} not found.")
         return self.Output(data=genre)
@@ -1,9 +1,17 @@
 from dataclasses import dataclass
 from uuid import UUID
+
+from src.core._shared.pagination import (
+    Cursor,
+    CursorMeta,
+    decode_cursor,
+    encode_cursor,
+)
+from src.core.genre.domain.genre import Genre
 from src.core.genre.domain.genre_repository import GenreRepository
 
 
-@dataclass
+@dataclass(slots=True)
 class GenreData:
     id: UUID
     name: str
@@ -23,7 +31,12 @@ class ListGenre:
         self.genre_repository = repository
 
     def execute(self, input: Input) -> Output:
-        genres = self.genre_repository.list()
+        return self._output(self.genre_repository.list())
+
+    async def aexecute(self, input: Input) -> Output:
+        return self._output(await self.genre_repository.alist())
+
+    def _output(self, genres: list[Genre]) -> Output:
         return self.Output(
             data=[
                 GenreData(
@@ -35,3 +48,61 @@ class ListGenre:
                 for genre in genres
             ],
         )
+
+
+class ListGenreWithCursor:
+    @dataclass
+    class Input:
+        order_by: str = "name"
+        cursor: str | None = None
+        page_size: int = 2
+
+    @dataclass
+    class Output:
+        data: list[GenreData]
+        meta: CursorMeta
+
+    def __init__(self, repository: GenreRepository):
+        self.genre_repository = repository
+
+    def execute(self, input: Input) -> Output:
+        genres = self.genre_repository.list_after(
+            order_by=input.order_by,
+            cursor=self._cursor(input),
+            limit=input.page_size + 1,
+        )
+        return self._output(input, genres)
+
+    async def aexecute(self, input: Input) -> Output:
+        genres = await self.genre_repository.alist_after(
+            order_by=input.order_by,
+            cursor=self._cursor(input),
+            limit=input.page_size + 1,
+        )
+        return self._output(input, genres)
+
+    def _cursor(self, input: Input) -> Cursor | None:
+        return decode_cursor(input.cursor, input.order_by) if input.cursor else None
+
+    def _output(self, input: Input, genres: list[Genre]) -> Output:
+        genres_page = genres[: input.page_size]
+        has_next_page = len(genres) > input.page_size
+        return self.Output(
+            data=[
+                GenreData(
+                    id=genre.id,
+                    name=genre.name,
+                    is_active=genre.is_active,
+                    categories=genre.categories,
+                )
+                for genre in genres_page
+            ],
+            meta=CursorMeta(
+                page_size=input.page_size,
+                next_cursor=(
+                    encode_cursor(genres_page[-1], input.order_by)
+                    if has_next_page
+                    else None
+                ),
+            ),
+        )
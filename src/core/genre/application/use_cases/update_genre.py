@@ -5,6 +5,7 @@ from src.core.category.domain.category_repository import CategoryRepository
 from src.core.genre.domain.genre_repository import GenreRepository
 from src.core.genre.application.exceptions import (
     GenreNotFoundException,
+    GenreVersionConflictException,
     InvalidGenreDataException,
 )
 
@@ -16,6 +17,7 @@ class UpdateGenre:
         name: str = ""
         is_active: bool = True
         categories: set[UUID] | None = None
+        version: int | None = None
 
     @dataclass
     class Output:
@@ -23,6 +25,7 @@ class UpdateGenre:
         name: str
         is_active: bool
         categories: set[UUID]
+        version: int
 
     def __init__(
         self,
@@ -38,13 +41,19 @@ class UpdateGenre:
             raise GenreNotFoundException(
                 f"Can not update genre with id: {input.id}. Genre not found."
             )
-        if input.categories and not self._categories_exist(
-            self.category_repository,
-            input.categories,
-        ):
-            raise CategoryNotFoundException(
-                f"Cannot update genre, related categories not found."
+        if input.version is not None and input.version != genre.version:
+            raise GenreVersionConflictException(
+                f"Can not update genre with id: {input.id}. "
+                f"Expected version {input.version}, found {genre.version}."
             )
+        if input.categories:
+            missing_category_ids = input.categories - (
+                self.category_repository.find_existing_ids(input.categories)
+            )
+            if missing_category_ids:
+                raise CategoryNotFoundException(
+                    f"Cannot update genre, related categories not found: {missing_category_ids}."
+                )
         try:
             genre.change_name(input.name) if input.name else None
             if type(input.categories) == set:
@@ -55,15 +64,34 @@ class UpdateGenre:
             genre.activate() if input.is_active else genre.deactivate()
         except InvalidGenreDataException as error:
             raise InvalidGenreDataException(str(error))
-        self.repository.update(genre)
+        if self.repository.update(genre) is None:
+            raise GenreVersionConflictException(
+                f"Can not update genre with id: {input.id}. "
+                "Genre was modified concurrently."
+            )
         return UpdateGenre.Output(
             id=genre.id,
             name=genre.name,
             is_active=genre.is_active,
             categories=genre.categories,
+            version=genre.version,
         )
 
-    def _categories_exist(self, category_repository, categories: set[UUID]) -> bool:
-        return all(
-            category_repository.get_by_id(category_id) for category_id in categories
-        )
+
+class UpdateGenres:
+    @dataclass
+    class Input:
+        ids: set[UUID]
+        is_active: bool
+
+    @dataclass
+    class Output:
+        updated_ids: set[UUID]
+        missing_ids: set[UUID]
+
+    def __init__(self, repository: GenreRepository):
+        self.repository = repository
+
+    def execute(self, input: Input) -> Output:
+        updated_ids = self.repository.update_many(input.ids, input.is_active)
+        return self.Output(updated_ids=updated_ids, missing_ids=input.ids - updated_ids)
@@ -1,13 +1,18 @@
 from dataclasses import dataclass, field
+from datetime import datetime
 from uuid import UUID, uuid4
 
+from src.core._shared.reconstitution import Reconstitutable
 
-@dataclass
-class Genre:
+
+@dataclass(slots=True)
+class Genre(Reconstitutable):
     name: str
     is_active: bool = True
     id: UUID = field(default_factory=uuid4)
     categories: set[UUID] = field(default_factory=set)
+    version: int = 1
+    updated_at: datetime | None = None
 
     def __post_init__(self):
         self._validate()
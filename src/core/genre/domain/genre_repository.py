@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from uuid import UUID
 
+from src.core._shared.pagination import Cursor
 from src.core.genre.domain.genre import Genre
 
 
@@ -8,14 +10,33 @@ class GenreRepository(ABC):
     def save(self, genre) -> Genre:
         raise NotImplementedError
 
+    @abstractmethod
+    def save_many(self, genres: list[Genre]) -> list[Genre]:
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_id(self, id) -> Genre | None:
         raise NotImplementedError
 
+    @abstractmethod
+    def find_existing_ids(self, ids: set[UUID]) -> set[UUID]:
+        raise NotImplementedError
+
     @abstractmethod
     def delete(self, id) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        """Delete the given ids and return the ones that existed."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_after(
+        self, order_by: str, cursor: Cursor | None, limit: int
+    ) -> list[Genre]:
+        raise NotImplementedError
+
     @abstractmethod
     def list(self) -> list[Genre]:
         raise NotImplementedError
@@ -23,3 +44,26 @@ class GenreRepository(ABC):
     @abstractmethod
     def update(self, genre) -> Genre | None:
         raise NotImplementedError
+
+    @abstractmethod
+    def update_many(self, ids: set[UUID], is_active: bool) -> set[UUID]:
+        """Set `is_active` on the given ids and return the ones that existed."""
+        raise NotImplementedError
+
+
+class AsyncGenreRepository(ABC):
+    """Read side of `GenreRepository` for code running on an event loop."""
+
+    @abstractmethod
+    async def aget_by_id(self, id) -> Genre | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def alist_after(
+        self, order_by: str, cursor: Cursor | None, limit: int
+    ) -> list[Genre]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def alist(self) -> list[Genre]:
+        raise NotImplementedError
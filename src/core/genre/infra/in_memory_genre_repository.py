@@ -1,25 +1,72 @@
+from uuid import UUID
+
+from src.core._shared.pagination import Cursor, seek
+from src.core._shared.sorted_index import SortedIndex
 from src.core.genre.domain.genre import Genre
 from src.core.genre.domain.genre_repository import GenreRepository
 
 
 class InMemoryGenreRepository(GenreRepository):
-    def __init__(self, genres: list[Genre] | None = None):
-        self.genres = genres or []
+    def __init__(self, genres: list[Genre] | None = None, sorted_indexes=("name",)):
+        self._genres: dict[UUID, Genre] = {}
+        self._indexes = {field: SortedIndex(field) for field in sorted_indexes}
+        for genre in genres or []:
+            self.save(genre)
+
+    @property
+    def genres(self) -> list[Genre]:
+        return list(self._genres.values())
 
     def save(self, genre) -> Genre:
-        self.genres.append(genre)
+        self._genres[genre.id] = genre
+        for index in self._indexes.values():
+            index.add(genre)
         return genre
 
+    def save_many(self, genres: list[Genre]) -> list[Genre]:
+        return [self.save(genre) for genre in genres]
+
     def get_by_id(self, id) -> Genre | None:
-        return next((genre for genre in self.genres if genre.id == id), None)
+        return self._genres.get(id)
+
+    def find_existing_ids(self, ids) -> set:
+        return {id for id in ids if id in self._genres}
 
     def delete(self, id) -> None:
-        self.genres = [genre for genre in self.genres if genre.id != id]
+        self._genres.pop(id, None)
+        for index in self._indexes.values():
+            index.discard(id)
 
-    def update(self, genre) -> Genre:
-        self.genres.remove(genre)
-        self.genres.append(genre)
-        return genre
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        existing_ids = self.find_existing_ids(ids)
+        for id in existing_ids:
+            self.delete(id)
+        return existing_ids
+
+    def update(self, genre) -> Genre | None:
+        if genre.id not in self._genres:
+            return None
+        self.delete(genre.id)
+        genre.version += 1
+        return self.save(genre)
+
+    def update_many(self, ids: set[UUID], is_active: bool) -> set[UUID]:
+        existing_ids = self.find_existing_ids(ids)
+        for id in existing_ids:
+            genre = self._genres[id]
+            genre.is_active = is_active
+            self.update(genre)
+        return existing_ids
+
+    def list_after(
+        self, order_by: str, cursor: Cursor | None, limit: int
+    ) -> list[Genre]:
+        if order_by in self._indexes:
+            return [
+                self._genres[id]
+                for id in self._indexes[order_by].ids_after(cursor, limit)
+            ]
+        return seek(self._genres.values(), order_by, cursor, limit)
 
     def list(self) -> list[Genre]:
-        return [genre for genre in self.genres]
+        return [genre for genre in self._genres.values()]
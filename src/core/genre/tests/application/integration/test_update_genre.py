@@ -80,6 +80,7 @@ class TestUpdateGenre(CommonFixtures):
             name=genre_action.name,
             is_active=genre_action.is_active,
             categories=genre_action.categories,
+            version=2,
         )
 
     def test_raises_genre_not_found_exception(self, genre_repository):
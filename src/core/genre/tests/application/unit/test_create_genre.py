@@ -7,9 +7,10 @@ from src.core.category.domain.category import Category
 from src.core.category.domain.category_repository import CategoryRepository
 from src.core.genre.application.exceptions import (
     InvalidGenreDataException,
+    InvalidGenresDataException,
     RelatedCategoriesNotFoundException,
 )
-from src.core.genre.application.use_cases.create_genre import CreateGenre
+from src.core.genre.application.use_cases.create_genre import CreateGenre, CreateGenres
 from src.core.genre.domain.genre import Genre
 from src.core.genre.domain.genre_repository import GenreRepository
 
@@ -32,16 +33,16 @@ class CommonFixtures:
         self, movie_category, documentary_category
     ):
         repository = create_autospec(CategoryRepository)
-        repository.list.return_value = [
-            movie_category,
-            documentary_category,
-        ]
+        repository.find_existing_ids.return_value = {
+            movie_category.id,
+            documentary_category.id,
+        }
         return repository
 
     @pytest.fixture
     def mock_empty_category_repository(self):
         repository = create_autospec(CategoryRepository)
-        repository.list.return_value = []
+        repository.find_existing_ids.return_value = set()
         return repository
 
 
@@ -127,3 +128,61 @@ class TestCreateGenre(CommonFixtures):
         assert saved_genre.name == "Action"
         assert saved_genre.categories == set()
         assert saved_genre.is_active == True
+
+
+class TestCreateGenres(CommonFixtures):
+    def test_looks_up_categories_of_every_item_at_once_and_saves_in_bulk(
+        self,
+        mock_category_repository_with_categories,
+        mock_genre_repository,
+        movie_category,
+        documentary_category,
+    ):
+        use_case = CreateGenres(
+            genre_repository=mock_genre_repository,
+            category_repository=mock_category_repository_with_categories,
+        )
+        input = CreateGenres.Input(
+            items=[
+                CreateGenre.Input(name="Action", category_ids={movie_category.id}),
+                CreateGenre.Input(name="Drama", category_ids={documentary_category.id}),
+            ]
+        )
+
+        output = use_case.execute(input)
+
+        mock_category_repository_with_categories.find_existing_ids.assert_called_once_with(
+            {movie_category.id, documentary_category.id}
+        )
+        saved_genres = mock_genre_repository.save_many.call_args[0][0]
+        assert [genre.name for genre in saved_genres] == ["Action", "Drama"]
+        assert [genre.id for genre in output.data] == [
+            genre.id for genre in saved_genres
+        ]
+        mock_genre_repository.save.assert_not_called()
+
+    def test_reports_every_invalid_item_and_saves_nothing(
+        self,
+        mock_category_repository_with_categories,
+        mock_genre_repository,
+        movie_category,
+    ):
+        use_case = CreateGenres(
+            genre_repository=mock_genre_repository,
+            category_repository=mock_category_repository_with_categories,
+        )
+        missing_category_id = uuid.uuid4()
+        input = CreateGenres.Input(
+            items=[
+                CreateGenre.Input(name="Action", category_ids={movie_category.id}),
+                CreateGenre.Input(name="", category_ids=set()),
+                CreateGenre.Input(name="Drama", category_ids={missing_category_id}),
+            ]
+        )
+
+        with pytest.raises(InvalidGenresDataException) as exc_info:
+            use_case.execute(input)
+
+        assert set(exc_info.value.errors) == {1, 2}
+        assert str(missing_category_id) in exc_info.value.errors[2]
+        mock_genre_repository.save_many.assert_not_called()
@@ -3,10 +3,11 @@ from unittest.mock import create_autospec
 
 import pytest
 
+from src.core.category.application.use_cases.exceptions import CategoryNotFoundException
 from src.core.category.domain.category import Category
 from src.core.category.domain.category_repository import CategoryRepository
 from src.core.genre.application.exceptions import GenreNotFoundException
-from src.core.genre.application.use_cases.update_genre import UpdateGenre
+from src.core.genre.application.use_cases.update_genre import UpdateGenre, UpdateGenres
 from src.core.genre.domain.genre import Genre
 from src.core.genre.domain.genre_repository import GenreRepository
 
@@ -24,7 +25,7 @@ class CommonFixtures:
     @pytest.fixture
     def category_repository_with_categories(self, create_category, category_repository):
         category_movie = create_category("Movie")
-        category_repository.get_by_id.return_value = category_movie
+        category_repository.find_existing_ids.return_value = {category_movie.id}
         return category_repository, category_movie
 
     @pytest.fixture
@@ -62,6 +63,7 @@ class TestUpdateGenre(CommonFixtures):
             name=genre_action.name,
             is_active=genre_action.is_active,
             categories=genre_action.categories,
+            version=1,
         )
 
     def test_update_genre_that_exists_with_categories(
@@ -117,4 +119,43 @@ class TestUpdateGenre(CommonFixtures):
         output = use_case.execute(input)
         genre_repository.get_by_id.assert_called_once_with(genre_action.id)
         genre_repository.update.assert_called_once_with(genre_action)
+        category_repository.find_existing_ids.assert_called_once_with(
+            {category_movie.id}
+        )
+        category_repository.get_by_id.assert_not_called()
         assert output.categories == genre_action.categories
+
+    def test_when_categories_do_not_exist_then_raise_with_missing_ids(
+        self, category_repository_with_categories, genre_repository_with_genres
+    ):
+        genre_repository, genre_action = genre_repository_with_genres
+        category_repository, category_movie = category_repository_with_categories
+        use_case = UpdateGenre(
+            repository=genre_repository,
+            category_repository=category_repository,
+        )
+        missing_category_id = uuid.uuid4()
+        input = UpdateGenre.Input(
+            id=genre_action.id,
+            categories={category_movie.id, missing_category_id},
+        )
+        with pytest.raises(CategoryNotFoundException) as exc_info:
+            use_case.execute(input)
+        assert str(missing_category_id) in str(exc_info.value)
+        assert str(category_movie.id) not in str(exc_info.value)
+        genre_repository.update.assert_not_called()
+
+
+class TestUpdateGenres:
+    def test_updates_in_one_repository_call_and_reports_missing_ids(self):
+        repository = create_autospec(GenreRepository)
+        existing_id, missing_id = uuid.uuid4(), uuid.uuid4()
+        repository.update_many.return_value = {existing_id}
+
+        output = UpdateGenres(repository=repository).execute(
+            UpdateGenres.Input(ids={existing_id, missing_id}, is_active=False)
+        )
+
+        repository.update_many.assert_called_once_with({existing_id, missing_id}, False)
+        assert output.updated_ids == {existing_id}
+        assert output.missing_ids == {missing_id}
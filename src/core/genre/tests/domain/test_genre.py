@@ -119,3 +119,21 @@ class TestGenreCreation:
         genre.add_category(category_1)
         genre.add_category(category_2)
         assert genre.categories == {category_1, category_2}
+
+
+class TestGenreReconstitution:
+    def test_reconstitute_skips_validation(self):
+        genre = Genre.reconstitute(name="")
+        assert genre.name == ""
+        assert genre.categories == set()
+        assert genre.is_active is True
+
+    def test_reconstitute_keeps_given_attributes(self):
+        genre_id = uuid.uuid4()
+        category_id = uuid.uuid4()
+        genre = Genre.reconstitute(
+            id=genre_id, name="Action", categories={category_id}, version=3
+        )
+        assert genre == Genre(id=genre_id, name="Action")
+        assert genre.categories == {category_id}
+        assert genre.version == 3
@@ -1,3 +1,4 @@
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from decimal import Decimal
 from uuid import UUID
@@ -47,17 +48,22 @@ class CreateVideoWithoutMedia:
         category_repository: CategoryRepository,
         genre_repository: GenreRepository,
         cast_member_repository: CastMemberRepository,
+        executor: Executor | None = None,
     ) -> None:
+        """`executor`, when given, runs the three existence checks concurrently.
+
+        They are independent reads, so with a pool of at least three workers
+        the slowest one, not their sum, sets how long validation takes.
+        """
         self.repository = repository
         self.category_repository = category_repository
         self.genre_repository = genre_repository
         self.cast_member_repository = cast_member_repository
+        self.executor = executor
 
     def execute(self, input: Input) -> Output:
         notification = Notification()
-        self._validate_categories(input, notification)
-        self._validate_genres(input, notification)
-        self._validate_cast_members(input, notification)
+        self._validate_related_entities(input, notification)
         if notification.has_errors:
             raise RelatedEntitiesNotFoundException(notification.messages)
         try:
@@ -82,32 +88,47 @@ class CreateVideoWithoutMedia:
             duration=persisted_video.duration,
             published=persisted_video.published,
             rating=persisted_video.rating,
-            categories={category.id for category in persisted_video.categories.all()},
-            genres={genre.id for genre in persisted_video.genres.all()},
-            cast_members={
-                cast_member.id for cast_member in persisted_video.cast_members.all()
-            },
+            categories=persisted_video.categories,
+            genres=persisted_video.genres,
+            cast_members=persisted_video.cast_members,
         )
 
-    def _validate_categories(self, input: Input, notification: Notification):
-        category_ids = {category.id for category in self.category_repository.list()}
-        if not input.categories.issubset(category_ids):
-            notification.add_error(
-                f"Categories with the provided IDs not found {input.categories - category_ids}"
-            )
+    def _validate_related_entities(self, input: Input, notification: Notification):
+        checks = (
+            self._validate_categories,
+            self._validate_genres,
+            self._validate_cast_members,
+        )
+        if self.executor is None:
+            errors = [check(input) for check in checks]
+        else:
+            futures = [self.executor.submit(check, input) for check in checks]
+            errors = [future.result() for future in futures]
+        # Merged in a fixed order, whichever check finished first.
+        for error in errors:
+            if error is not None:
+                notification.add_error(error)
 
-    def _validate_genres(self, input: Input, notification: Notification):
-        genre_ids = {genre.id for genre in self.genre_repository.list()}
-        if not input.genres.issubset(genre_ids):
-            notification.add_error(
-                f"Genres with the provided IDs not found {input.genres - genre_ids}"
-            )
+    def _validate_categories(self, input: Input) -> str | None:
+        missing_category_ids = input.categories - (
+            self.category_repository.find_existing_ids(input.categories)
+        )
+        if missing_category_ids:
+            return f"Categories with the provided IDs not found {missing_category_ids}"
+        return None
 
-    def _validate_cast_members(self, input: Input, notification: Notification):
-        cast_member_ids = {
-            cast_member.id for cast_member in self.cast_member_repository.list()
-        }
-        if not input.cast_members.issubset(cast_member_ids):
-            notification.add_error(
-                f"Cast Members with the provided IDs not found {input.cast_members - cast_member_ids}"
-            )
+    def _validate_genres(self, input: Input) -> str | None:
+        missing_genre_ids = input.genres - (
+            self.genre_repository.find_existing_ids(input.genres)
+        )
+        if missing_genre_ids:
+            return f"Genres with the provided IDs not found {missing_genre_ids}"
+        return None
+
+    def _validate_cast_members(self, input: Input) -> str | None:
+        missing_cast_member_ids = input.cast_members - (
+            self.cast_member_repository.find_existing_ids(input.cast_members)
+        )
+        if missing_cast_member_ids:
+            return f"Cast Members with the provided IDs not found {missing_cast_member_ids}"
+        return None
@@ -2,3 +2,24 @@ class InvalidVideoDataException(Exception): ...
 
 
 class RelatedEntitiesNotFoundException(Exception): ...
+
+
+class VideoNotFoundException(Exception): ...
+
+
+class VideoVersionConflictException(Exception): ...
+
+
+class MediaUploadNotFoundException(Exception): ...
+
+
+class InvalidMediaUploadException(Exception): ...
+
+
+class InvalidChunkException(Exception): ...
+
+
+class UploadOffsetConflictException(Exception):
+    def __init__(self, message: str, offset: int):
+        super().__init__(message)
+        self.offset = offset
@@ -0,0 +1,108 @@
+import math
+from dataclasses import dataclass
+from decimal import Decimal
+from uuid import UUID
+
+from src.core._shared.pagination import Page
+from src.core.video.domain.value_objects import Rating
+from src.core.video.domain.video import Video
+from src.core.video.domain.video_repository import VideoFilter, VideoRepository
+
+
+@dataclass(slots=True)
+class VideoOutput:
+    id: UUID
+    title: str
+    description: str
+    launch_year: int
+    duration: Decimal
+    published: bool
+    rating: Rating
+    categories: set[UUID]
+    genres: set[UUID]
+    cast_members: set[UUID]
+
+
+@dataclass
+class Meta:
+    current_page: int
+    page_size: int
+    total_items: int
+    total_pages: int
+
+
+class ListVideos:
+    @dataclass
+    class Input:
+        order_by: str = "title"
+        current_page: int = 1
+        page_size: int = 2
+        category_id: UUID | None = None
+        genre_id: UUID | None = None
+        cast_member_id: UUID | None = None
+        published: bool | None = None
+        max_rating: Rating | None = None
+        min_launch_year: int | None = None
+        max_launch_year: int | None = None
+
+    @dataclass
+    class Output:
+        data: list[VideoOutput]
+        meta: Meta
+
+    def __init__(self, repository: VideoRepository):
+        self.repository = repository
+
+    def execute(self, input: Input) -> Output:
+        page = self.repository.list_page(
+            filter=self._filter(input),
+            order_by=input.order_by,
+            offset=(input.current_page - 1) * input.page_size,
+            limit=input.page_size,
+        )
+        return self._output(input, page)
+
+    async def aexecute(self, input: Input) -> Output:
+        page = await self.repository.alist_page(
+            filter=self._filter(input),
+            order_by=input.order_by,
+            offset=(input.current_page - 1) * input.page_size,
+            limit=input.page_size,
+        )
+        return self._output(input, page)
+
+    def _filter(self, input: Input) -> VideoFilter:
+        return VideoFilter(
+            category_id=input.category_id,
+            genre_id=input.genre_id,
+            cast_member_id=input.cast_member_id,
+            published=input.published,
+            max_rating=input.max_rating,
+            min_launch_year=input.min_launch_year,
+            max_launch_year=input.max_launch_year,
+        )
+
+    def _output(self, input: Input, page: Page[Video]) -> Output:
+        return self.Output(
+            data=[
+                VideoOutput(
+                    id=video.id,
+                    title=video.title,
+                    description=video.description,
+                    launch_year=video.launch_year,
+                    duration=video.duration,
+                    published=video.published,
+                    rating=video.rating,
+                    categories=video.categories,
+                    genres=video.genres,
+                    cast_members=video.cast_members,
+                )
+                for video in page.items
+            ],
+            meta=Meta(
+                current_page=input.current_page,
+                page_size=input.page_size,
+                total_items=page.total_items,
+                total_pages=math.ceil(page.total_items / input.page_size),
+            ),
+        )
@@ -0,0 +1,213 @@
+import hashlib
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from src.core.video.application.use_cases.exceptions import (
+    InvalidChunkException,
+    InvalidMediaUploadException,
+    MediaUploadNotFoundException,
+    UploadOffsetConflictException,
+    VideoNotFoundException,
+    VideoVersionConflictException,
+)
+from src.core.video.domain.media_storage import MediaStorage
+from src.core.video.domain.media_upload import MediaUpload
+from src.core.video.domain.media_upload_repository import MediaUploadRepository
+from src.core.video.domain.value_objects import MediaType
+from src.core.video.domain.video import Video
+from src.core.video.domain.video_repository import VideoRepository
+
+ATTACH_MEDIA = {
+    MediaType.BANNER: Video.update_banner,
+    MediaType.THUMBNAIL: Video.update_thumbnail,
+    MediaType.THUMBNAIL_HALF: Video.update_thumbnail_half,
+    MediaType.TRAILER: Video.update_trailer,
+    MediaType.VIDEO: Video.update_video,
+}
+
+
+class _ChunkHash:
+    """SHA-256 and length of a chunk, taken as its blocks stream past."""
+
+    def __init__(self) -> None:
+        self.sha256 = hashlib.sha256()
+        self.length = 0
+
+    def update(self, block: bytes) -> None:
+        self.sha256.update(block)
+        self.length += len(block)
+
+    def digest(self) -> bytes:
+        return self.sha256.digest()
+
+
+@dataclass
+class MediaUploadOutput:
+    id: UUID
+    video_id: UUID
+    media_type: MediaType
+    name: str
+    size: int
+    chunk_size: int
+    offset: int
+    check_sum: str
+
+
+def _output(media_upload: MediaUpload) -> MediaUploadOutput:
+    return MediaUploadOutput(
+        id=media_upload.id,
+        video_id=media_upload.video_id,
+        media_type=media_upload.media_type,
+        name=media_upload.name,
+        size=media_upload.size,
+        chunk_size=media_upload.chunk_size,
+        offset=media_upload.offset,
+        check_sum=media_upload.check_sum,
+    )
+
+
+def _get_media_upload(
+    repository: MediaUploadRepository, video_id: UUID, id: UUID
+) -> MediaUpload:
+    media_upload = repository.get_by_id(id)
+    if media_upload is None or media_upload.video_id != video_id:
+        raise MediaUploadNotFoundException(
+            f"Media upload with id {id} not found for video {video_id}"
+        )
+    return media_upload
+
+
+class StartMediaUpload:
+    @dataclass
+    class Input:
+        video_id: UUID
+        media_type: MediaType
+        name: str
+        size: int
+
+    def __init__(
+        self,
+        video_repository: VideoRepository,
+        media_upload_repository: MediaUploadRepository,
+        chunk_size: int,
+    ) -> None:
+        self.video_repository = video_repository
+        self.media_upload_repository = media_upload_repository
+        self.chunk_size = chunk_size
+
+    def execute(self, input: Input) -> MediaUploadOutput:
+        if self.video_repository.get_by_id(input.video_id) is None:
+            raise VideoNotFoundException(f"Video with id {input.video_id} not found")
+        try:
+            media_upload = MediaUpload(
+                video_id=input.video_id,
+                media_type=input.media_type,
+                name=input.name,
+                size=input.size,
+                chunk_size=self.chunk_size,
+            )
+        except ValueError as e:
+            raise InvalidMediaUploadException(str(e))
+        return _output(self.media_upload_repository.save(media_upload))
+
+
+class GetMediaUpload:
+    """Where an upload stands, so a client that lost its connection can resume."""
+
+    @dataclass
+    class Input:
+        video_id: UUID
+        id: UUID
+
+    def __init__(self, media_upload_repository: MediaUploadRepository) -> None:
+        self.media_upload_repository = media_upload_repository
+
+    def execute(self, input: Input) -> MediaUploadOutput:
+        return _output(
+            _get_media_upload(self.media_upload_repository, input.video_id, input.id)
+        )
+
+
+class UploadMediaChunk:
+    """Store the chunk starting at the upload's offset.
+
+    The chunk is streamed to storage block by block and hashed on the way.
+    Its offset must be the upload's current one; anything else, including a
+    retry of a chunk already recorded, is a conflict that reports the offset
+    to resume from. The chunk that completes the upload attaches the media to
+    its video.
+    """
+
+    @dataclass
+    class Input:
+        video_id: UUID
+        id: UUID
+        offset: int
+        content: Iterable[bytes] = field(repr=False)
+
+    def __init__(
+        self,
+        video_repository: VideoRepository,
+        media_upload_repository: MediaUploadRepository,
+        storage: MediaStorage,
+    ) -> None:
+        self.video_repository = video_repository
+        self.media_upload_repository = media_upload_repository
+        self.storage = storage
+
+    def execute(self, input: Input) -> MediaUploadOutput:
+        media_upload = _get_media_upload(
+            self.media_upload_repository, input.video_id, input.id
+        )
+        if input.offset != media_upload.offset or media_upload.is_complete:
+            raise UploadOffsetConflictException(
+                f"Upload {input.id} continues at offset {media_upload.offset}, "
+                f"not {input.offset}",
+                offset=media_upload.offset,
+            )
+        hasher = _ChunkHash()
+        self.storage.write(
+            media_upload.location,
+            media_upload.offset,
+            self._hashed(input.content, media_upload.next_chunk_size, hasher),
+        )
+        try:
+            media_upload.record_chunk(hasher.length, hasher.digest())
+        except ValueError as e:
+            raise InvalidChunkException(str(e))
+        if self.media_upload_repository.update(media_upload) is None:
+            current = _get_media_upload(
+                self.media_upload_repository, input.video_id, input.id
+            )
+            raise UploadOffsetConflictException(
+                f"Upload {input.id} received another chunk at offset {input.offset}",
+                offset=current.offset,
+            )
+        if media_upload.is_complete:
+            self._attach(media_upload)
+        return _output(media_upload)
+
+    @staticmethod
+    def _hashed(
+        content: Iterable[bytes], expected_length: int, hasher: _ChunkHash
+    ) -> Iterator[bytes]:
+        for block in content:
+            hasher.update(block)
+            if hasher.length > expected_length:
+                raise InvalidChunkException(
+                    f"Expected a chunk of {expected_length} bytes, got more"
+                )
+            yield block
+
+    def _attach(self, media_upload: MediaUpload) -> None:
+        video = self.video_repository.get_by_id(media_upload.video_id)
+        if video is None:
+            raise VideoNotFoundException(
+                f"Video with id {media_upload.video_id} not found"
+            )
+        ATTACH_MEDIA[media_upload.media_type](video, media_upload.to_media())
+        if self.video_repository.update(video) is None:
+            raise VideoVersionConflictException(
+                f"Video with id {video.id} was modified concurrently"
+            )
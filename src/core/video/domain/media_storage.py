@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+
+class MediaStorage(ABC):
+    @abstractmethod
+    def write(self, location: str, offset: int, content: Iterable[bytes]) -> None:
+        """Write `content` at `offset` of the file at `location`.
+
+        The blocks are written as they arrive, never gathered in memory.
+        Anything previously stored past the end of the write is discarded, so
+        a retried chunk replaces a partial one. When this returns, the data
+        is durable.
+        """
+        raise NotImplementedError
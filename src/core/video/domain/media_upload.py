@@ -0,0 +1,93 @@
+import hashlib
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core._shared.abstract_entity import AbstractEntity
+from src.core.video.domain.value_objects import (
+    AudioVideoMedia,
+    ImageMedia,
+    MediaStatus,
+    MediaType,
+)
+
+AUDIO_VIDEO_MEDIA_TYPES = {MediaType.TRAILER, MediaType.VIDEO}
+
+
+@dataclass(slots=True)
+class MediaUpload(AbstractEntity):
+    """A media file received in fixed-size chunks, in order, and resumable.
+
+    `offset` counts the bytes stored so far and is where the next chunk
+    starts; every chunk is `chunk_size` bytes except the last one.
+
+    `check_sum` chains the SHA-256 of each chunk into the previous value,
+    sha256(check_sum + sha256(chunk)), starting from an empty string. It is
+    computed while the chunk streams through and fits in one column, so an
+    upload resumes in any process without reading back what was stored. For a
+    given file it depends on `chunk_size`, which is fixed per upload.
+    """
+
+    video_id: UUID
+    media_type: MediaType
+    name: str
+    size: int
+    chunk_size: int
+    offset: int = 0
+    check_sum: str = ""
+
+    def __post_init__(self):
+        self._validate()
+        self._raise_if_invalid()
+
+    def _validate(self):
+        if not self.name:
+            self.notification.add_error("'name' cannot be empty")
+        if len(self.name) > 150:
+            self.notification.add_error("'name' cannot be longer than 150 characters.")
+        if "/" in self.name or "\\" in self.name or self.name in (".", ".."):
+            self.notification.add_error("'name' must be a file name, not a path")
+        if self.size <= 0:
+            self.notification.add_error("'size' must be greater than 0")
+        if self.chunk_size <= 0:
+            self.notification.add_error("'chunk_size' must be greater than 0")
+
+    @property
+    def location(self) -> str:
+        return f"videos/{self.video_id}/{self.id}/{self.name}"
+
+    @property
+    def is_complete(self) -> bool:
+        return self.offset == self.size
+
+    @property
+    def next_chunk_size(self) -> int:
+        return min(self.chunk_size, self.size - self.offset)
+
+    def record_chunk(self, length: int, digest: bytes) -> None:
+        """Account for the chunk stored at `offset`, `length` bytes hashing to `digest`."""
+        if self.is_complete:
+            raise ValueError("The upload is already complete")
+        if length != self.next_chunk_size:
+            raise ValueError(
+                f"Expected a chunk of {self.next_chunk_size} bytes, got {length}"
+            )
+        self.offset += length
+        self.check_sum = hashlib.sha256(
+            bytes.fromhex(self.check_sum) + digest
+        ).hexdigest()
+
+    def to_media(self) -> ImageMedia | AudioVideoMedia:
+        """The media a complete upload attaches to its video."""
+        if self.media_type in AUDIO_VIDEO_MEDIA_TYPES:
+            return AudioVideoMedia(
+                check_sum=self.check_sum,
+                name=self.name,
+                raw_location=self.location,
+                encoded_location="",
+                status=MediaStatus.PENDING,
+            )
+        return ImageMedia(
+            check_sum=self.check_sum,
+            name=self.name,
+            location=self.location,
+        )
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from src.core.video.domain.media_upload import MediaUpload
+
+
+class MediaUploadRepository(ABC):
+    @abstractmethod
+    def save(self, media_upload: MediaUpload) -> MediaUpload:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_by_id(self, id: UUID) -> MediaUpload | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(self, media_upload: MediaUpload) -> MediaUpload | None:
+        """Store the upload's progress, or return None if its version is stale."""
+        raise NotImplementedError
@@ -11,6 +11,15 @@ class MediaStatus(Enum):
     ERROR = auto()
 
 
+@unique
+class MediaType(Enum):
+    BANNER = auto()
+    THUMBNAIL = auto()
+    THUMBNAIL_HALF = auto()
+    TRAILER = auto()
+    VIDEO = auto()
+
+
 @unique
 class Rating(Enum):
     ER = auto()
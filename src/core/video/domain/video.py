@@ -6,7 +6,7 @@ from src.core._shared.abstract_entity import AbstractEntity
 from src.core.video.domain.value_objects import AudioVideoMedia, ImageMedia, Rating
 
 
-@dataclass
+@dataclass(slots=True)
 class Video(AbstractEntity):
     title: str
     description: str
@@ -25,8 +25,7 @@ class Video(AbstractEntity):
 
     def __post_init__(self):
         self._validate()
-        if self.notification.has_errors:
-            raise ValueError(self.notification.messages)
+        self._raise_if_invalid()
 
     def _validate(self):
         if not self.title:
@@ -50,8 +49,7 @@ class Video(AbstractEntity):
         self.published = published
         self.rating = rating
         self._validate()
-        if self.notification.has_errors:
-            raise ValueError(self.notification.messages)
+        self._raise_if_invalid()
         return self
 
     def add_category(self, category_id: UUID) -> None:
@@ -1,9 +1,32 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from uuid import UUID
 
+from src.core._shared.pagination import Page
+from src.core.video.domain.value_objects import Rating
 from src.core.video.domain.video import Video
 
 
+@dataclass(frozen=True)
+class VideoFilter:
+    """Criteria a listed video must meet; None leaves a criterion out."""
+
+    category_id: UUID | None = None
+    genre_id: UUID | None = None
+    cast_member_id: UUID | None = None
+    published: bool | None = None
+    max_rating: Rating | None = None
+    min_launch_year: int | None = None
+    max_launch_year: int | None = None
+
+    @property
+    def ratings(self) -> set[Rating] | None:
+        """Ratings at or below `max_rating`, in the order `Rating` declares."""
+        if self.max_rating is None:
+            return None
+        return {rating for rating in Rating if rating.value <= self.max_rating.value}
+
+
 class VideoRepository(ABC):
     @abstractmethod
     def save(self, video: Video) -> Video:
@@ -17,6 +40,12 @@ class VideoRepository(ABC):
     def delete(self, id: UUID) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def list_page(
+        self, filter: VideoFilter, order_by: str, offset: int, limit: int
+    ) -> Page[Video]:
+        raise NotImplementedError
+
     @abstractmethod
     def list(self) -> list[Video]:
         raise NotImplementedError
@@ -24,3 +53,13 @@ class VideoRepository(ABC):
     @abstractmethod
     def update(self, video: Video) -> Video | None:
         raise NotImplementedError
+
+
+class AsyncVideoRepository(ABC):
+    """Read side of `VideoRepository` for code running on an event loop."""
+
+    @abstractmethod
+    async def alist_page(
+        self, filter: VideoFilter, order_by: str, offset: int, limit: int
+    ) -> Page[Video]:
+        raise NotImplementedError
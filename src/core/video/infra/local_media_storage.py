@@ -0,0 +1,32 @@
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+from src.core.video.domain.media_storage import MediaStorage
+
+
+class LocalMediaStorage(MediaStorage):
+    """Media files under a directory of the local file system."""
+
+    def __init__(self, root: str | os.PathLike) -> None:
+        self.root = Path(root).resolve()
+
+    def write(self, location: str, offset: int, content: Iterable[bytes]) -> None:
+        path = self.path(location)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Opened for update rather than append: the caller's offset, not the
+        # file's current length, says where the chunk goes.
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        with os.fdopen(fd, "r+b") as file:
+            file.seek(offset)
+            for block in content:
+                file.write(block)
+            file.truncate()
+            file.flush()
+            os.fsync(file.fileno())
+
+    def path(self, location: str) -> Path:
+        path = (self.root / location).resolve()
+        if not path.is_relative_to(self.root):
+            raise ValueError(f"Location {location!r} is outside the storage root")
+        return path
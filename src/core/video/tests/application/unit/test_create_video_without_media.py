@@ -0,0 +1,223 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from unittest.mock import create_autospec
+import uuid
+
+import pytest
+
+from src.core.cast_member.domain.cast_member_repository import CastMemberRepository
+from src.core.category.domain.category_repository import CategoryRepository
+from src.core.genre.domain.genre_repository import GenreRepository
+from src.core.video.application.use_cases.create_video_without_media import (
+    CreateVideoWithoutMedia,
+)
+from src.core.video.application.use_cases.exceptions import (
+    RelatedEntitiesNotFoundException,
+)
+from src.core.video.domain.value_objects import Rating
+from src.core.video.domain.video_repository import VideoRepository
+
+
+class CommonFixtures:
+    @pytest.fixture
+    def category_id(self):
+        return uuid.uuid4()
+
+    @pytest.fixture
+    def genre_id(self):
+        return uuid.uuid4()
+
+    @pytest.fixture
+    def cast_member_id(self):
+        return uuid.uuid4()
+
+    @pytest.fixture
+    def input(self, category_id, genre_id, cast_member_id):
+        return CreateVideoWithoutMedia.Input(
+            title="Inception",
+            description="A thief who steals corporate secrets.",
+            launch_year=2010,
+            duration=Decimal("148.00"),
+            rating=Rating.AGE_14,
+            categories={category_id},
+            genres={genre_id},
+            cast_members={cast_member_id},
+        )
+
+    @pytest.fixture
+    def video_repository(self):
+        return create_autospec(VideoRepository)
+
+    @pytest.fixture
+    def category_repository(self):
+        return create_autospec(CategoryRepository)
+
+    @pytest.fixture
+    def genre_repository(self):
+        return create_autospec(GenreRepository)
+
+    @pytest.fixture
+    def cast_member_repository(self):
+        return create_autospec(CastMemberRepository)
+
+    @pytest.fixture
+    def use_case(
+        self,
+        video_repository,
+        category_repository,
+        genre_repository,
+        cast_member_repository,
+    ):
+        return CreateVideoWithoutMedia(
+            repository=video_repository,
+            category_repository=category_repository,
+            genre_repository=genre_repository,
+            cast_member_repository=cast_member_repository,
+        )
+
+
+class TestCreateVideoWithoutMedia(CommonFixtures):
+    def test_when_related_entities_do_not_exist_then_raise_with_missing_ids(
+        self,
+        use_case,
+        input,
+        video_repository,
+        category_repository,
+        genre_repository,
+        cast_member_repository,
+        category_id,
+        genre_id,
+        cast_member_id,
+    ):
+        category_repository.find_existing_ids.return_value = set()
+        genre_repository.find_existing_ids.return_value = set()
+        cast_member_repository.find_existing_ids.return_value = set()
+        with pytest.raises(RelatedEntitiesNotFoundException) as exc_info:
+            use_case.execute(input)
+        assert str(category_id) in str(exc_info.value)
+        assert str(genre_id) in str(exc_info.value)
+        assert str(cast_member_id) in str(exc_info.value)
+        video_repository.save.assert_not_called()
+
+    def test_checks_only_the_requested_ids_instead_of_listing_tables(
+        self,
+        use_case,
+        input,
+        category_repository,
+        genre_repository,
+        cast_member_repository,
+        genre_id,
+        cast_member_id,
+    ):
+        category_repository.find_existing_ids.return_value = set()
+        genre_repository.find_existing_ids.return_value = {genre_id}
+        cast_member_repository.find_existing_ids.return_value = {cast_member_id}
+        with pytest.raises(RelatedEntitiesNotFoundException) as exc_info:
+            use_case.execute(input)
+        assert "Categories" in str(exc_info.value)
+        assert "Genres" not in str(exc_info.value)
+        assert "Cast Members" not in str(exc_info.value)
+        category_repository.find_existing_ids.assert_called_once_with(input.categories)
+        genre_repository.find_existing_ids.assert_called_once_with(input.genres)
+        cast_member_repository.find_existing_ids.assert_called_once_with(
+            input.cast_members
+        )
+        category_repository.list.assert_not_called()
+        genre_repository.list.assert_not_called()
+        cast_member_repository.list.assert_not_called()
+
+    def test_returns_related_ids_of_the_persisted_video(
+        self,
+        use_case,
+        input,
+        video_repository,
+        category_repository,
+        genre_repository,
+        cast_member_repository,
+    ):
+        category_repository.find_existing_ids.return_value = input.categories
+        genre_repository.find_existing_ids.return_value = input.genres
+        cast_member_repository.find_existing_ids.return_value = input.cast_members
+        video_repository.save.side_effect = lambda video: video
+
+        output = use_case.execute(input)
+
+        assert output.categories == input.categories
+        assert output.genres == input.genres
+        assert output.cast_members == input.cast_members
+        assert output.rating == Rating.AGE_14
+
+
+class TestConcurrentValidation(CommonFixtures):
+    @pytest.fixture
+    def executor(self):
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            yield executor
+
+    @pytest.fixture
+    def use_case(
+        self,
+        video_repository,
+        category_repository,
+        genre_repository,
+        cast_member_repository,
+        executor,
+    ):
+        return CreateVideoWithoutMedia(
+            repository=video_repository,
+            category_repository=category_repository,
+            genre_repository=genre_repository,
+            cast_member_repository=cast_member_repository,
+            executor=executor,
+        )
+
+    def test_runs_the_three_checks_at_the_same_time(
+        self,
+        use_case,
+        input,
+        video_repository,
+        category_repository,
+        genre_repository,
+        cast_member_repository,
+    ):
+        # Each check waits for the other two: run one after another, they
+        # would break the barrier instead of passing it.
+        barrier = threading.Barrier(3, timeout=5)
+
+        def existing_ids(ids):
+            barrier.wait()
+            return ids
+
+        for repository in (
+            category_repository,
+            genre_repository,
+            cast_member_repository,
+        ):
+            repository.find_existing_ids.side_effect = existing_ids
+        video_repository.save.side_effect = lambda video: video
+
+        output = use_case.execute(input)
+
+        assert output.categories == input.categories
+
+    def test_merges_errors_in_a_fixed_order(
+        self,
+        use_case,
+        input,
+        video_repository,
+        category_repository,
+        genre_repository,
+        cast_member_repository,
+    ):
+        category_repository.find_existing_ids.return_value = set()
+        genre_repository.find_existing_ids.return_value = input.genres
+        cast_member_repository.find_existing_ids.return_value = set()
+
+        with pytest.raises(RelatedEntitiesNotFoundException) as exc_info:
+            use_case.execute(input)
+
+        message = str(exc_info.value)
+        assert message.index("Categories") < message.index("Cast Members")
+        assert "Genres" not in message
+        video_repository.save.assert_not_called()
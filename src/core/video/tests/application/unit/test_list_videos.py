@@ -0,0 +1,108 @@
+import asyncio
+import uuid
+from decimal import Decimal
+from unittest.mock import create_autospec
+
+from src.core._shared.pagination import Page
+from src.core.video.application.use_cases.list_videos import (
+    ListVideos,
+    Meta,
+    VideoOutput,
+)
+from src.core.video.domain.value_objects import Rating
+from src.core.video.domain.video import Video
+from src.core.video.domain.video_repository import (
+    AsyncVideoRepository,
+    VideoFilter,
+    VideoRepository,
+)
+
+
+def make_video(title: str) -> Video:
+    return Video(
+        title=title,
+        description="",
+        launch_year=2016,
+        duration=Decimal("90.00"),
+        rating=Rating.AGE_12,
+        categories={uuid.uuid4()},
+        genres=set(),
+        cast_members=set(),
+    )
+
+
+class TestVideoFilter:
+    def test_max_rating_includes_every_rating_at_or_below_it(self):
+        assert VideoFilter(max_rating=Rating.AGE_10).ratings == {
+            Rating.ER,
+            Rating.L,
+            Rating.AGE_10,
+        }
+
+    def test_no_max_rating_means_no_rating_criterion(self):
+        assert VideoFilter().ratings is None
+
+
+class TestListVideos:
+    def test_asks_the_repository_for_one_filtered_page(self):
+        video = make_video("Inception")
+        repository = create_autospec(VideoRepository)
+        repository.list_page.return_value = Page(items=[video], total_items=5)
+        category_id = uuid.uuid4()
+        use_case = ListVideos(repository)
+
+        output = use_case.execute(
+            ListVideos.Input(
+                current_page=3,
+                page_size=2,
+                category_id=category_id,
+                published=True,
+                max_rating=Rating.AGE_12,
+                min_launch_year=2015,
+            )
+        )
+
+        repository.list_page.assert_called_once_with(
+            filter=VideoFilter(
+                category_id=category_id,
+                published=True,
+                max_rating=Rating.AGE_12,
+                min_launch_year=2015,
+            ),
+            order_by="title",
+            offset=4,
+            limit=2,
+        )
+        repository.list.assert_not_called()
+        assert output == ListVideos.Output(
+            data=[
+                VideoOutput(
+                    id=video.id,
+                    title="Inception",
+                    description="",
+                    launch_year=2016,
+                    duration=Decimal("90.00"),
+                    published=False,
+                    rating=Rating.AGE_12,
+                    categories=video.categories,
+                    genres=set(),
+                    cast_members=set(),
+                )
+            ],
+            meta=Meta(current_page=3, page_size=2, total_items=5, total_pages=3),
+        )
+
+    def test_aexecute_reads_the_page_asynchronously(self):
+        repository = create_autospec(AsyncVideoRepository)
+        repository.alist_page.return_value = Page(items=[], total_items=0)
+        use_case = ListVideos(repository)
+
+        output = asyncio.run(use_case.aexecute(ListVideos.Input()))
+
+        assert output == ListVideos.Output(
+            data=[],
+            meta=Meta(current_page=1, page_size=2, total_items=0, total_pages=0),
+        )
+        repository.alist_page.assert_awaited_once_with(
+            filter=VideoFilter(), order_by="title", offset=0, limit=2
+        )
@@ -0,0 +1,208 @@
+import hashlib
+import uuid
+from decimal import Decimal
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.core.video.application.use_cases.exceptions import (
+    InvalidChunkException,
+    InvalidMediaUploadException,
+    MediaUploadNotFoundException,
+    UploadOffsetConflictException,
+    VideoNotFoundException,
+)
+from src.core.video.application.use_cases.upload_media import (
+    GetMediaUpload,
+    StartMediaUpload,
+    UploadMediaChunk,
+)
+from src.core.video.domain.media_storage import MediaStorage
+from src.core.video.domain.media_upload import MediaUpload
+from src.core.video.domain.media_upload_repository import MediaUploadRepository
+from src.core.video.domain.value_objects import MediaStatus, MediaType, Rating
+from src.core.video.domain.video import Video
+from src.core.video.domain.video_repository import VideoRepository
+
+
+class CommonFixtures:
+    @pytest.fixture
+    def video(self) -> Video:
+        return Video(
+            title="Inception",
+            description="",
+            launch_year=2010,
+            duration=Decimal("148.00"),
+            rating=Rating.AGE_14,
+            categories=set(),
+            genres=set(),
+            cast_members=set(),
+        )
+
+    @pytest.fixture
+    def video_repository(self, video):
+        repository = create_autospec(VideoRepository)
+        repository.get_by_id.return_value = video
+        repository.update.side_effect = lambda video: video
+        return repository
+
+    @pytest.fixture
+    def upload(self, video) -> MediaUpload:
+        return MediaUpload(
+            video_id=video.id,
+            media_type=MediaType.VIDEO,
+            name="master.mp4",
+            size=6,
+            chunk_size=4,
+        )
+
+    @pytest.fixture
+    def media_upload_repository(self, upload):
+        repository = create_autospec(MediaUploadRepository)
+        repository.get_by_id.return_value = upload
+        repository.save.side_effect = lambda upload: upload
+        repository.update.side_effect = lambda upload: upload
+        return repository
+
+    @pytest.fixture
+    def written(self) -> list[tuple[str, int, bytes]]:
+        return []
+
+    @pytest.fixture
+    def storage(self, written):
+        storage = create_autospec(MediaStorage)
+        storage.write.side_effect = lambda location, offset, content: written.append(
+            (location, offset, b"".join(content))
+        )
+        return storage
+
+    @pytest.fixture
+    def use_case(self, video_repository, media_upload_repository, storage):
+        return UploadMediaChunk(
+            video_repository=video_repository,
+            media_upload_repository=media_upload_repository,
+            storage=storage,
+        )
+
+
+class TestStartMediaUpload(CommonFixtures):
+    def test_creates_upload_with_configured_chunk_size(
+        self, video, video_repository, media_upload_repository
+    ):
+        use_case = StartMediaUpload(
+            video_repository=video_repository,
+            media_upload_repository=media_upload_repository,
+            chunk_size=4,
+        )
+
+        output = use_case.execute(
+            StartMediaUpload.Input(
+                video_id=video.id,
+                media_type=MediaType.TRAILER,
+                name="trailer.mp4",
+                size=10,
+            )
+        )
+
+        saved = media_upload_repository.save.call_args.args[0]
+        assert (output.id, output.chunk_size, output.offset) == (saved.id, 4, 0)
+        assert output.media_type == MediaType.TRAILER
+
+    def test_video_must_exist(self, video_repository, media_upload_repository):
+        video_repository.get_by_id.return_value = None
+        use_case = StartMediaUpload(video_repository, media_upload_repository, 4)
+
+        with pytest.raises(VideoNotFoundException):
+            use_case.execute(
+                StartMediaUpload.Input(uuid.uuid4(), MediaType.VIDEO, "a.mp4", 1)
+            )
+        media_upload_repository.save.assert_not_called()
+
+    def test_rejects_invalid_upload(
+        self, video, video_repository, media_upload_repository
+    ):
+        use_case = StartMediaUpload(video_repository, media_upload_repository, 4)
+
+        with pytest.raises(InvalidMediaUploadException, match="'name'"):
+            use_case.execute(
+                StartMediaUpload.Input(video.id, MediaType.VIDEO, "../a.mp4", 1)
+            )
+
+
+class TestGetMediaUpload(CommonFixtures):
+    def test_upload_of_another_video_is_not_found(
+        self, upload, media_upload_repository
+    ):
+        use_case = GetMediaUpload(media_upload_repository)
+
+        with pytest.raises(MediaUploadNotFoundException):
+            use_case.execute(GetMediaUpload.Input(video_id=uuid.uuid4(), id=upload.id))
+
+
+class TestUploadMediaChunk(CommonFixtures):
+    def test_streams_chunks_and_attaches_media_when_complete(
+        self, use_case, upload, video, video_repository, written
+    ):
+        output = use_case.execute(
+            UploadMediaChunk.Input(video.id, upload.id, 0, iter([b"ab", b"cd"]))
+        )
+
+        assert output.offset == 4
+        video_repository.update.assert_not_called()
+
+        output = use_case.execute(
+            UploadMediaChunk.Input(video.id, upload.id, 4, iter([b"ef"]))
+        )
+
+        assert written == [
+            (upload.location, 0, b"abcd"),
+            (upload.location, 4, b"ef"),
+        ]
+        assert output.offset == 6
+        assert video.video == upload.to_media()
+        assert video.video.status == MediaStatus.PENDING
+        assert (
+            video.video.check_sum
+            == hashlib.sha256(
+                hashlib.sha256(hashlib.sha256(b"abcd").digest()).digest()
+                + hashlib.sha256(b"ef").digest()
+            ).hexdigest()
+        )
+        video_repository.update.assert_called_once_with(video)
+
+    def test_chunk_at_another_offset_reports_where_to_resume(
+        self, use_case, upload, video, storage
+    ):
+        with pytest.raises(UploadOffsetConflictException) as error:
+            use_case.execute(UploadMediaChunk.Input(video.id, upload.id, 4, [b"ef"]))
+
+        assert error.value.offset == 0
+        storage.write.assert_not_called()
+
+    def test_rejects_chunk_longer_than_expected_while_streaming(
+        self, use_case, upload, video, media_upload_repository
+    ):
+        def content():
+            yield b"abc"
+            yield b"de"
+            pytest.fail("read past the end of the chunk")
+
+        with pytest.raises(InvalidChunkException):
+            use_case.execute(UploadMediaChunk.Input(video.id, upload.id, 0, content()))
+        media_upload_repository.update.assert_not_called()
+
+    def test_rejects_short_chunk(
+        self, use_case, upload, video, media_upload_repository
+    ):
+        with pytest.raises(InvalidChunkException, match="got 3"):
+            use_case.execute(UploadMediaChunk.Input(video.id, upload.id, 0, [b"abc"]))
+        media_upload_repository.update.assert_not_called()
+
+    def test_concurrent_chunk_is_a_conflict(
+        self, use_case, upload, video, media_upload_repository
+    ):
+        media_upload_repository.update.side_effect = None
+        media_upload_repository.update.return_value = None
+
+        with pytest.raises(UploadOffsetConflictException):
+            use_case.execute(UploadMediaChunk.Input(video.id, upload.id, 0, [b"abcd"]))
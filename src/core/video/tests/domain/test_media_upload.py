@@ -0,0 +1,101 @@
+import hashlib
+import uuid
+
+import pytest
+
+from src.core.video.domain.media_upload import MediaUpload
+from src.core.video.domain.value_objects import (
+    AudioVideoMedia,
+    ImageMedia,
+    MediaStatus,
+    MediaType,
+)
+
+
+def make_upload(**overrides) -> MediaUpload:
+    return MediaUpload(
+        **{
+            "video_id": uuid.uuid4(),
+            "media_type": MediaType.VIDEO,
+            "name": "master.mp4",
+            "size": 10,
+            "chunk_size": 4,
+            **overrides,
+        }
+    )
+
+
+def chained(*chunks: bytes) -> str:
+    check_sum = ""
+    for chunk in chunks:
+        check_sum = hashlib.sha256(
+            bytes.fromhex(check_sum) + hashlib.sha256(chunk).digest()
+        ).hexdigest()
+    return check_sum
+
+
+class TestCreateMediaUpload:
+    @pytest.mark.parametrize("name", ["", "../master.mp4", "a/b.mp4", ".."])
+    def test_name_must_be_a_file_name(self, name):
+        with pytest.raises(ValueError, match="'name'"):
+            make_upload(name=name)
+
+    def test_size_must_be_positive(self):
+        with pytest.raises(ValueError, match="'size' must be greater than 0"):
+            make_upload(size=0)
+
+    def test_starts_empty(self):
+        upload = make_upload()
+
+        assert upload.offset == 0
+        assert upload.next_chunk_size == 4
+        assert not upload.is_complete
+
+
+class TestRecordChunk:
+    def test_advances_offset_and_chains_check_sum(self):
+        upload = make_upload()
+        chunks = [b"abcd", b"efgh", b"ij"]
+
+        for chunk in chunks:
+            upload.record_chunk(len(chunk), hashlib.sha256(chunk).digest())
+
+        assert upload.offset == 10
+        assert upload.is_complete
+        assert upload.check_sum == chained(*chunks)
+
+    def test_rejects_chunk_of_the_wrong_length(self):
+        upload = make_upload()
+
+        with pytest.raises(ValueError, match="Expected a chunk of 4 bytes, got 3"):
+            upload.record_chunk(3, hashlib.sha256(b"abc").digest())
+        assert upload.offset == 0
+
+    def test_rejects_chunks_after_completion(self):
+        upload = make_upload(size=2)
+        upload.record_chunk(2, hashlib.sha256(b"ab").digest())
+
+        with pytest.raises(ValueError, match="already complete"):
+            upload.record_chunk(0, hashlib.sha256(b"").digest())
+
+
+class TestToMedia:
+    def test_audio_video_media_is_pending(self):
+        upload = make_upload(media_type=MediaType.TRAILER)
+
+        assert upload.to_media() == AudioVideoMedia(
+            check_sum=upload.check_sum,
+            name="master.mp4",
+            raw_location=f"videos/{upload.video_id}/{upload.id}/master.mp4",
+            encoded_location="",
+            status=MediaStatus.PENDING,
+        )
+
+    def test_images_are_image_media(self):
+        upload = make_upload(media_type=MediaType.BANNER, name="banner.png")
+
+        assert upload.to_media() == ImageMedia(
+            check_sum=upload.check_sum,
+            name="banner.png",
+            location=upload.location,
+        )
@@ -0,0 +1,28 @@
+import pytest
+
+from src.core.video.infra.local_media_storage import LocalMediaStorage
+
+
+class TestWrite:
+    def test_writes_blocks_at_offset(self, tmp_path):
+        storage = LocalMediaStorage(tmp_path)
+
+        storage.write("videos/1/master.mp4", 0, iter([b"ab", b"cd"]))
+        storage.write("videos/1/master.mp4", 4, iter([b"ef"]))
+
+        assert (tmp_path / "videos/1/master.mp4").read_bytes() == b"abcdef"
+
+    def test_rewrite_discards_what_followed_the_offset(self, tmp_path):
+        storage = LocalMediaStorage(tmp_path)
+        storage.write("master.mp4", 0, [b"abcd", b"partial"])
+
+        storage.write("master.mp4", 4, [b"ef"])
+
+        assert (tmp_path / "master.mp4").read_bytes() == b"abcdef"
+
+    def test_rejects_locations_outside_the_root(self, tmp_path):
+        storage = LocalMediaStorage(tmp_path / "media")
+
+        with pytest.raises(ValueError, match="outside the storage root"):
+            storage.write("../escaped.mp4", 0, [b"ab"])
+        assert not (tmp_path / "escaped.mp4").exists()
@@ -0,0 +1,42 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from rest_framework import viewsets
+
+
+class AsyncViewSet(viewsets.ViewSet):
+    """`ViewSet` whose `async def` actions run on the event loop.
+
+    DRF only calls handlers synchronously, so under ASGI every request would
+    hold a worker thread for as long as its queries take. Here the view
+    itself is a coroutine: `async def` actions are awaited directly, while
+    plain actions (and DRF's authentication, permission and throttling hooks)
+    run through `sync_to_async`, exactly as Django runs any sync view under
+    ASGI. Under WSGI Django drives the coroutine with `async_to_sync`.
+    """
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        return markcoroutinefunction(super().as_view(actions, **initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+            if not iscoroutinefunction(handler):
+                handler = sync_to_async(handler)
+            response = await handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
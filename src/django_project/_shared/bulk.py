@@ -0,0 +1,2 @@
+# Upper bound on items per bulk request, so one call stays one short transaction.
+BULK_MAX_ITEMS = 1_000
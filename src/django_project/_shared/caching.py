@@ -0,0 +1,261 @@
+import hashlib
+import time
+from dataclasses import dataclass
+from urllib.parse import urlencode
+from uuid import UUID
+
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import F, QuerySet
+from django.utils import timezone
+
+ENTITY_CACHE = "entities"
+RESPONSE_CACHE = "responses"
+
+# Known-missing ids are remembered briefly, as a cached None.
+NEGATIVE_TIMEOUT = 10
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.negative_hits + self.misses
+        return (self.hits + self.negative_hits) / lookups if lookups else 0.0
+
+
+_stats: dict[str, CacheStats] = {}
+
+
+def cache_stats() -> dict[str, CacheStats]:
+    """Hit/miss counters of this process, keyed by the wrapped repository."""
+    return _stats
+
+
+class CachingRepository:
+    """Read-through cache for `get_by_id` in front of any catalog repository.
+
+    Entities live in the `entities` cache, which bounds them with MAX_ENTRIES
+    (least recently used go first) and expires them after TIMEOUT. Ids the
+    repository does not know are cached as None for `negative_timeout`
+    seconds, so repeated 404s never reach the database. `aget_by_id` is the
+    same lookup for async callers. `save` and `update` evict the entity they
+    touch and `delete` marks it missing; every other method is delegated to
+    the wrapped repository untouched.
+
+    Inside a transaction, writes evict again once it commits: a read that
+    lands before the commit sees the old row and may cache it meanwhile.
+    A deleted id is only marked missing after the commit, so a rollback
+    never leaves a live entity cached as gone.
+    """
+
+    def __init__(
+        self,
+        repository,
+        cache_alias: str = ENTITY_CACHE,
+        negative_timeout: int = NEGATIVE_TIMEOUT,
+    ):
+        self.repository = repository
+        self.cache = caches[cache_alias]
+        self.negative_timeout = negative_timeout
+        self.namespace = type(repository).__name__
+        self.stats = _stats.setdefault(self.namespace, CacheStats())
+
+    def __getattr__(self, name):
+        return getattr(self.repository, name)
+
+    def get_by_id(self, id: UUID):
+        key = self._key(id)
+        entity = self.cache.get(key, _MISSING)
+        if entity is None:
+            self.stats.negative_hits += 1
+            return None
+        if entity is not _MISSING:
+            self.stats.hits += 1
+            return entity
+        self.stats.misses += 1
+        entity = self.repository.get_by_id(id)
+        if entity is None:
+            self.cache.set(key, None, self.negative_timeout)
+        else:
+            self.cache.set(key, entity)
+        return entity
+
+    async def aget_by_id(self, id: UUID):
+        key = self._key(id)
+        entity = await self.cache.aget(key, _MISSING)
+        if entity is None:
+            self.stats.negative_hits += 1
+            return None
+        if entity is not _MISSING:
+            self.stats.hits += 1
+            return entity
+        self.stats.misses += 1
+        entity = await self.repository.aget_by_id(id)
+        if entity is None:
+            await self.cache.aset(key, None, self.negative_timeout)
+        else:
+            await self.cache.aset(key, entity)
+        return entity
+
+    def save(self, entity):
+        saved_entity = self.repository.save(entity)
+        self._evict([entity.id])
+        return saved_entity
+
+    def save_many(self, entities):
+        saved_entities = self.repository.save_many(entities)
+        self._evict([entity.id for entity in entities])
+        return saved_entities
+
+    def update(self, entity):
+        # Evict even when the update lost a version race: the entry is stale.
+        updated_entity = self.repository.update(entity)
+        self._evict([entity.id])
+        return updated_entity
+
+    def update_many(self, ids: set[UUID], is_active: bool) -> set[UUID]:
+        updated_ids = self.repository.update_many(ids, is_active)
+        self._evict(ids)
+        return updated_ids
+
+    def delete(self, id: UUID) -> None:
+        self.repository.delete(id)
+        self._mark_missing([id])
+
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        deleted_ids = self.repository.delete_many(ids)
+        self._mark_missing(ids)
+        return deleted_ids
+
+    def _evict(self, ids) -> None:
+        evict_cached_entities(self.namespace, ids, cache=self.cache)
+
+    def _mark_missing(self, ids) -> None:
+        keys = [self._key(id) for id in ids]
+
+        def mark():
+            self.cache.set_many(dict.fromkeys(keys), self.negative_timeout)
+
+        if transaction.get_connection().in_atomic_block:
+            self.cache.delete_many(keys)
+            transaction.on_commit(mark)
+        else:
+            mark()
+
+    def _key(self, id: UUID) -> str:
+        return entity_cache_key(self.namespace, id)
+
+
+def entity_cache_key(namespace: str, id: UUID) -> str:
+    """Key of an entity cached by a `CachingRepository` named `namespace`."""
+    return f"{namespace}:{id}"
+
+
+def evict_cached_entities(
+    namespace: str, ids, cache_alias: str = ENTITY_CACHE, cache=None
+) -> None:
+    """Drop cached entities now and, inside a transaction, again on commit.
+
+    `namespace` is the name of the wrapped repository's class. Repositories
+    call this for rows they change behind another repository's back, such as
+    genres touched by a category delete.
+    """
+    if cache is None:
+        cache = caches[cache_alias]
+    keys = [entity_cache_key(namespace, id) for id in ids]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def touch_dependents(queryset: QuerySet, namespace: str) -> None:
+    """Mark the rows of `queryset` changed and drop their cached entities.
+
+    For rows whose representation changes through another entity's write,
+    like the genres of a deleted category: their version and updated_at go
+    up, so validators change, and a `CachingRepository` named `namespace`
+    stops serving them once the transaction commits.
+    """
+    ids = list(queryset.values_list("id", flat=True))
+    if not ids:
+        return
+    queryset.model.objects.filter(id__in=ids).update(
+        updated_at=timezone.now(), version=F("version") + 1
+    )
+    evict_cached_entities(namespace, ids)
+
+
+def normalized_query(params: dict) -> str:
+    return urlencode(sorted((name, str(value)) for name, value in params.items()))
+
+
+def list_generation(resource: str, cache_alias: str = RESPONSE_CACHE) -> int:
+    cache = caches[cache_alias]
+    key = f"generation:{resource}"
+    generation = cache.get(key)
+    if generation is None:
+        # Start from the clock, not 1, so a counter that was culled never
+        # comes back at a value older responses are still stored under.
+        generation = time.time_ns()
+        if not cache.add(key, generation, timeout=None):
+            generation = cache.get(key, generation)
+    return generation
+
+
+def bump_list_generation(*resources: str, cache_alias: str = RESPONSE_CACHE) -> None:
+    """Make every cached list response of `resources` unreachable.
+
+    Inside a transaction the counters are bumped again on commit, so a
+    response built from pre-commit data cannot outlive the write.
+    """
+    cache = caches[cache_alias]
+    for resource in resources:
+        key = f"generation:{resource}"
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), timeout=None)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(
+            lambda: bump_list_generation(*resources, cache_alias=cache_alias)
+        )
+
+
+class ListResponseCache:
+    """Serialized list responses keyed by resource, generation and query.
+
+    The generation is read once, when the cache is created, so a response
+    computed while a write lands is stored under a key nobody reads anymore.
+    """
+
+    def __init__(self, resource: str, params: dict, cache_alias: str = RESPONSE_CACHE):
+        self.cache = caches[cache_alias]
+        self.key = ":".join(
+            [
+                "list",
+                resource,
+                str(list_generation(resource, cache_alias)),
+                hashlib.md5(normalized_query(params).encode()).hexdigest(),
+            ]
+        )
+
+    def get(self):
+        return self.cache.get(self.key)
+
+    def set(self, value) -> None:
+        self.cache.set(self.key, value)
+
+    async def aget(self):
+        return await self.cache.aget(self.key)
+
+    async def aset(self, value) -> None:
+        await self.cache.aset(self.key, value)
@@ -0,0 +1,131 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable
+
+from asgiref.sync import sync_to_async
+
+from django.db.models import Count, Max, QuerySet
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from src.django_project._shared.caching import ListResponseCache, normalized_query
+from src.django_project._shared.etags import etag_for_version
+
+
+@dataclass(frozen=True)
+class Validators:
+    etag: str
+    last_modified: datetime | None = None
+
+    def apply(self, response: HttpResponse) -> HttpResponse:
+        response["ETag"] = self.etag
+        if self.last_modified is not None:
+            response["Last-Modified"] = http_date(self.last_modified.timestamp())
+        return response
+
+
+def entity_validators(entity) -> Validators:
+    return Validators(
+        etag=etag_for_version(entity.version),
+        last_modified=entity.updated_at,
+    )
+
+
+def list_validators(queryset: QuerySet, params: dict) -> Validators:
+    """Validators of one list page, from a single MAX(updated_at)/COUNT query.
+
+    Updates move `updated_at` forward and deletes change the count, so any
+    write that can alter the page changes the ETag.
+    """
+    state = queryset.aggregate(last_modified=Max("updated_at"), count=Count("pk"))
+    return _list_validators(state, params)
+
+
+async def alist_validators(queryset: QuerySet, params: dict) -> Validators:
+    state = await queryset.aaggregate(
+        last_modified=Max("updated_at"), count=Count("pk")
+    )
+    return _list_validators(state, params)
+
+
+def _list_validators(state: dict, params: dict) -> Validators:
+    fingerprint = (
+        f"{state['count']}:{state['last_modified']}:{normalized_query(params)}"
+    )
+    return Validators(
+        etag=f'"{hashlib.md5(fingerprint.encode()).hexdigest()}"',
+        last_modified=state["last_modified"],
+    )
+
+
+def not_modified(request: Request, validators: Validators) -> HttpResponse | None:
+    """The 304 (or 412) the client's conditional headers call for, if any."""
+    last_modified = None
+    if validators.last_modified is not None:
+        last_modified = int(validators.last_modified.timestamp())
+    response = get_conditional_response(
+        request, etag=validators.etag, last_modified=last_modified
+    )
+    return validators.apply(response) if response is not None else None
+
+
+def conditional_list_response(
+    request: Request,
+    resource: str,
+    params: dict,
+    queryset: QuerySet,
+    build_response: Callable[[dict], Response],
+) -> HttpResponse:
+    """Answer a list request from the response cache, with a 304, or by building it.
+
+    `build_response` only runs when neither the cache nor the client already
+    holds the current page; its 200 responses are cached with their
+    validators so later hits can be answered without touching the ORM.
+    """
+    response_cache = ListResponseCache(resource, params)
+    cached = response_cache.get()
+    if cached is not None:
+        data, validators = cached
+        return not_modified(request, validators) or validators.apply(
+            Response(data, status=status.HTTP_200_OK)
+        )
+    validators = list_validators(queryset, params)
+    response = not_modified(request, validators)
+    if response is not None:
+        return response
+    response = build_response(params)
+    if response.status_code == status.HTTP_200_OK:
+        response_cache.set((response.data, validators))
+        validators.apply(response)
+    return response
+
+
+async def aconditional_list_response(
+    request: Request,
+    resource: str,
+    params: dict,
+    queryset: QuerySet,
+    build_response: Callable[[dict], Awaitable[Response]],
+) -> HttpResponse:
+    """`conditional_list_response` for async views, awaiting `build_response`."""
+    response_cache = await sync_to_async(ListResponseCache)(resource, params)
+    cached = await response_cache.aget()
+    if cached is not None:
+        data, validators = cached
+        return not_modified(request, validators) or validators.apply(
+            Response(data, status=status.HTTP_200_OK)
+        )
+    validators = await alist_validators(queryset, params)
+    response = not_modified(request, validators)
+    if response is not None:
+        return response
+    response = await build_response(params)
+    if response.status_code == status.HTTP_200_OK:
+        await response_cache.aset((response.data, validators))
+        validators.apply(response)
+    return response
@@ -0,0 +1,28 @@
+from django.utils.http import parse_etags
+from rest_framework.request import Request
+
+# Entity versions start at 1, so this never matches a stored row.
+UNMATCHED_VERSION = 0
+
+
+def etag_for_version(version: int) -> str:
+    return f'"{version}"'
+
+
+def if_match_version(request: Request) -> int | None:
+    """Version the client expects to overwrite, or None when it does not care.
+
+    Only strong ETags issued by `etag_for_version` can match; anything else
+    yields a version no row has, so the update fails with 412.
+    """
+    header = request.headers.get("If-Match")
+    if header is None:
+        return None
+    etags = parse_etags(header)
+    if etags == ["*"]:
+        return None
+    for etag in etags:
+        version = etag.strip('"')
+        if etag.startswith('"') and version.isdigit():
+            return int(version)
+    return UNMATCHED_VERSION
@@ -0,0 +1,40 @@
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import cache
+
+from django.conf import settings
+from django.db import close_old_connections
+
+
+class DatabaseThreadPoolExecutor(ThreadPoolExecutor):
+    """Thread pool whose tasks may use the ORM.
+
+    Each worker thread has its own database connection, which Django's
+    request signals never see. Every task therefore starts and ends with
+    `close_old_connections`, the same housekeeping Django does around a
+    request, so connections honour CONN_MAX_AGE instead of leaking.
+
+    Tasks run outside the caller's transaction: they only see committed data.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        def run():
+            close_old_connections()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                close_old_connections()
+
+        return super().submit(run)
+
+
+def related_entity_check_executor() -> Executor | None:
+    """The shared pool for related-entity checks, or None when it is disabled."""
+    workers = settings.RELATED_ENTITY_CHECK_WORKERS
+    return _executor(workers) if workers else None
+
+
+@cache
+def _executor(max_workers: int) -> DatabaseThreadPoolExecutor:
+    return DatabaseThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="related-entity-check"
+    )
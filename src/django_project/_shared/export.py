@@ -0,0 +1,40 @@
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator
+
+from django.http import StreamingHttpResponse
+
+from src.django_project._shared.renderers import ORJSONRenderer
+
+# Rows read per database round trip, and per chunk written to the client.
+EXPORT_CHUNK_SIZE = 2_000
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def ndjson_response(
+    entities: Iterable[Any],
+    to_representation: Callable[[Any], dict],
+    filename: str,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> StreamingHttpResponse:
+    """Stream `entities` as newline-delimited JSON, one object per line.
+
+    Lines are written a chunk at a time so each write (and each gzip flush
+    when the view is compressed) carries a whole batch, while memory stays
+    bounded by `chunk_size` however large the catalog is.
+    """
+    render = ORJSONRenderer().render
+
+    def content() -> Iterator[bytes]:
+        for chunk in chunked(entities, chunk_size):
+            yield b"".join(
+                render(to_representation(entity)) + b"\n" for entity in chunk
+            )
+
+    response = StreamingHttpResponse(content(), content_type="application/x-ndjson")
+    response["Content-Disposition"] = f'attachment; filename="{filename}.ndjson"'
+    return response
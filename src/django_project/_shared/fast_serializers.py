@@ -0,0 +1,99 @@
+from collections.abc import Mapping
+from operator import attrgetter
+from typing import Any, Callable
+
+from django.db.models.manager import BaseManager
+from rest_framework import fields, serializers
+from rest_framework.fields import get_attribute
+
+Representation = Callable[[Any], Any]
+
+
+def _overrides_to_representation(field: fields.Field, base: type) -> bool:
+    return type(field).to_representation is not base.to_representation
+
+
+def _compile_field(field: fields.Field) -> Representation:
+    """Representation function equivalent to `field.to_representation`.
+
+    Stock fields whose output is a plain conversion get that conversion.
+    Anything customised keeps its own bound `to_representation`, so the
+    result never drifts from what DRF would produce.
+    """
+    if isinstance(field, serializers.ListSerializer):
+        child = _compile_field(field.child)
+
+        def many(value):
+            if isinstance(value, BaseManager):
+                value = value.all()
+            return [child(item) for item in value]
+
+        if not _overrides_to_representation(field, serializers.ListSerializer):
+            return many
+        return field.to_representation
+    if isinstance(field, serializers.Serializer):
+        if not _overrides_to_representation(field, serializers.Serializer):
+            return compile_serializer(type(field), field.fields)
+        return field.to_representation
+    if isinstance(field, fields.ListField):
+        if not _overrides_to_representation(field, fields.ListField):
+            child = _compile_field(field.child)
+            return lambda value: [
+                None if item is None else child(item) for item in value
+            ]
+        return field.to_representation
+    if type(field) is fields.CharField:
+        return str
+    if type(field) is fields.UUIDField and field.uuid_format == "hex_verbose":
+        return str
+    if type(field) is fields.IntegerField:
+        return int
+    if type(field) is fields.FloatField:
+        return float
+    if type(field) is fields.BooleanField:
+        to_representation = field.to_representation
+        return lambda value: (
+            value if value.__class__ is bool else to_representation(value)
+        )
+    return field.to_representation
+
+
+def _compile_getter(source_attrs: list[str]) -> Representation:
+    if not source_attrs:
+        return lambda instance: instance
+    get = attrgetter(".".join(source_attrs))
+
+    def getter(instance):
+        if isinstance(instance, Mapping):
+            return get_attribute(instance, source_attrs)
+        return get(instance)
+
+    return getter
+
+
+def compile_serializer(
+    serializer_class: type[serializers.Serializer],
+    declared_fields: Mapping[str, fields.Field] | None = None,
+) -> Callable[[Any], dict]:
+    """Build a function that renders an instance the way `serializer_class` does.
+
+    Fields, sources and nesting are resolved once here instead of on every
+    `.data` access, and the result is a plain dict. Instances are expected to
+    be the use case output DTOs: attributes are read as values, never called.
+    """
+    if declared_fields is None:
+        declared_fields = serializer_class().fields
+    plan = tuple(
+        (name, _compile_getter(field.source_attrs), _compile_field(field))
+        for name, field in declared_fields.items()
+        if not field.write_only
+    )
+
+    def to_representation(instance) -> dict:
+        representation = {}
+        for name, get, convert in plan:
+            value = get(instance)
+            representation[name] = None if value is None else convert(value)
+        return representation
+
+    return to_representation
@@ -0,0 +1,18 @@
+from django.db.models import Q, QuerySet
+
+from src.core._shared.pagination import Cursor
+
+
+def seek(queryset: QuerySet, order_by: str, cursor: Cursor | None) -> QuerySet:
+    """Order by ``(order_by, id)`` and resume right after ``cursor``.
+
+    Equivalent to ``WHERE (order_by, id) > (cursor.value, cursor.id)``, spelled
+    out with ``Q`` objects so it stays portable across database backends.
+    """
+    queryset = queryset.order_by(order_by, "id")
+    if cursor is None:
+        return queryset
+    return queryset.filter(
+        Q(**{f"{order_by}__gt": cursor.value})
+        | Q(**{order_by: cursor.value, "id__gt": cursor.id})
+    )
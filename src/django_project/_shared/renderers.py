@@ -0,0 +1,40 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+# orjson leaves these raw, DRF escapes them to keep JSON a JavaScript subset.
+_LINE_SEPARATOR = "\u2028".encode()
+_PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """`JSONRenderer` that encodes compact responses with orjson.
+
+    Types orjson does not encode the way DRF does (datetimes, dataclasses,
+    decimals...) go through DRF's encoder, and indented or non-default
+    renderings fall back to the stock path, so payloads match DRF's byte for
+    byte. The exception is floats: orjson writes `1e16` where `json` writes
+    `1e+16`, and NaN becomes `null` instead of an error.
+    """
+
+    options = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            rendered = orjson.dumps(
+                data, default=self.encoder_class().default, option=self.options
+            )
+        except orjson.JSONEncodeError:
+            # Let the stock encoder produce the payload or the usual error.
+            return super().render(data, accepted_media_type, renderer_context)
+        return rendered.replace(_LINE_SEPARATOR, b"\\u2028").replace(
+            _PARAGRAPH_SEPARATOR, b"\\u2029"
+        )
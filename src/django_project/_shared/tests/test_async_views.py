@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.test import AsyncClient
+
+from src.core.category.domain.category import Category
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.category_app.views import CategoryViewSet
+
+
+@pytest.mark.django_db
+class TestAsyncViewSet:
+    def test_views_are_coroutines(self):
+        view = CategoryViewSet.as_view({"get": "list", "post": "create"})
+
+        assert iscoroutinefunction(view)
+        assert view.csrf_exempt
+
+    def test_serves_concurrent_requests_on_one_event_loop(self):
+        categories = [
+            DjangoORMCategoryRepository().save(Category(name=f"Category {index}"))
+            for index in range(3)
+        ]
+        client = AsyncClient()
+
+        async def fetch_all():
+            return await asyncio.gather(
+                client.get("/api/categories/"),
+                *(
+                    client.get(f"/api/categories/{category.id}/")
+                    for category in categories
+                ),
+            )
+
+        list_response, *retrieve_responses = async_to_sync(fetch_all)()
+
+        assert list_response.status_code == 200
+        assert list_response.json()["meta"]["total_items"] == 3
+        assert [response.json()["data"]["id"] for response in retrieve_responses] == [
+            str(category.id) for category in categories
+        ]
+
+    def test_sync_actions_still_run(self):
+        client = AsyncClient()
+
+        response = async_to_sync(client.post)(
+            "/api/categories/",
+            {"name": "Movie", "description": "Movies"},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 201
+
+    def test_exceptions_in_async_actions_go_through_drf_handling(self):
+        client = AsyncClient()
+
+        response = async_to_sync(client.get)("/api/categories/not-a-uuid/")
+
+        assert response.status_code == 400
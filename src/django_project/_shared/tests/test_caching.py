@@ -0,0 +1,171 @@
+from unittest.mock import create_autospec
+
+import pytest
+from django.core.cache import caches
+from django.db import transaction
+
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategoryRepository
+from src.django_project._shared.caching import (
+    ENTITY_CACHE,
+    RESPONSE_CACHE,
+    CachingRepository,
+    ListResponseCache,
+    bump_list_generation,
+    cache_stats,
+    list_generation,
+)
+
+
+class TestCachingRepository:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        caches[ENTITY_CACHE].clear()
+        cache_stats().clear()
+
+    @pytest.fixture
+    def category(self) -> Category:
+        return Category(name="Movie")
+
+    @pytest.fixture
+    def repository(self, category):
+        repository = create_autospec(CategoryRepository)
+        repository.get_by_id.return_value = category
+        return repository
+
+    def test_get_by_id_is_served_from_cache_after_first_read(
+        self, repository, category
+    ):
+        caching_repository = CachingRepository(repository)
+        assert caching_repository.get_by_id(category.id) == category
+        assert caching_repository.get_by_id(category.id) == category
+        repository.get_by_id.assert_called_once_with(category.id)
+        assert caching_repository.stats.hits == 1
+        assert caching_repository.stats.misses == 1
+        assert caching_repository.stats.hit_ratio == 0.5
+
+    def test_cached_entities_are_copies(self, repository, category):
+        caching_repository = CachingRepository(repository)
+        caching_repository.get_by_id(category.id)
+        cached_category = caching_repository.get_by_id(category.id)
+        cached_category.update_category(name="Changed", description="")
+        assert caching_repository.get_by_id(category.id).name == "Movie"
+
+    def test_missing_entities_are_cached_as_missing(self, repository, category):
+        repository.get_by_id.return_value = None
+        caching_repository = CachingRepository(repository)
+        assert caching_repository.get_by_id(category.id) is None
+        assert caching_repository.get_by_id(category.id) is None
+        repository.get_by_id.assert_called_once_with(category.id)
+        assert caching_repository.stats.negative_hits == 1
+
+    def test_missing_entities_expire_after_negative_timeout(self, repository, category):
+        repository.get_by_id.return_value = None
+        caching_repository = CachingRepository(repository, negative_timeout=0)
+        caching_repository.get_by_id(category.id)
+        caching_repository.get_by_id(category.id)
+        assert repository.get_by_id.call_count == 2
+
+    def test_save_clears_missing_mark(self, repository, category):
+        repository.get_by_id.return_value = None
+        caching_repository = CachingRepository(repository)
+        caching_repository.get_by_id(category.id)
+        caching_repository.save(category)
+        repository.get_by_id.return_value = category
+        assert caching_repository.get_by_id(category.id) == category
+
+    def test_delete_marks_entity_missing(self, repository, category):
+        caching_repository = CachingRepository(repository)
+        caching_repository.get_by_id(category.id)
+        caching_repository.delete(category.id)
+        assert caching_repository.get_by_id(category.id) is None
+
+    @pytest.mark.django_db
+    def test_update_evicts_again_when_the_transaction_commits(
+        self, repository, category, django_capture_on_commit_callbacks
+    ):
+        caching_repository = CachingRepository(repository)
+        with django_capture_on_commit_callbacks(execute=True):
+            with transaction.atomic():
+                caching_repository.update(category)
+                # A concurrent read before the commit caches the old row.
+                caching_repository.get_by_id(category.id)
+        caching_repository.get_by_id(category.id)
+        assert repository.get_by_id.call_count == 2
+
+    @pytest.mark.django_db
+    def test_delete_marks_entity_missing_only_on_commit(
+        self, repository, category, django_capture_on_commit_callbacks
+    ):
+        caching_repository = CachingRepository(repository)
+        with django_capture_on_commit_callbacks() as callbacks:
+            with transaction.atomic():
+                caching_repository.delete(category.id)
+        assert caching_repository.get_by_id(category.id) == category
+        for callback in callbacks:
+            callback()
+        assert caching_repository.get_by_id(category.id) is None
+        repository.get_by_id.assert_called_once_with(category.id)
+
+    @pytest.mark.parametrize(
+        "write",
+        [
+            lambda repository, category: repository.save(category),
+            lambda repository, category: repository.update(category),
+        ],
+    )
+    def test_writes_invalidate_cached_entity(self, repository, category, write):
+        caching_repository = CachingRepository(repository)
+        caching_repository.get_by_id(category.id)
+        write(caching_repository, category)
+        caching_repository.get_by_id(category.id)
+        assert repository.get_by_id.call_count == 2
+
+    def test_other_methods_are_delegated(self, repository, category):
+        repository.list.return_value = [category]
+        caching_repository = CachingRepository(repository)
+        assert caching_repository.list() == [category]
+        repository.list.assert_called_once_with()
+
+    def test_counters_are_shared_by_wrappers_of_the_same_repository(
+        self, repository, category
+    ):
+        CachingRepository(repository).get_by_id(category.id)
+        CachingRepository(repository).get_by_id(category.id)
+        stats = cache_stats()[CachingRepository(repository).namespace]
+        assert (stats.hits, stats.misses) == (1, 1)
+
+
+class TestListResponseCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        caches[RESPONSE_CACHE].clear()
+
+    def test_returns_stored_response_for_same_params_in_any_order(self):
+        ListResponseCache("categories", {"page_size": 2, "order_by": "name"}).set(
+            {"data": []}
+        )
+        response_cache = ListResponseCache(
+            "categories", {"order_by": "name", "page_size": 2}
+        )
+        assert response_cache.get() == {"data": []}
+
+    def test_different_params_do_not_share_responses(self):
+        ListResponseCache("categories", {"page_size": 2}).set({"data": []})
+        assert ListResponseCache("categories", {"page_size": 3}).get() is None
+
+    def test_bump_makes_previous_responses_unreachable(self):
+        ListResponseCache("categories", {}).set({"data": []})
+        bump_list_generation("categories")
+        assert ListResponseCache("categories", {}).get() is None
+
+    def test_bump_only_affects_given_resources(self):
+        ListResponseCache("genres", {}).set({"data": []})
+        bump_list_generation("categories")
+        assert ListResponseCache("genres", {}).get() == {"data": []}
+
+    def test_lost_generation_restarts_at_an_unused_value(self):
+        generation = list_generation("categories")
+        bump_list_generation("categories")
+        caches[RESPONSE_CACHE].clear()
+        assert list_generation("categories") > generation + 1
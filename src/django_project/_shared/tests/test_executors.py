@@ -0,0 +1,41 @@
+from unittest.mock import patch
+
+import pytest
+from django.test import override_settings
+
+from src.django_project._shared.executors import (
+    DatabaseThreadPoolExecutor,
+    related_entity_check_executor,
+)
+
+
+class TestDatabaseThreadPoolExecutor:
+    def test_tidies_connections_around_each_task(self):
+        calls = []
+
+        with patch(
+            "src.django_project._shared.executors.close_old_connections",
+            side_effect=lambda: calls.append("close"),
+        ):
+            with DatabaseThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(calls.append, "task").result()
+
+        assert calls == ["close", "task", "close"]
+
+    def test_returns_results_and_raises_errors_like_a_thread_pool(self):
+        with DatabaseThreadPoolExecutor(max_workers=2) as executor:
+            assert executor.submit(sum, [1, 2, 3]).result() == 6
+            with pytest.raises(ZeroDivisionError):
+                executor.submit(lambda: 1 / 0).result()
+
+
+class TestRelatedEntityCheckExecutor:
+    def test_is_disabled_by_default(self):
+        assert related_entity_check_executor() is None
+
+    @override_settings(RELATED_ENTITY_CHECK_WORKERS=3)
+    def test_shares_one_pool_when_enabled(self):
+        executor = related_entity_check_executor()
+
+        assert isinstance(executor, DatabaseThreadPoolExecutor)
+        assert related_entity_check_executor() is executor
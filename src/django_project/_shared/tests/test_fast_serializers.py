@@ -0,0 +1,149 @@
+import uuid
+
+import pytest
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from src.core._shared.pagination import CursorMeta
+from src.core.cast_member.application.use_cases.list_cast_members import (
+    CastMemberData,
+    ListCastMember,
+    ListCastMemberWithCursor,
+)
+from src.core.cast_member.domain.cast_member import CastMemberType
+from src.core.category.application.use_cases.get_category import GetCategoryResponse
+from src.core.category.application.use_cases.list_category import (
+    CategoryOutput,
+    ListCategory,
+    ListCategoryWithCursor,
+    Meta,
+)
+from src.core.genre.application.use_cases.list_genre import (
+    GenreData,
+    ListGenre,
+    ListGenreWithCursor,
+)
+from src.django_project._shared.fast_serializers import compile_serializer
+from src.django_project._shared.renderers import ORJSONRenderer
+from src.django_project.cast_member_app.serializers import (
+    ListCastMemberCursorResponseSerializer,
+    ListCastMemberResponseSerializer,
+)
+from src.django_project.category_app.serializers import (
+    ListCategoryCursorResponseSerializer,
+    ListCategoryResponseSerializer,
+    RetrieveCategoryResponseSerializer,
+)
+from src.django_project.genre_app.serializers import (
+    ListGenreCursorResponseSerializer,
+    ListGenreResponseSerializer,
+    RetrieveGenreResponseSerializer,
+)
+
+# Non-ASCII and the separators DRF escapes, to exercise the renderer too.
+NAME = 'A\u00e7\u00e3o \u2028 Drama \u2029 "quoted" \U0001f3ac'
+
+categories = [
+    CategoryOutput(id=uuid.uuid4(), name=NAME, description="", is_active=bool(i % 2))
+    for i in range(3)
+]
+genres = [
+    GenreData(
+        id=uuid.uuid4(),
+        name=NAME,
+        is_active=True,
+        categories={category.id for category in categories[:i]},
+    )
+    for i in range(3)
+]
+cast_members = [
+    CastMemberData(id=uuid.uuid4(), name=NAME, type=cast_member_type)
+    for cast_member_type in CastMemberType
+]
+cursor_meta = CursorMeta(page_size=2, next_cursor=None)
+
+CASES = [
+    (
+        ListCategoryResponseSerializer,
+        ListCategory.Output(
+            data=categories,
+            meta=Meta(current_page=1, page_size=3, total_items=3, total_pages=1),
+        ),
+    ),
+    (
+        ListCategoryCursorResponseSerializer,
+        ListCategoryWithCursor.Output(
+            data=categories, meta=CursorMeta(page_size=2, next_cursor="abc=")
+        ),
+    ),
+    (
+        RetrieveCategoryResponseSerializer,
+        GetCategoryResponse(
+            id=uuid.uuid4(), name=NAME, description="x", is_active=True, version=2
+        ),
+    ),
+    (ListGenreResponseSerializer, ListGenre.Output(data=genres)),
+    (
+        ListGenreCursorResponseSerializer,
+        ListGenreWithCursor.Output(data=genres, meta=cursor_meta),
+    ),
+    (RetrieveGenreResponseSerializer, genres[2]),
+    (ListCastMemberResponseSerializer, ListCastMember.Output(data=cast_members)),
+    (
+        ListCastMemberCursorResponseSerializer,
+        ListCastMemberWithCursor.Output(data=cast_members, meta=cursor_meta),
+    ),
+    (
+        ListCategoryResponseSerializer,
+        ListCategory.Output(
+            data=[],
+            meta=Meta(current_page=2, page_size=3, total_items=3, total_pages=1),
+        ),
+    ),
+]
+
+
+class TestCompiledSerializer:
+    @pytest.mark.parametrize(
+        "serializer_class, instance",
+        CASES,
+        ids=[serializer_class.__name__ for serializer_class, _ in CASES],
+    )
+    def test_payload_is_byte_identical_to_drf(self, serializer_class, instance):
+        expected = JSONRenderer().render(serializer_class(instance).data)
+
+        rendered = ORJSONRenderer().render(
+            compile_serializer(serializer_class)(instance)
+        )
+
+        assert rendered == expected
+
+    def test_reads_mappings_like_drf(self):
+        instance = {
+            "data": [
+                {"id": uuid.uuid4(), "name": NAME, "description": "", "is_active": 1}
+            ],
+            "meta": {"page_size": 2, "next_cursor": None},
+        }
+
+        assert (
+            compile_serializer(ListCategoryCursorResponseSerializer)(instance)
+            == ListCategoryCursorResponseSerializer(instance).data
+        )
+
+
+class TestORJSONRenderer:
+    def test_falls_back_to_drf_when_indent_is_requested(self):
+        data = {"name": NAME, "ids": [1, 2]}
+
+        rendered = ORJSONRenderer().render(data, "application/json; indent=2")
+
+        assert rendered == JSONRenderer().render(data, "application/json; indent=2")
+
+    def test_encodes_datetimes_like_drf(self):
+        data = {"updated_at": timezone.now(), "id": uuid.uuid4()}
+
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_renders_none_as_empty_body(self):
+        assert ORJSONRenderer().render(None) == b""
@@ -0,0 +1,80 @@
+import uuid
+
+import pytest
+
+from src.core.category.domain.category import Category
+from src.django_project._shared.unit_of_work import UnitOfWork
+from src.django_project.category_app.models import Category as CategoryModel
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+
+
+@pytest.mark.django_db
+class TestUnitOfWork:
+    @pytest.fixture
+    def category(self) -> Category:
+        return DjangoORMCategoryRepository().save(Category(name="Movie"))
+
+    def test_loads_each_entity_once(self, category, django_assert_num_queries):
+        with UnitOfWork() as unit_of_work:
+            repository = unit_of_work.repository(DjangoORMCategoryRepository())
+            with django_assert_num_queries(1):
+                first = repository.get_by_id(category.id)
+                second = repository.get_by_id(category.id)
+
+        assert first is second
+        assert first.id == category.id
+
+    def test_remembers_missing_ids(self, django_assert_num_queries):
+        missing_id = uuid.uuid4()
+        with UnitOfWork() as unit_of_work:
+            repository = unit_of_work.repository(DjangoORMCategoryRepository())
+            with django_assert_num_queries(1):
+                assert repository.get_by_id(missing_id) is None
+                assert repository.get_by_id(missing_id) is None
+                assert repository.find_existing_ids({missing_id}) == set()
+
+    def test_find_existing_ids_only_queries_unknown_ids(
+        self, category, django_assert_num_queries
+    ):
+        other = DjangoORMCategoryRepository().save(Category(name="Series"))
+        with UnitOfWork() as unit_of_work:
+            repository = unit_of_work.repository(DjangoORMCategoryRepository())
+            repository.get_by_id(category.id)
+            with django_assert_num_queries(0):
+                assert repository.find_existing_ids({category.id}) == {category.id}
+            with django_assert_num_queries(1):
+                assert repository.find_existing_ids({category.id, other.id}) == {
+                    category.id,
+                    other.id,
+                }
+
+    def test_repositories_of_different_types_do_not_share_entries(self, category):
+        with UnitOfWork() as unit_of_work:
+            repository = unit_of_work.repository(DjangoORMCategoryRepository())
+            repository.get_by_id(category.id)
+
+        assert set(unit_of_work.identity_map) == {
+            ("DjangoORMCategoryRepository", category.id)
+        }
+
+    def test_rolls_back_every_write_when_the_block_raises(self):
+        unit_of_work = UnitOfWork()
+        repository = unit_of_work.repository(DjangoORMCategoryRepository())
+
+        with pytest.raises(RuntimeError):
+            with unit_of_work:
+                repository.save(Category(name="Movie"))
+                repository.save(Category(name="Series"))
+                raise RuntimeError
+
+        assert CategoryModel.objects.count() == 0
+        assert unit_of_work.identity_map == {}
+
+    def test_stale_entity_is_dropped_when_update_loses_a_version_race(self, category):
+        with UnitOfWork() as unit_of_work:
+            repository = unit_of_work.repository(DjangoORMCategoryRepository())
+            stale = repository.get_by_id(category.id)
+            DjangoORMCategoryRepository().update(category)
+
+            assert repository.update(stale) is None
+            assert repository.get_by_id(category.id).version == category.version
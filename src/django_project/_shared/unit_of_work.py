@@ -0,0 +1,111 @@
+from uuid import UUID
+
+from django.db import transaction
+
+_MISSING = object()
+
+
+class IdentityMapRepository:
+    """Repository view that loads each entity at most once per unit of work.
+
+    `get_by_id` answers from the identity map after the first read, including
+    for ids known to be missing, and `find_existing_ids` only asks the wrapped
+    repository about ids the map cannot settle. Writes go straight through
+    (inside the unit of work's transaction) and keep the map current; every
+    other method is delegated untouched.
+    """
+
+    def __init__(self, repository, identity_map: dict):
+        self.repository = repository
+        self.identity_map = identity_map
+        self.namespace = type(repository).__name__
+
+    def __getattr__(self, name):
+        return getattr(self.repository, name)
+
+    def get_by_id(self, id: UUID):
+        key = self._key(id)
+        entity = self.identity_map.get(key, _MISSING)
+        if entity is _MISSING:
+            entity = self.identity_map[key] = self.repository.get_by_id(id)
+        return entity
+
+    def find_existing_ids(self, ids: set[UUID]) -> set[UUID]:
+        known = {id: self.identity_map.get(self._key(id), _MISSING) for id in ids}
+        unknown_ids = {id for id, entity in known.items() if entity is _MISSING}
+        existing_ids = {
+            id for id, entity in known.items() if entity is not None
+        } - unknown_ids
+        if unknown_ids:
+            existing_ids |= self.repository.find_existing_ids(unknown_ids)
+        return existing_ids
+
+    def save(self, entity):
+        saved_entity = self.repository.save(entity)
+        self.identity_map[self._key(entity.id)] = saved_entity
+        return saved_entity
+
+    def save_many(self, entities):
+        saved_entities = self.repository.save_many(entities)
+        for entity in saved_entities:
+            self.identity_map[self._key(entity.id)] = entity
+        return saved_entities
+
+    def update(self, entity):
+        updated_entity = self.repository.update(entity)
+        if updated_entity is None:
+            # Lost a version race: what we hold is stale.
+            self.identity_map.pop(self._key(entity.id), None)
+        else:
+            self.identity_map[self._key(entity.id)] = updated_entity
+        return updated_entity
+
+    def update_many(self, ids: set[UUID], is_active: bool) -> set[UUID]:
+        for id in ids:
+            self.identity_map.pop(self._key(id), None)
+        return self.repository.update_many(ids, is_active)
+
+    def delete(self, id: UUID) -> None:
+        self.repository.delete(id)
+        self.identity_map[self._key(id)] = None
+
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        deleted_ids = self.repository.delete_many(ids)
+        for id in ids:
+            self.identity_map[self._key(id)] = None
+        return deleted_ids
+
+    def _key(self, id: UUID) -> tuple[str, UUID]:
+        return (self.namespace, id)
+
+
+class UnitOfWork:
+    """One transaction and one identity map for everything a request does.
+
+    Views open it around a use case and hand the use case repositories from
+    `repository()`. All writes land in a single transaction that commits when
+    the block exits cleanly and rolls back, together with the identity map,
+    when it raises.
+
+        with UnitOfWork() as uow:
+            output = UpdateGenre(
+                repository=uow.repository(DjangoORMGenreRepository()),
+                category_repository=uow.repository(DjangoORMCategoryRepository()),
+            ).execute(input)
+    """
+
+    def __init__(self, using: str | None = None):
+        self.identity_map: dict = {}
+        self._atomic = transaction.atomic(using=using)
+
+    def repository(self, repository) -> IdentityMapRepository:
+        return IdentityMapRepository(repository, self.identity_map)
+
+    def __enter__(self) -> "UnitOfWork":
+        self._atomic.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.identity_map.clear()
+        return self._atomic.__exit__(exc_type, exc_value, traceback)
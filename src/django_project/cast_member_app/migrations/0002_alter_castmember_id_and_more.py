@@ -0,0 +1,25 @@
+# Generated by Django 5.0.1 on 2026-10-18 18:52
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cast_member_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="castmember",
+            name="id",
+            field=models.UUIDField(
+                default=uuid.uuid4, primary_key=True, serialize=False
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="castmember",
+            index=models.Index(fields=["name", "id"], name="cast_member_name_id_idx"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-18 18:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cast_member_app", "0002_alter_castmember_id_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="castmember",
+            name="version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-18 19:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cast_member_app", "0003_castmember_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="castmember",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
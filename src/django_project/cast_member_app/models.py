@@ -15,11 +15,16 @@ class CastMember(models.Model):
             (member_type.value, member_type.value) for member_type in CastMemberType
         ],
     )
+    version = models.PositiveIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         db_table = "cast_member"
         verbose_name_plural = "Cast Members"
         verbose_name = "Cast Member"
+        indexes = [
+            models.Index(fields=["name", "id"], name="cast_member_name_id_idx"),
+        ]
 
     def __str__(self):
         return f"name: {self.name} | type: {self.type}"
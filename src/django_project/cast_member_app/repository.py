@@ -1,11 +1,27 @@
+from typing import Iterator
 from uuid import UUID
 
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from src.core._shared.pagination import Cursor
 from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
-from src.core.cast_member.domain.cast_member_repository import CastMemberRepository
+from src.core.cast_member.domain.cast_member_repository import (
+    AsyncCastMemberRepository,
+    CastMemberRepository,
+)
+from src.django_project._shared.caching import (
+    bump_list_generation,
+    touch_dependents,
+)
+from src.django_project._shared.pagination import seek
 from src.django_project.cast_member_app.models import CastMember as CastMemberModel
+from src.django_project.video_app.models import Video as VideoModel
+from src.django_project.video_app.repository import DjangoORMVideoRepository
 
 
-class DjangoORMCastMemberRepository(CastMemberRepository):
+class DjangoORMCastMemberRepository(CastMemberRepository, AsyncCastMemberRepository):
     def __init__(self, cast_member_model: CastMemberModel | None = None):
         self.cast_member_model = cast_member_model or CastMemberModel
 
@@ -14,56 +30,178 @@ class DjangoORMCastMemberRepository(CastMemberRepository):
             id=cast_member.id,
             name=cast_member.name,
             type=cast_member.type.value,
+            version=cast_member.version,
         )
-        return CastMember(
+        bump_list_generation("cast_members")
+        return CastMember.reconstitute(
             id=created_cast_member.id,
             name=created_cast_member.name,
             type=CastMemberType[created_cast_member.type],
+            version=created_cast_member.version,
+            updated_at=created_cast_member.updated_at,
         )
 
+    def save_many(self, cast_members: list[CastMember]) -> list[CastMember]:
+        with transaction.atomic():
+            cast_member_models = self.cast_member_model.objects.bulk_create(
+                [
+                    self.cast_member_model(
+                        id=cast_member.id,
+                        name=cast_member.name,
+                        type=cast_member.type.value,
+                        version=cast_member.version,
+                    )
+                    for cast_member in cast_members
+                ]
+            )
+        bump_list_generation("cast_members")
+        return [
+            CastMember.reconstitute(
+                id=cast_member.id,
+                name=cast_member.name,
+                type=CastMemberType[cast_member.type],
+                version=cast_member.version,
+                updated_at=cast_member.updated_at,
+            )
+            for cast_member in cast_member_models
+        ]
+
     def get_by_id(self, id: UUID) -> CastMember | None:
         try:
             cast_member = self.cast_member_model.objects.get(id=id)
         except self.cast_member_model.DoesNotExist:
             return None
-        return CastMember(
+        return CastMember.reconstitute(
             id=cast_member.id,
             name=cast_member.name,
             type=CastMemberType[cast_member.type],
+            version=cast_member.version,
+        )
+
+    async def aget_by_id(self, id: UUID) -> CastMember | None:
+        try:
+            cast_member = await self.cast_member_model.objects.aget(id=id)
+        except self.cast_member_model.DoesNotExist:
+            return None
+        return CastMember.reconstitute(
+            id=cast_member.id,
+            name=cast_member.name,
+            type=CastMemberType[cast_member.type],
+            version=cast_member.version,
+            updated_at=cast_member.updated_at,
+        )
+
+    def find_existing_ids(self, ids: set[UUID]) -> set[UUID]:
+        if not ids:
+            return set()
+        return set(
+            self.cast_member_model.objects.filter(id__in=ids).values_list(
+                "id", flat=True
+            )
         )
 
     def delete(self, id: UUID) -> None:
-        self.cast_member_model.objects.filter(id=id).delete()
+        with transaction.atomic():
+            touch_dependents(
+                VideoModel.objects.filter(cast_members=id),
+                DjangoORMVideoRepository.__name__,
+            )
+            self.cast_member_model.objects.filter(id=id).delete()
+        bump_list_generation("cast_members", "videos")
 
-    def list(self) -> list[CastMember]:
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        with transaction.atomic():
+            existing_ids = self.find_existing_ids(ids)
+            if not existing_ids:
+                return existing_ids
+            touch_dependents(
+                VideoModel.objects.filter(cast_members__in=existing_ids),
+                DjangoORMVideoRepository.__name__,
+            )
+            self.cast_member_model.objects.filter(id__in=existing_ids).delete()
+        bump_list_generation("cast_members", "videos")
+        return existing_ids
+
+    def list_after(
+        self, order_by: str, cursor: Cursor | None, limit: int
+    ) -> list[CastMember]:
+        queryset = seek(self.cast_member_model.objects.all(), order_by, cursor)
         return [
-            CastMember(
+            CastMember.reconstitute(
                 id=cast_member.id,
                 name=cast_member.name,
                 type=CastMemberType[cast_member.type],
+                version=cast_member.version,
+                updated_at=cast_member.updated_at,
             )
-            for cast_member in self.cast_member_model.objects.all()
+            for cast_member in queryset[:limit]
         ]
 
-    def update(self, cast_member: CastMember) -> CastMember | None:
-        try:
-            persisted_cast_member = (
-                self.cast_member_model.objects.select_for_update().get(
-                    id=cast_member.id
-                )
+    async def alist_after(
+        self, order_by: str, cursor: Cursor | None, limit: int
+    ) -> list[CastMember]:
+        queryset = seek(self.cast_member_model.objects.all(), order_by, cursor)
+        return [
+            CastMember.reconstitute(
+                id=cast_member.id,
+                name=cast_member.name,
+                type=CastMemberType[cast_member.type],
+                version=cast_member.version,
+                updated_at=cast_member.updated_at,
             )
-            update_fields = {
-                "name": cast_member.name,
-                "type": cast_member.type.value,
-            }
-            self.cast_member_model.objects.filter(id=cast_member.id).update(
-                **update_fields
+            async for cast_member in queryset[:limit]
+        ]
+
+    async def alist(self) -> list[CastMember]:
+        return [
+            CastMember.reconstitute(
+                id=cast_member.id,
+                name=cast_member.name,
+                type=CastMemberType[cast_member.type],
+                version=cast_member.version,
+                updated_at=cast_member.updated_at,
             )
-            persisted_cast_member.refresh_from_db()
-            return CastMember(
-                id=persisted_cast_member.id,
-                name=persisted_cast_member.name,
-                type=CastMemberType[persisted_cast_member.type],
+            async for cast_member in self.cast_member_model.objects.all()
+        ]
+
+    def iterate(self, chunk_size: int) -> Iterator[CastMember]:
+        for cast_member in self.cast_member_model.objects.order_by("id").iterator(
+            chunk_size=chunk_size
+        ):
+            yield CastMember.reconstitute(
+                id=cast_member.id,
+                name=cast_member.name,
+                type=CastMemberType[cast_member.type],
+                version=cast_member.version,
+                updated_at=cast_member.updated_at,
             )
-        except self.cast_member_model.DoesNotExist:
+
+    def list(self) -> list[CastMember]:
+        return [
+            CastMember.reconstitute(
+                id=cast_member.id,
+                name=cast_member.name,
+                type=CastMemberType[cast_member.type],
+                version=cast_member.version,
+                updated_at=cast_member.updated_at,
+            )
+            for cast_member in self.cast_member_model.objects.all()
+        ]
+
+    def update(self, cast_member: CastMember) -> CastMember | None:
+        updated_at = timezone.now()
+        updated_rows = self.cast_member_model.objects.filter(
+            id=cast_member.id,
+            version=cast_member.version,
+        ).update(
+            name=cast_member.name,
+            type=cast_member.type.value,
+            version=F("version") + 1,
+            updated_at=updated_at,
+        )
+        if not updated_rows:
             return None
+        bump_list_generation("cast_members")
+        cast_member.version += 1
+        cast_member.updated_at = updated_at
+        return cast_member
@@ -1,4 +1,6 @@
 from rest_framework import serializers
+from src.django_project._shared.bulk import BULK_MAX_ITEMS
+from src.django_project._shared.fast_serializers import compile_serializer
 from src.core.cast_member.domain.cast_member import CastMemberType
 
 
@@ -23,10 +25,29 @@ class CastMemberSerializer(serializers.Serializer):
     type = CastMemberTypeField()
 
 
+class ListCastMemberRequestSerializer(serializers.Serializer):
+    order_by = serializers.ChoiceField(
+        choices=["id", "name", "type"],
+        default="name",
+    )
+    page_size = serializers.IntegerField(min_value=1, max_value=100, default=2)
+    cursor = serializers.CharField(required=False, allow_blank=True)
+
+
 class ListCastMemberResponseSerializer(serializers.Serializer):
     data = CastMemberSerializer(many=True)
 
 
+class ListCastMemberCursorMetaSerializer(serializers.Serializer):
+    page_size = serializers.IntegerField()
+    next_cursor = serializers.CharField(allow_null=True)
+
+
+class ListCastMemberCursorResponseSerializer(serializers.Serializer):
+    data = CastMemberSerializer(many=True)
+    meta = ListCastMemberCursorMetaSerializer()
+
+
 class CreateCastMemberRequestSerializer(serializers.Serializer):
     name = serializers.CharField()
     type = CastMemberTypeField()
@@ -38,6 +59,10 @@ class CreateCastMemberResponseSerializer(serializers.Serializer):
     type = CastMemberTypeField()
 
 
+class CreateCastMembersResponseSerializer(serializers.Serializer):
+    data = CreateCastMemberResponseSerializer(many=True)
+
+
 class UpdateCastMemberRequestSerializer(serializers.Serializer):
     id = serializers.UUIDField()
     name = serializers.CharField()
@@ -68,3 +93,24 @@ class DeleteCastMemberRequestSerializer(serializers.Serializer):
 
 class DeleteCastMemberResponseSerializer(serializers.Serializer):
     detail = serializers.CharField()
+
+
+class BulkDeleteCastMemberRequestSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.UUIDField(), allow_empty=False, max_length=BULK_MAX_ITEMS
+    )
+
+
+class BulkDeleteCastMemberResponseSerializer(serializers.Serializer):
+    deleted_ids = serializers.ListField(child=serializers.UUIDField())
+    missing_ids = serializers.ListField(child=serializers.UUIDField())
+
+
+render_cast_member = compile_serializer(CastMemberSerializer)
+render_list_cast_member_response = compile_serializer(ListCastMemberResponseSerializer)
+render_list_cast_member_cursor_response = compile_serializer(
+    ListCastMemberCursorResponseSerializer
+)
+render_create_cast_members_response = compile_serializer(
+    CreateCastMembersResponseSerializer
+)
@@ -41,6 +41,17 @@ class TestDjangoORMCastMemberRepository:
         retrieved_cast_member = repository.get_by_id(uuid4())
         assert retrieved_cast_member is None
 
+    def test_find_existing_ids_returns_only_persisted_ids(self, cast_member_model):
+        repository = DjangoORMCastMemberRepository(cast_member_model=cast_member_model)
+        cast_member = repository.save(
+            CastMember(name="Actor", type=CastMemberType.ACTOR)
+        )
+        missing_id = uuid4()
+        assert repository.find_existing_ids({cast_member.id, missing_id}) == {
+            cast_member.id
+        }
+        assert repository.find_existing_ids(set()) == set()
+
     def test_can_delete_a_cast_member_record(self, cast_member_model):
         repository = DjangoORMCastMemberRepository(cast_member_model=cast_member_model)
         cast_member_1 = CastMember(
@@ -118,3 +129,34 @@ class TestDjangoORMCastMemberRepository:
         assert updated_cast_member.id == cast_member.id
         assert updated_cast_member.name == cast_member.name
         assert updated_cast_member.type == cast_member.type
+
+    def test_update_issues_a_single_query(
+        self, cast_member_model, django_assert_num_queries
+    ):
+        repository = DjangoORMCastMemberRepository(cast_member_model=cast_member_model)
+        cast_member = repository.save(
+            CastMember(name="Actor", type=CastMemberType.ACTOR)
+        )
+        cast_member.change_name("Director")
+        with django_assert_num_queries(1):
+            repository.update(cast_member)
+        assert cast_member_model.objects.get(id=cast_member.id).name == "Director"
+
+    def test_update_returns_none_when_cast_member_does_not_exist(
+        self, cast_member_model
+    ):
+        repository = DjangoORMCastMemberRepository(cast_member_model=cast_member_model)
+        cast_member = CastMember(name="Actor", type=CastMemberType.ACTOR)
+        assert repository.update(cast_member) is None
+
+    def test_update_returns_none_when_version_is_stale(self, cast_member_model):
+        repository = DjangoORMCastMemberRepository(cast_member_model=cast_member_model)
+        cast_member = repository.save(
+            CastMember(name="Actor", type=CastMemberType.ACTOR)
+        )
+        stale_cast_member = repository.get_by_id(cast_member.id)
+        cast_member.change_name("Director")
+        assert repository.update(cast_member).version == 2
+        stale_cast_member.change_name("Writer")
+        assert repository.update(stale_cast_member) is None
+        assert repository.get_by_id(cast_member.id).name == "Director"
@@ -1,3 +1,4 @@
+import json
 from uuid import uuid4
 import pytest
 from rest_framework import status
@@ -61,6 +62,43 @@ class TestCastMemberViewSetListAPI(CommonTestFixtures):
         assert response.status_code == 200
         assert len(response.data["data"]) == 0
 
+    def test_list_cast_members_with_cursor_ordered_by_type(
+        self,
+        create_cast_member,
+        client,
+    ):
+        cast_member_director = create_cast_member("Director", CastMemberType.DIRECTOR)
+        cast_member_actor = create_cast_member("Actor", CastMemberType.ACTOR)
+        cast_member_path = "/api/cast-members/"
+        first_response = client.get(
+            cast_member_path, {"cursor": "", "order_by": "type", "page_size": 1}
+        )
+        assert first_response.status_code == 200
+        assert first_response.data["data"][0]["id"] == str(cast_member_actor.id)
+        second_response = client.get(
+            cast_member_path,
+            {
+                "cursor": first_response.data["meta"]["next_cursor"],
+                "order_by": "type",
+                "page_size": 1,
+            },
+        )
+        assert second_response.data["data"][0]["id"] == str(cast_member_director.id)
+        assert second_response.data["meta"]["next_cursor"] is None
+
+
+class TestCastMemberViewSetExportAPI(CommonTestFixtures):
+    def test_streams_every_cast_member_as_ndjson(self, create_cast_member, client):
+        actor = create_cast_member("John", CastMemberType.ACTOR)
+
+        response = client.get("/api/cast-members/export/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ] == [{"id": str(actor.id), "name": "John", "type": "ACTOR"}]
+
 
 class TestCastMemberViewSetCreateAPI(CommonTestFixtures):
     def test_create_cast_member(self, cast_member_repository, client):
@@ -126,6 +164,28 @@ class TestCastMemberViewSetUpdateAPI(CommonTestFixtures):
         assert response.data == expected_response
         assert response.status_code == status.HTTP_200_OK
 
+    def test_update_cast_member_with_stale_if_match_returns_412(
+        self,
+        client,
+        create_cast_member,
+    ):
+        cast_member = create_cast_member("Actor", CastMemberType.ACTOR)
+        cast_member_path = f"/api/cast-members/{cast_member.id}/"
+        payload = {"name": "Director", "type": "DIRECTOR"}
+        response = client.put(
+            cast_member_path, payload, format="json", HTTP_IF_MATCH='"1"'
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] == '"2"'
+        response = client.put(
+            cast_member_path, payload, format="json", HTTP_IF_MATCH='"1"'
+        )
+        assert response.data == {
+            "error": f"Can not update cast member with id: {cast_member.id}. "
+            "Expected version 1, found 2."
+        }
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
     def test_try_to_update_non_existent_cast_member(
         self,
         client,
@@ -1,48 +1,109 @@
 from uuid import UUID
 
-from rest_framework import status, viewsets
+from django.http import StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.gzip import gzip_page
+from rest_framework import status
+from rest_framework.decorators import action
 from rest_framework.views import Request, Response
 
+from src.core._shared.pagination import InvalidCursorException
 from src.core.cast_member.application.use_cases.create_cast_member import (
     CreateCastMember,
+    CreateCastMembers,
 )
 from src.core.cast_member.application.use_cases.exceptions import (
     CastMemberNotFoundException,
+    CastMemberVersionConflictException,
     InvalidCastMemberDataException,
+    InvalidCastMembersDataException,
+)
+from src.core.cast_member.application.use_cases.list_cast_members import (
+    ListCastMember,
+    ListCastMemberWithCursor,
 )
-from src.core.cast_member.application.use_cases.list_cast_members import ListCastMember
 from src.core.cast_member.application.use_cases.update_cast_member import (
     UpdateCastMember,
 )
 from src.core.cast_member.application.use_cases.delete_cast_member import (
     DeleteCastMember,
+    DeleteCastMembers,
 )
+from src.django_project._shared.async_views import AsyncViewSet
+from src.django_project._shared.bulk import BULK_MAX_ITEMS
+from src.django_project._shared.caching import CachingRepository
+from src.django_project._shared.conditional import aconditional_list_response
+from src.django_project._shared.etags import etag_for_version, if_match_version
+from src.django_project._shared.export import EXPORT_CHUNK_SIZE, ndjson_response
+from src.django_project.cast_member_app.models import CastMember as CastMemberModel
 from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
 from src.django_project.cast_member_app.serializers import (
+    BulkDeleteCastMemberRequestSerializer,
+    BulkDeleteCastMemberResponseSerializer,
     CreateCastMemberRequestSerializer,
     CreateCastMemberResponseSerializer,
     DeleteCastMemberRequestSerializer,
     DeleteCastMemberResponseSerializer,
-    ListCastMemberResponseSerializer,
+    ListCastMemberRequestSerializer,
     PartialUpdateCastMemberRequestSerializer,
     PartialUpdateCastMemberResponseSerializer,
     UpdateCastMemberRequestSerializer,
     UpdateCastMemberResponseSerializer,
+    render_cast_member,
+    render_create_cast_members_response,
+    render_list_cast_member_cursor_response,
+    render_list_cast_member_response,
 )
 
 
 # Create your views here.
-class CastMemberViewSet(viewsets.ViewSet):
-    def list(self, request: Request) -> Response:
-        repository = DjangoORMCastMemberRepository()
+class CastMemberViewSet(AsyncViewSet):
+    async def list(self, request: Request) -> Response:
+        request_serializer = ListCastMemberRequestSerializer(data=request.query_params)
+        request_serializer.is_valid(raise_exception=True)
+        return await aconditional_list_response(
+            request,
+            "cast_members",
+            request_serializer.validated_data,
+            CastMemberModel.objects.all(),
+            self._list,
+        )
+
+    async def _list(self, params) -> Response:
+        repository = CachingRepository(DjangoORMCastMemberRepository())
+        if "cursor" in params:
+            return await self._list_with_cursor(repository, params)
         use_case = ListCastMember(repository=repository)
         input = ListCastMember.Input()
-        output = use_case.execute(input)
-        response_serializer = ListCastMemberResponseSerializer(output)
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        output = await use_case.aexecute(input)
+        return Response(
+            render_list_cast_member_response(output), status=status.HTTP_200_OK
+        )
+
+    async def _list_with_cursor(self, repository, params) -> Response:
+        use_case = ListCastMemberWithCursor(repository=repository)
+        input = ListCastMemberWithCursor.Input(**params)
+        try:
+            output = await use_case.aexecute(input)
+        except InvalidCursorException as err:
+            return Response(
+                data={"error": str(err)}, status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(
+            render_list_cast_member_cursor_response(output), status=status.HTTP_200_OK
+        )
+
+    @action(detail=False, methods=["get"])
+    @method_decorator(gzip_page)
+    def export(self, request: Request) -> StreamingHttpResponse:
+        return ndjson_response(
+            DjangoORMCastMemberRepository().iterate(chunk_size=EXPORT_CHUNK_SIZE),
+            render_cast_member,
+            "cast_members",
+        )
 
     def create(self, request: Request) -> Response:
-        repository = DjangoORMCastMemberRepository()
+        repository = CachingRepository(DjangoORMCastMemberRepository())
         use_case = CreateCastMember(repository=repository)
         request_serializer = CreateCastMemberRequestSerializer(data=request.data)
         request_serializer.is_valid(raise_exception=True)
@@ -56,50 +117,114 @@ class CastMemberViewSet(viewsets.ViewSet):
         response_serializer = CreateCastMemberResponseSerializer(instance=output)
         return Response(data=response_serializer.data, status=status.HTTP_201_CREATED)
 
+    @action(detail=False, methods=["post"])
+    def bulk(self, request: Request) -> Response:
+        request_serializer = CreateCastMemberRequestSerializer(
+            data=request.data, many=True, max_length=BULK_MAX_ITEMS
+        )
+        request_serializer.is_valid(raise_exception=True)
+        use_case = CreateCastMembers(
+            repository=CachingRepository(DjangoORMCastMemberRepository())
+        )
+        input = CreateCastMembers.Input(
+            items=[
+                CreateCastMember.Input(**item)
+                for item in request_serializer.validated_data
+            ]
+        )
+        try:
+            output = use_case.execute(input)
+        except InvalidCastMembersDataException as err:
+            return Response(
+                data={"error": str(err), "errors": err.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(
+            data=render_create_cast_members_response(output),
+            status=status.HTTP_201_CREATED,
+        )
+
+    @bulk.mapping.delete
+    def bulk_destroy(self, request: Request) -> Response:
+        request_serializer = BulkDeleteCastMemberRequestSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        use_case = DeleteCastMembers(
+            repository=CachingRepository(DjangoORMCastMemberRepository())
+        )
+        output = use_case.execute(
+            DeleteCastMembers.Input(ids=set(request_serializer.validated_data["ids"]))
+        )
+        return Response(
+            data=BulkDeleteCastMemberResponseSerializer(output).data,
+            status=status.HTTP_200_OK,
+        )
+
     def update(self, request: Request, pk: UUID) -> Response:
         request_serializers = UpdateCastMemberRequestSerializer(
             data={**request.data, "id": pk}
         )
         request_serializers.is_valid(raise_exception=True)
-        repository = DjangoORMCastMemberRepository()
+        repository = CachingRepository(DjangoORMCastMemberRepository())
         use_case = UpdateCastMember(repository=repository)
-        input = UpdateCastMember.Input(**request_serializers.validated_data)
+        input = UpdateCastMember.Input(
+            **request_serializers.validated_data,
+            version=if_match_version(request),
+        )
         try:
             output = use_case.execute(input)
             response_serializer = UpdateCastMemberResponseSerializer(instance=output)
-            return Response(data=response_serializer.data, status=status.HTTP_200_OK)
+            return Response(
+                data=response_serializer.data,
+                status=status.HTTP_200_OK,
+                headers={"ETag": etag_for_version(output.version)},
+            )
         except InvalidCastMemberDataException as err:
             return Response(
                 data={"error": str(err)}, status=status.HTTP_400_BAD_REQUEST
             )
         except CastMemberNotFoundException as err:
             return Response(data={"error": str(err)}, status=status.HTTP_404_NOT_FOUND)
+        except CastMemberVersionConflictException as err:
+            return Response(
+                data={"error": str(err)}, status=status.HTTP_412_PRECONDITION_FAILED
+            )
 
     def partial_update(self, request: Request, pk: UUID) -> Response:
         request_serializers = PartialUpdateCastMemberRequestSerializer(
             data={**request.data, "id": pk}
         )
         request_serializers.is_valid(raise_exception=True)
-        repository = DjangoORMCastMemberRepository()
+        repository = CachingRepository(DjangoORMCastMemberRepository())
         use_case = UpdateCastMember(repository=repository)
-        input = UpdateCastMember.Input(**request_serializers.validated_data)
+        input = UpdateCastMember.Input(
+            **request_serializers.validated_data,
+            version=if_match_version(request),
+        )
         try:
             output = use_case.execute(input)
             response_serializer = PartialUpdateCastMemberResponseSerializer(
                 instance=output
             )
-            return Response(data=response_serializer.data, status=status.HTTP_200_OK)
+            return Response(
+                data=response_serializer.data,
+                status=status.HTTP_200_OK,
+                headers={"ETag": etag_for_version(output.version)},
+            )
         except InvalidCastMemberDataException as err:
             return Response(
                 data={"error": str(err)}, status=status.HTTP_400_BAD_REQUEST
             )
         except CastMemberNotFoundException as err:
             return Response(data={"error": str(err)}, status=status.HTTP_404_NOT_FOUND)
+        except CastMemberVersionConflictException as err:
+            return Response(
+                data={"error": str(err)}, status=status.HTTP_412_PRECONDITION_FAILED
+            )
 
     def destroy(self, request: Request, pk: UUID) -> Response:
         request_serializer = DeleteCastMemberRequestSerializer(data={"id": pk})
         request_serializer.is_valid(raise_exception=True)
-        repository = DjangoORMCastMemberRepository()
+        repository = CachingRepository(DjangoORMCastMemberRepository())
         use_case = DeleteCastMember(repository=repository)
         input = DeleteCastMember.Input(**request_serializer.validated_data)
         try:
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-18 18:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("category_app", "0003_category_category_name_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -10,11 +10,16 @@ class Category(models.Model):
     name = models.CharField(max_length=255)
     description = models.TextField()
     is_active = models.BooleanField(default=True)
+    version = models.PositiveIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         db_table = "category"
         verbose_name_plural = "Categories"
         verbose_name = "Category"
+        indexes = [
+            models.Index(fields=["name", "id"], name="category_name_id_idx"),
+        ]
 
     def __str__(self):
         return self.name
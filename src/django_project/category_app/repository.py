@@ -1,13 +1,29 @@
+from typing import Iterator
 from uuid import UUID
 
 from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
 
+from src.core._shared.pagination import Cursor, Page
+from src.django_project._shared.caching import (
+    bump_list_generation,
+    touch_dependents,
+)
+from src.django_project._shared.pagination import seek
 from src.django_project.category_app.models import Category as CategoryModel
+from src.django_project.genre_app.models import Genre as GenreModel
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+from src.django_project.video_app.models import Video as VideoModel
+from src.django_project.video_app.repository import DjangoORMVideoRepository
 from src.core.category.domain.category import Category
-from src.core.category.domain.category_repository import CategoryRepository
+from src.core.category.domain.category_repository import (
+    AsyncCategoryRepository,
+    CategoryRepository,
+)
 
 
-class DjangoORMCategoryRepository(CategoryRepository):
+class DjangoORMCategoryRepository(CategoryRepository, AsyncCategoryRepository):
     def __init__(self, category_model: CategoryModel | None = None):
         self.category_model = category_model or CategoryModel
 
@@ -17,8 +33,25 @@ class DjangoORMCategoryRepository(CategoryRepository):
             self.category_model,
         )
         category_model.save()
+        bump_list_generation("categories")
         return CategoryModelMapper.from_model_to_entity(category_model)
 
+    def save_many(self, categories: list[Category]) -> list[Category]:
+        with transaction.atomic():
+            category_models = self.category_model.objects.bulk_create(
+                [
+                    CategoryModelMapper.from_entity_to_model(
+                        category, self.category_model
+                    )
+                    for category in categories
+                ]
+            )
+        bump_list_generation("categories")
+        return [
+            CategoryModelMapper.from_model_to_entity(category_model)
+            for category_model in category_models
+        ]
+
     def get_by_id(self, id: UUID) -> Category | None:
         try:
             category = self.category_model.objects.get(id=id)
@@ -26,8 +59,102 @@ class DjangoORMCategoryRepository(CategoryRepository):
         except self.category_model.DoesNotExist:
             return None
 
+    async def aget_by_id(self, id: UUID) -> Category | None:
+        try:
+            category = await self.category_model.objects.aget(id=id)
+        except self.category_model.DoesNotExist:
+            return None
+        return CategoryModelMapper.from_model_to_entity(category)
+
+    def find_existing_ids(self, ids: set[UUID]) -> set[UUID]:
+        if not ids:
+            return set()
+        return set(
+            self.category_model.objects.filter(id__in=ids).values_list("id", flat=True)
+        )
+
     def delete(self, id: UUID) -> None:
-        self.category_model.objects.filter(id=id).delete()
+        with transaction.atomic():
+            # Genres and videos lose the category through the cascade, so
+            # their representation changes too.
+            touch_dependents(
+                GenreModel.objects.filter(categories=id),
+                DjangoORMGenreRepository.__name__,
+            )
+            touch_dependents(
+                VideoModel.objects.filter(categories=id),
+                DjangoORMVideoRepository.__name__,
+            )
+            self.category_model.objects.filter(id=id).delete()
+        # The delete cascades to genre and video relations.
+        bump_list_generation("categories", "genres", "videos")
+
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        with transaction.atomic():
+            existing_ids = self.find_existing_ids(ids)
+            if not existing_ids:
+                return existing_ids
+            touch_dependents(
+                GenreModel.objects.filter(categories__in=existing_ids),
+                DjangoORMGenreRepository.__name__,
+            )
+            touch_dependents(
+                VideoModel.objects.filter(categories__in=existing_ids),
+                DjangoORMVideoRepository.__name__,
+            )
+            self.category_model.objects.filter(id__in=existing_ids).delete()
+        bump_list_generation("categories", "genres", "videos")
+        return existing_ids
+
+    def list_page(self, order_by: str, offset: int, limit: int) -> Page[Category]:
+        categories = self.category_model.objects.order_by(order_by, "id")[
+            offset : offset + limit
+        ]
+        return Page(
+            items=[
+                CategoryModelMapper.from_model_to_entity(category)
+                for category in categories
+            ],
+            total_items=self.category_model.objects.count(),
+        )
+
+    def list_after(
+        self, order_by: str, cursor: Cursor | None, limit: int
+    ) -> list[Category]:
+        queryset = seek(self.category_model.objects.all(), order_by, cursor)
+        return [
+            CategoryModelMapper.from_model_to_entity(category)
+            for category in queryset[:limit]
+        ]
+
+    async def alist_page(
+        self, order_by: str, offset: int, limit: int
+    ) -> Page[Category]:
+        categories = self.category_model.objects.order_by(order_by, "id")[
+            offset : offset + limit
+        ]
+        return Page(
+            items=[
+                CategoryModelMapper.from_model_to_entity(category)
+                async for category in categories
+            ],
+            total_items=await self.category_model.objects.acount(),
+        )
+
+    async def alist_after(
+        self, order_by: str, cursor: Cursor | None, limit: int
+    ) -> list[Category]:
+        queryset = seek(self.category_model.objects.all(), order_by, cursor)
+        return [
+            CategoryModelMapper.from_model_to_entity(category)
+            async for category in queryset[:limit]
+        ]
+
+    def iterate(self, chunk_size: int) -> Iterator[Category]:
+        for category in self.category_model.objects.order_by("id").iterator(
+            chunk_size=chunk_size
+        ):
+            yield CategoryModelMapper.from_model_to_entity(category)
 
     def list(self) -> list[Category]:
         return [
@@ -36,28 +163,35 @@ class DjangoORMCategoryRepository(CategoryRepository):
         ]
 
     def update(self, category: Category) -> Category | None:
-        try:
-            with transaction.atomic():
-                persisted_category = (
-                    self.category_model.objects.select_for_update().get(id=category.id)
-                )
-                update_fields = {
-                    "name": category.name,
-                    "description": category.description,
-                    "is_active": category.is_active,
-                }
-                self.category_model.objects.filter(id=category.id).update(
-                    **update_fields
-                )
-                persisted_category.refresh_from_db()
-                return Category(
-                    id=persisted_category.id,
-                    name=persisted_category.name,
-                    is_active=persisted_category.is_active,
-                    description=persisted_category.description,
-                )
-        except self.category_model.DoesNotExist:
+        updated_at = timezone.now()
+        updated_rows = self.category_model.objects.filter(
+            id=category.id,
+            version=category.version,
+        ).update(
+            name=category.name,
+            description=category.description,
+            is_active=category.is_active,
+            version=F("version") + 1,
+            updated_at=updated_at,
+        )
+        if not updated_rows:
             return None
+        bump_list_generation("categories")
+        category.version += 1
+        category.updated_at = updated_at
+        return category
+
+    def update_many(self, ids: set[UUID], is_active: bool) -> set[UUID]:
+        with transaction.atomic():
+            existing_ids = self.find_existing_ids(ids)
+            self.category_model.objects.filter(id__in=existing_ids).update(
+                is_active=is_active,
+                version=F("version") + 1,
+                updated_at=timezone.now(),
+            )
+        if existing_ids:
+            bump_list_generation("categories")
+        return existing_ids
 
 
 class CategoryModelMapper:
@@ -68,13 +202,16 @@ class CategoryModelMapper:
             name=category.name,
             description=category.description,
             is_active=category.is_active,
+            version=category.version,
         )
 
     @staticmethod
     def from_model_to_entity(category_model: CategoryModel) -> Category:
-        return Category(
+        return Category.reconstitute(
             id=category_model.id,
             name=category_model.name,
             description=category_model.description,
             is_active=category_model.is_active,
+            version=category_model.version,
+            updated_at=category_model.updated_at,
         )
@@ -1,5 +1,8 @@
 from rest_framework import serializers
 
+from src.django_project._shared.bulk import BULK_MAX_ITEMS
+from src.django_project._shared.fast_serializers import compile_serializer
+
 
 class CategorySerializer(serializers.Serializer):
     id = serializers.UUIDField()
@@ -14,6 +17,20 @@ class CreateCategoryRequestSerializer(serializers.Serializer):
     is_active = serializers.BooleanField(default=True)
 
 
+class CreateCategoriesResponseSerializer(serializers.Serializer):
+    data = CategorySerializer(many=True)
+
+
+class ListCategoryRequestSerializer(serializers.Serializer):
+    order_by = serializers.ChoiceField(
+        choices=["id", "name", "description", "is_active"],
+        default="name",
+    )
+    current_page = serializers.IntegerField(min_value=1, default=1)
+    page_size = serializers.IntegerField(min_value=1, max_value=100, default=2)
+    cursor = serializers.CharField(required=False, allow_blank=True)
+
+
 class ListCategoryMetaSerializer(serializers.Serializer):
     current_page = serializers.IntegerField()
     page_size = serializers.IntegerField()
@@ -26,6 +43,16 @@ class ListCategoryResponseSerializer(serializers.Serializer):
     meta = ListCategoryMetaSerializer()
 
 
+class ListCategoryCursorMetaSerializer(serializers.Serializer):
+    page_size = serializers.IntegerField()
+    next_cursor = serializers.CharField(allow_null=True)
+
+
+class ListCategoryCursorResponseSerializer(serializers.Serializer):
+    data = CategorySerializer(many=True)
+    meta = ListCategoryCursorMetaSerializer()
+
+
 class RetrieveCategoryRequestSerializer(serializers.Serializer):
     id = serializers.UUIDField()
 
@@ -62,3 +89,39 @@ class PartialUpdateCategoryResponseSerializer(serializers.Serializer):
 
 class DeleteCategoryRequestSerializer(serializers.Serializer):
     id = serializers.UUIDField()
+
+
+class BulkDeleteCategoryRequestSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.UUIDField(), allow_empty=False, max_length=BULK_MAX_ITEMS
+    )
+
+
+class BulkDeleteCategoryResponseSerializer(serializers.Serializer):
+    deleted_ids = serializers.ListField(child=serializers.UUIDField())
+    missing_ids = serializers.ListField(child=serializers.UUIDField())
+
+
+class BulkPartialUpdateCategoryRequestSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.UUIDField(), allow_empty=False, max_length=BULK_MAX_ITEMS
+    )
+    is_active = serializers.BooleanField()
+
+
+class BulkPartialUpdateCategoryResponseSerializer(serializers.Serializer):
+    updated_ids = serializers.ListField(child=serializers.UUIDField())
+    missing_ids = serializers.ListField(child=serializers.UUIDField())
+
+
+render_category = compile_serializer(CategorySerializer)
+render_list_category_response = compile_serializer(ListCategoryResponseSerializer)
+render_list_category_cursor_response = compile_serializer(
+    ListCategoryCursorResponseSerializer
+)
+render_create_categories_response = compile_serializer(
+    CreateCategoriesResponseSerializer
+)
+render_retrieve_category_response = compile_serializer(
+    RetrieveCategoryResponseSerializer
+)
@@ -1,5 +1,9 @@
+import uuid
+
 import pytest
+from asgiref.sync import async_to_sync
 
+from src.core._shared.pagination import Cursor
 from src.django_project.category_app.models import Category as CategoryModel
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
 from src.core.category.domain.category import Category
@@ -22,6 +26,21 @@ class TestSaveCategory:
         assert response.description == category.description
         assert response.is_active == category.is_active
 
+    @pytest.mark.django_db
+    def test_save_many_inserts_all_categories_in_one_statement(
+        self, django_assert_num_queries
+    ):
+        categories = [Category(name=f"Category {index}") for index in range(50)]
+        repository = DjangoORMCategoryRepository()
+
+        # Savepoint, the INSERT and the savepoint release.
+        with django_assert_num_queries(3):
+            saved_categories = repository.save_many(categories)
+
+        assert saved_categories == categories
+        assert all(category.updated_at for category in saved_categories)
+        assert CategoryModel.objects.count() == 50
+
     @pytest.mark.django_db
     def test_list_categories_from_database(self):
         category_filme = CategoryModel.objects.create(
@@ -46,6 +65,38 @@ class TestSaveCategory:
         assert category_serie_from_db.description == category_serie.description
         assert category_serie_from_db.is_active == category_serie.is_active
 
+    @pytest.mark.django_db
+    def test_list_category_page_from_database(self):
+        category_serie = CategoryModel.objects.create(name="Serie", description="")
+        category_filme = CategoryModel.objects.create(name="Filme", description="")
+        category_anime = CategoryModel.objects.create(name="Anime", description="")
+        repository = DjangoORMCategoryRepository(category_model=CategoryModel)
+        first_page = repository.list_page(order_by="name", offset=0, limit=2)
+        second_page = repository.list_page(order_by="name", offset=2, limit=2)
+        assert [category.id for category in first_page.items] == [
+            category_anime.id,
+            category_filme.id,
+        ]
+        assert first_page.total_items == 3
+        assert [category.id for category in second_page.items] == [category_serie.id]
+        assert second_page.total_items == 3
+
+    @pytest.mark.django_db
+    def test_list_categories_after_cursor_from_database(self):
+        category_filme = CategoryModel.objects.create(name="Filme", description="")
+        category_serie = CategoryModel.objects.create(name="Serie", description="")
+        category_anime = CategoryModel.objects.create(name="Anime", description="")
+        repository = DjangoORMCategoryRepository(category_model=CategoryModel)
+        categories = repository.list_after(
+            order_by="name",
+            cursor=Cursor(value=category_anime.name, id=category_anime.id),
+            limit=10,
+        )
+        assert [category.id for category in categories] == [
+            category_filme.id,
+            category_serie.id,
+        ]
+
     @pytest.mark.django_db
     def test_get_category_by_id_from_database(self):
         category_filme = CategoryModel.objects.create(
@@ -60,6 +111,13 @@ class TestSaveCategory:
             assert category.description == category_filme.description
             assert category.is_active == category_filme.is_active
 
+    @pytest.mark.django_db
+    def test_find_existing_category_ids_in_database(self):
+        category_filme = CategoryModel.objects.create(name="Filme", description="")
+        repository = DjangoORMCategoryRepository(category_model=CategoryModel)
+        existing_ids = repository.find_existing_ids({category_filme.id, uuid.uuid4()})
+        assert existing_ids == {category_filme.id}
+
     @pytest.mark.django_db
     def test_update_category_in_database(self):
         category_filme = CategoryModel.objects.create(
@@ -78,6 +136,45 @@ class TestSaveCategory:
         assert response.description == category.description
         assert response.is_active == category.is_active
 
+    @pytest.mark.django_db
+    def test_update_category_issues_a_single_query(self, django_assert_num_queries):
+        category_filme = CategoryModel.objects.create(
+            name="Filme",
+            description="Filme description",
+        )
+        repository = DjangoORMCategoryRepository(category_model=CategoryModel)
+        category = Category(id=category_filme.id, name="Filme updated")
+        with django_assert_num_queries(1):
+            repository.update(category)
+        category_filme.refresh_from_db()
+        assert category_filme.name == "Filme updated"
+
+    @pytest.mark.django_db
+    def test_update_category_returns_none_when_category_does_not_exist(self):
+        repository = DjangoORMCategoryRepository(category_model=CategoryModel)
+        assert repository.update(Category(name="Filme")) is None
+
+    @pytest.mark.django_db
+    def test_update_category_increments_version(self):
+        category_filme = CategoryModel.objects.create(name="Filme")
+        repository = DjangoORMCategoryRepository(category_model=CategoryModel)
+        category = repository.get_by_id(category_filme.id)
+        category.update_category(name="Filme updated", description="")
+        response = repository.update(category)
+        assert response.version == 2
+        category_filme.refresh_from_db()
+        assert category_filme.version == 2
+
+    @pytest.mark.django_db
+    def test_update_category_returns_none_when_version_is_stale(self):
+        category_filme = CategoryModel.objects.create(name="Filme", version=2)
+        repository = DjangoORMCategoryRepository(category_model=CategoryModel)
+        stale_category = Category(id=category_filme.id, name="Filme updated", version=1)
+        assert repository.update(stale_category) is None
+        category_filme.refresh_from_db()
+        assert category_filme.name == "Filme"
+        assert category_filme.version == 2
+
     @pytest.mark.django_db
     def test_delete_category_in_database(self):
         category_filme = CategoryModel.objects.create(
@@ -88,3 +185,86 @@ class TestSaveCategory:
         assert CategoryModel.objects.count() == 1
         repository.delete(category_filme.id)
         assert CategoryModel.objects.count() == 0
+
+
+@pytest.mark.django_db
+class TestBulkWrites:
+    def test_delete_many_deletes_existing_ids_in_one_statement(
+        self, django_assert_num_queries
+    ):
+        repository = DjangoORMCategoryRepository()
+        categories = repository.save_many(
+            [Category(name=f"Category {index}") for index in range(5)]
+        )
+        ids = {category.id for category in categories[:3]}
+        missing_id = uuid.uuid4()
+
+        # Existence check, parent touches and Django's cascade collection: a
+        # fixed number of statements however many ids are deleted.
+        with django_assert_num_queries(9) as captured:
+            deleted_ids = repository.delete_many(ids | {missing_id})
+
+        assert deleted_ids == ids
+        assert CategoryModel.objects.count() == 2
+        deletes = [
+            query["sql"]
+            for query in captured.captured_queries
+            if query["sql"].startswith('DELETE FROM "category"')
+        ]
+        assert len(deletes) == 1
+
+    def test_delete_many_does_not_write_when_nothing_exists(
+        self, django_assert_num_queries
+    ):
+        # Savepoint, the existence check and the savepoint release.
+        with django_assert_num_queries(3):
+            assert DjangoORMCategoryRepository().delete_many({uuid.uuid4()}) == set()
+
+    def test_update_many_sets_is_active_and_bumps_versions(self):
+        repository = DjangoORMCategoryRepository()
+        movie, series = repository.save_many(
+            [Category(name="Movie"), Category(name="Series")]
+        )
+
+        updated_ids = repository.update_many({movie.id, uuid.uuid4()}, is_active=False)
+
+        assert updated_ids == {movie.id}
+        deactivated = repository.get_by_id(movie.id)
+        assert deactivated.is_active is False
+        assert deactivated.version == movie.version + 1
+        assert deactivated.updated_at > movie.updated_at
+        assert repository.get_by_id(series.id).is_active is True
+
+
+@pytest.mark.django_db
+class TestAsyncReads:
+    def test_aget_by_id_returns_category_or_none(self):
+        repository = DjangoORMCategoryRepository()
+        category = repository.save(Category(name="Movie"))
+
+        assert async_to_sync(repository.aget_by_id)(category.id) == category
+        assert async_to_sync(repository.aget_by_id)(uuid.uuid4()) is None
+
+    def test_alist_page_returns_page_and_total(self):
+        repository = DjangoORMCategoryRepository()
+        for name in ["Series", "Documentary", "Movie"]:
+            repository.save(Category(name=name))
+
+        page = async_to_sync(repository.alist_page)(order_by="name", offset=1, limit=1)
+
+        assert [category.name for category in page.items] == ["Movie"]
+        assert page.total_items == 3
+
+    def test_alist_after_seeks_past_the_cursor(self):
+        repository = DjangoORMCategoryRepository()
+        for name in ["Series", "Documentary", "Movie"]:
+            repository.save(Category(name=name))
+        first = async_to_sync(repository.alist_after)(
+            order_by="name", cursor=None, limit=1
+        )[0]
+
+        categories = async_to_sync(repository.alist_after)(
+            order_by="name", cursor=Cursor(value=first.name, id=first.id), limit=5
+        )
+
+        assert [category.name for category in categories] == ["Movie", "Series"]
@@ -1,12 +1,16 @@
+import json
 import uuid
 
 import pytest
+from django.core.cache import caches
 from rest_framework import status
 from rest_framework.fields import ErrorDetail
 from rest_framework.test import APIClient
 
 from src.core.category.domain.category import Category
+from src.core.genre.domain.genre import Genre
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
 
 
 @pytest.mark.django_db
@@ -101,6 +105,86 @@ class TestListCategoriesAPI(CommonTestFixtures):
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["data"]) == 0
 
+    def test_list_categories_second_page(self, client: APIClient, create_category):
+        create_category(name="Movies", description="Movies category")
+        create_category(name="Documentary", description="Documentary category")
+        category_series = create_category(name="Series", description="Series category")
+        response = client.get(path="/api/categories/", data={"current_page": 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"] == [
+            {
+                "id": str(category_series.id),
+                "name": category_series.name,
+                "description": category_series.description,
+                "is_active": category_series.is_active,
+            }
+        ]
+        assert response.data["meta"] == {
+            "current_page": 2,
+            "page_size": 2,
+            "total_items": 3,
+            "total_pages": 2,
+        }
+
+    def test_list_categories_with_invalid_order_by_returns_400(self, client: APIClient):
+        response = client.get(path="/api/categories/", data={"order_by": "unknown"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "order_by" in response.data
+
+    def test_list_categories_with_cursor(self, client: APIClient, create_category):
+        category_movies = create_category(name="Movies", description="Movies")
+        category_documentary = create_category(name="Documentary", description="Docs")
+        category_series = create_category(name="Series", description="Series")
+
+        first_response = client.get(path="/api/categories/", data={"cursor": ""})
+        assert first_response.status_code == status.HTTP_200_OK
+        assert [category["id"] for category in first_response.data["data"]] == [
+            str(category_documentary.id),
+            str(category_movies.id),
+        ]
+        next_cursor = first_response.data["meta"]["next_cursor"]
+        assert next_cursor is not None
+
+        second_response = client.get(
+            path="/api/categories/", data={"cursor": next_cursor}
+        )
+        assert second_response.status_code == status.HTTP_200_OK
+        assert [category["id"] for category in second_response.data["data"]] == [
+            str(category_series.id),
+        ]
+        assert second_response.data["meta"] == {"page_size": 2, "next_cursor": None}
+
+    def test_list_categories_with_invalid_cursor_returns_400(self, client: APIClient):
+        response = client.get(path="/api/categories/", data={"cursor": "invalid"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestExportCategoriesAPI(CommonTestFixtures):
+    def test_streams_every_category_as_ndjson(self, create_category, client):
+        categories = [create_category(f"Category {i}", "") for i in range(5)]
+
+        response = client.get("/api/categories/export/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert "categories.ndjson" in response["Content-Disposition"]
+        lines = b"".join(response.streaming_content).splitlines()
+        assert sorted(map(json.loads, lines), key=lambda row: row["id"]) == sorted(
+            (
+                {
+                    "id": str(category.id),
+                    "name": category.name,
+                    "description": "",
+                    "is_active": True,
+                }
+                for category in categories
+            ),
+            key=lambda row: row["id"],
+        )
+
 
 class TestRetrieveCategoryAPI(CommonTestFixtures):
     def test_retrieve_category_when_id_is_not_a_valid_uuid(self, client: APIClient):
@@ -141,6 +225,7 @@ class TestRetrieveCategoryAPI(CommonTestFixtures):
 
         assert response.data == expected_response
         assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] == '"1"'
 
     def test_return_404_when_category_not_exists(
         self,
@@ -198,6 +283,44 @@ class TestCreateCategoryAPI(CommonTestFixtures):
         assert response.status_code == status.HTTP_201_CREATED
 
 
+class TestBulkCreateCategoryAPI(CommonTestFixtures):
+    def test_creates_every_category_in_the_payload(self, client, category_repository):
+        response = client.post(
+            "/api/categories/bulk/",
+            [
+                {"name": "Movie", "description": "Movies"},
+                {"name": "Series", "description": "Series"},
+            ],
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [item["name"] for item in response.data["data"]] == ["Movie", "Series"]
+        assert {category.name for category in category_repository.list()} == {
+            "Movie",
+            "Series",
+        }
+
+    def test_returns_errors_per_item_and_creates_nothing(
+        self, client, category_repository
+    ):
+        response = client.post(
+            "/api/categories/bulk/",
+            [
+                {"name": "Movie", "description": "Movies"},
+                {"name": "", "description": "Blank name"},
+                {"description": "No name"},
+            ],
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data[0] == {}
+        assert "name" in response.data[1]
+        assert "name" in response.data[2]
+        assert category_repository.list() == []
+
+
 class TestUpdateCategoryAPI(CommonTestFixtures):
     def test_update_category_when_payload_is_invalid_returns_400(
         self, client: APIClient, create_category
@@ -240,6 +363,41 @@ class TestUpdateCategoryAPI(CommonTestFixtures):
         }
         assert response.data == expected_response
         assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] == '"2"'
+
+    def test_update_category_with_matching_if_match_returns_200(
+        self, client: APIClient, create_category
+    ):
+        category = create_category(name="Movies", description="Movies category")
+        category_path = f"/api/categories/{category.id}/"
+        etag = client.get(path=category_path).headers["ETag"]
+        payload = {"name": "Movies updated", "description": "Movies category"}
+        response = client.put(
+            path=category_path, data=payload, format="json", HTTP_IF_MATCH=etag
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] == '"2"'
+
+    def test_update_category_with_stale_if_match_returns_412(
+        self, client: APIClient, create_category
+    ):
+        category = create_category(name="Movies", description="Movies category")
+        category_path = f"/api/categories/{category.id}/"
+        etag = client.get(path=category_path).headers["ETag"]
+        payload = {"name": "Movies updated", "description": "Movies category"}
+        client.put(path=category_path, data=payload, format="json")
+        response = client.put(
+            path=category_path,
+            data={"name": "Lost update", "description": "Movies category"},
+            format="json",
+            HTTP_IF_MATCH=etag,
+        )
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        assert response.data == {
+            "detail": f"Can not update category with id: {category.id}. "
+            "Expected version 1, found 2."
+        }
+        assert client.get(path=category_path).data["data"]["name"] == "Movies updated"
 
     def test_return_404_when_category_not_exists(
         self,
@@ -303,6 +461,65 @@ class TestPartialUpdateCategoryAPI(CommonTestFixtures):
         assert response.data == expected_response
         assert response.status_code == status.HTTP_200_OK
 
+    def test_partial_update_with_weak_if_match_returns_412(
+        self,
+        client: APIClient,
+        create_category,
+    ):
+        category = create_category(name="Movies", description="Movies category")
+        category_path = f"/api/categories/{category.id}/"
+        response = client.patch(
+            path=category_path,
+            data={"name": "Movies updated"},
+            format="json",
+            HTTP_IF_MATCH='W/"1"',
+        )
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+
+class TestBulkDeleteAndPartialUpdateCategoryAPI(CommonTestFixtures):
+    def test_bulk_delete_reports_missing_ids(
+        self, client, create_category, category_repository
+    ):
+        movie = create_category("Movie", "Movies")
+        series = create_category("Series", "Series")
+        missing_id = uuid.uuid4()
+
+        response = client.delete(
+            "/api/categories/bulk/",
+            {"ids": [str(movie.id), str(missing_id)]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "deleted_ids": [str(movie.id)],
+            "missing_ids": [str(missing_id)],
+        }
+        assert [category.id for category in category_repository.list()] == [series.id]
+
+    def test_bulk_partial_update_deactivates_categories(
+        self, client, create_category, category_repository
+    ):
+        movie = create_category("Movie", "Movies")
+        series = create_category("Series", "Series")
+
+        response = client.patch(
+            "/api/categories/bulk/",
+            {"ids": [str(movie.id), str(series.id)], "is_active": False},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data["updated_ids"]) == {str(movie.id), str(series.id)}
+        assert response.data["missing_ids"] == []
+        assert not any(category.is_active for category in category_repository.list())
+
+    def test_bulk_delete_requires_ids(self, client):
+        response = client.delete("/api/categories/bulk/", {"ids": []}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
 
 class TestDeleteCategoryAPI(CommonTestFixtures):
     def test_delete_category_when_id_is_not_a_valid_uuid(self, client: APIClient):
@@ -343,3 +560,147 @@ class TestDeleteCategoryAPI(CommonTestFixtures):
             "detail": f"Can not delete Category with id: {non_existing_category_id}. Category not found."
         }
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestCategoryEntityCache(CommonTestFixtures):
+    def test_retrieve_after_update_returns_fresh_category(
+        self, client: APIClient, create_category, django_assert_num_queries
+    ):
+        category = create_category(name="Movies", description="Movies category")
+        category_path = f"/api/categories/{category.id}/"
+        client.get(path=category_path)
+        with django_assert_num_queries(0):
+            client.get(path=category_path)
+        client.patch(path=category_path, data={"name": "Films"}, format="json")
+        response = client.get(path=category_path)
+        assert response.data["data"]["name"] == "Films"
+        assert response.headers["ETag"] == '"2"'
+
+    def test_retrieve_after_delete_returns_404(
+        self, client: APIClient, create_category
+    ):
+        category = create_category(name="Movies", description="Movies category")
+        category_path = f"/api/categories/{category.id}/"
+        client.get(path=category_path)
+        client.delete(path=category_path)
+        response = client.get(path=category_path)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_deleting_a_category_refreshes_cached_genres(
+        self, client: APIClient, create_category, django_capture_on_commit_callbacks
+    ):
+        category = create_category(name="Movies", description="Movies category")
+        genre = DjangoORMGenreRepository().save(
+            Genre(name="Drama", categories={category.id})
+        )
+        genre_path = f"/api/genres/{genre.id}/"
+        assert client.get(genre_path).headers["ETag"] == '"1"'
+
+        with django_capture_on_commit_callbacks(execute=True):
+            client.delete(f"/api/categories/{category.id}/")
+        response = client.get(genre_path)
+
+        assert response.data["data"]["categories"] == []
+        assert response.headers["ETag"] == '"2"'
+        update = client.put(
+            genre_path,
+            data={"name": "Drama", "is_active": True, "categories": []},
+            format="json",
+        )
+        assert update.status_code == status.HTTP_200_OK
+
+    def test_repeated_404_does_not_query_database(
+        self, client: APIClient, django_assert_num_queries
+    ):
+        category_path = f"/api/categories/{uuid.uuid4()}/"
+        assert client.get(path=category_path).status_code == 404
+        with django_assert_num_queries(0):
+            assert client.get(path=category_path).status_code == 404
+            assert client.delete(path=category_path).status_code == 404
+
+
+class TestCategoryListResponseCache(CommonTestFixtures):
+    def test_repeated_list_is_served_without_queries(
+        self, client: APIClient, create_category, django_assert_num_queries
+    ):
+        create_category(name="Movies", description="Movies category")
+        first_response = client.get("/api/categories/")
+        with django_assert_num_queries(0):
+            second_response = client.get("/api/categories/?page_size=2")
+        assert second_response.status_code == status.HTTP_200_OK
+        assert second_response.data == first_response.data
+
+    def test_write_invalidates_cached_list(self, client: APIClient, create_category):
+        create_category(name="Movies", description="Movies category")
+        client.get("/api/categories/")
+        create_category(name="Documentary", description="Documentary category")
+        response = client.get("/api/categories/")
+        assert [category["name"] for category in response.data["data"]] == [
+            "Documentary",
+            "Movies",
+        ]
+
+
+class TestCategoryConditionalGet(CommonTestFixtures):
+    def test_retrieve_returns_304_when_etag_matches(
+        self, client: APIClient, create_category
+    ):
+        category = create_category(name="Movies", description="Movies category")
+        category_path = f"/api/categories/{category.id}/"
+        response = client.get(category_path)
+        assert "Last-Modified" in response.headers
+        response = client.get(
+            category_path, HTTP_IF_NONE_MATCH=response.headers["ETag"]
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["ETag"] == '"1"'
+
+    def test_retrieve_returns_200_after_category_changes(
+        self, client: APIClient, create_category
+    ):
+        category = create_category(name="Movies", description="Movies category")
+        category_path = f"/api/categories/{category.id}/"
+        etag = client.get(category_path).headers["ETag"]
+        client.patch(category_path, data={"name": "Films"}, format="json")
+        response = client.get(category_path, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["name"] == "Films"
+
+    def test_retrieve_honours_if_modified_since(
+        self, client: APIClient, create_category
+    ):
+        category = create_category(name="Movies", description="Movies category")
+        category_path = f"/api/categories/{category.id}/"
+        last_modified = client.get(category_path).headers["Last-Modified"]
+        response = client.get(category_path, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_list_returns_304_from_one_aggregate_query(
+        self, client: APIClient, create_category, django_assert_num_queries
+    ):
+        create_category(name="Movies", description="Movies category")
+        etag = client.get("/api/categories/").headers["ETag"]
+        caches["responses"].clear()
+        with django_assert_num_queries(1):
+            response = client.get("/api/categories/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_list_etag_depends_on_query_params(
+        self, client: APIClient, create_category
+    ):
+        create_category(name="Movies", description="Movies category")
+        first_page = client.get("/api/categories/")
+        second_page = client.get("/api/categories/?current_page=2")
+        assert first_page.headers["ETag"] != second_page.headers["ETag"]
+
+    def test_list_etag_changes_after_delete(self, client: APIClient, create_category):
+        create_category(name="Movies", description="Movies category")
+        documentary = create_category(
+            name="Documentary", description="Documentary category"
+        )
+        etag = client.get("/api/categories/").headers["ETag"]
+        client.delete(f"/api/categories/{documentary.id}/")
+        response = client.get("/api/categories/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
@@ -1,76 +1,156 @@
-from rest_framework import viewsets
+from django.http import StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.gzip import gzip_page
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import status
 
+from src.core._shared.pagination import InvalidCursorException
 from src.core.category.application.use_cases.create_category import (
+    CreateCategories,
+    CreateCategoriesInput,
     CreateCategory,
     CreateCategoryInput,
 )
-from src.core.category.application.use_cases.exceptions import CategoryNotFoundException
+from src.core.category.application.use_cases.exceptions import (
+    CategoryNotFoundException,
+    CategoryVersionConflictException,
+    InvalidCategoriesDataException,
+)
 from src.core.category.application.use_cases.get_category import (
     GetCategory,
     GetCategoryInput,
 )
 from src.core.category.application.use_cases.list_category import (
     ListCategory,
+    ListCategoryWithCursor,
 )
 from src.core.category.application.use_cases.update_category import (
+    UpdateCategories,
+    UpdateCategoriesInput,
     UpdateCategory,
     UpdateCategoryInput,
 )
 from src.core.category.application.use_cases.delete_category import (
+    DeleteCategories,
+    DeleteCategoriesInput,
     DeleteCategory,
     DeleteCategoryInput,
 )
+from src.django_project._shared.async_views import AsyncViewSet
+from src.django_project._shared.bulk import BULK_MAX_ITEMS
+from src.django_project._shared.caching import CachingRepository
+from src.django_project._shared.conditional import (
+    aconditional_list_response,
+    entity_validators,
+    not_modified,
+)
+from src.django_project._shared.etags import etag_for_version, if_match_version
+from src.django_project._shared.export import EXPORT_CHUNK_SIZE, ndjson_response
+from src.django_project.category_app.models import Category as CategoryModel
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
 from src.django_project.category_app.serializers import (
+    BulkDeleteCategoryRequestSerializer,
+    BulkDeleteCategoryResponseSerializer,
+    BulkPartialUpdateCategoryRequestSerializer,
+    BulkPartialUpdateCategoryResponseSerializer,
     CreateCategoryRequestSerializer,
     CreateCategoryResponseSerializer,
     DeleteCategoryRequestSerializer,
-    ListCategoryResponseSerializer,
+    ListCategoryRequestSerializer,
     PartialUpdateCategoryRequestSerializer,
     PartialUpdateCategoryResponseSerializer,
     RetrieveCategoryRequestSerializer,
-    RetrieveCategoryResponseSerializer,
     UpdateCategoryRequestSerializer,
     UpdateCategoryResponseSerializer,
+    render_category,
+    render_create_categories_response,
+    render_list_category_cursor_response,
+    render_list_category_response,
+    render_retrieve_category_response,
 )
 
 
 # Create your views here.
-class CategoryViewSet(viewsets.ViewSet):
-    def list(self, request: Request) -> Response:
-        order_by = request.query_params.get("order_by", "name")
-        current_page = request.query_params.get("current_page", 1)
-        input = ListCategory.Input(order_by=order_by, current_page=current_page)
-        repository = DjangoORMCategoryRepository()
+class CategoryViewSet(AsyncViewSet):
+    async def list(self, request: Request) -> Response:
+        request_serializer = ListCategoryRequestSerializer(data=request.query_params)
+        request_serializer.is_valid(raise_exception=True)
+        return await aconditional_list_response(
+            request,
+            "categories",
+            request_serializer.validated_data,
+            CategoryModel.objects.all(),
+            self._list,
+        )
+
+    async def _list(self, params) -> Response:
+        repository = CachingRepository(DjangoORMCategoryRepository())
+        if "cursor" in params:
+            return await self._list_with_cursor(repository, params)
+        input = ListCategory.Input(
+            order_by=params["order_by"],
+            current_page=params["current_page"],
+            page_size=params["page_size"],
+        )
         use_case = ListCategory(repository)
-        output = use_case.execute(input)
-        serializer = ListCategoryResponseSerializer(instance=output)
+        output = await use_case.aexecute(input)
+        return Response(
+            status=status.HTTP_200_OK,
+            data=render_list_category_response(output),
+        )
+
+    async def _list_with_cursor(self, repository, params) -> Response:
+        input = ListCategoryWithCursor.Input(
+            order_by=params["order_by"],
+            cursor=params["cursor"],
+            page_size=params["page_size"],
+        )
+        use_case = ListCategoryWithCursor(repository)
+        try:
+            output = await use_case.aexecute(input)
+        except InvalidCursorException as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         return Response(
             status=status.HTTP_200_OK,
-            data=serializer.data,
+            data=render_list_category_cursor_response(output),
         )
 
-    def retrieve(self, request: Request, pk=None) -> Response:
+    @action(detail=False, methods=["get"])
+    @method_decorator(gzip_page)
+    def export(self, request: Request) -> StreamingHttpResponse:
+        return ndjson_response(
+            DjangoORMCategoryRepository().iterate(chunk_size=EXPORT_CHUNK_SIZE),
+            render_category,
+            "categories",
+        )
+
+    async def retrieve(self, request: Request, pk=None) -> Response:
         request_serializer = RetrieveCategoryRequestSerializer(data={"id": pk})
         request_serializer.is_valid(raise_exception=True)
-        repository = DjangoORMCategoryRepository()
+        repository = CachingRepository(DjangoORMCategoryRepository())
         use_case = GetCategory(repository)
         input = GetCategoryInput(id=request_serializer.validated_data["id"])
 
         try:
-            output = use_case.execute(input)
-            category_serializer = RetrieveCategoryResponseSerializer(instance=output)
-            return Response(category_serializer.data, status=status.HTTP_200_OK)
+            output = await use_case.aexecute(input)
         except CategoryNotFoundException as e:
             return Response({"detail": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        validators = entity_validators(output)
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+        return validators.apply(
+            Response(
+                render_retrieve_category_response(output), status=status.HTTP_200_OK
+            )
+        )
 
     def create(self, request: Request) -> Response:
         request_serializer = CreateCategoryRequestSerializer(data=request.data)
         request_serializer.is_valid(raise_exception=True)
-        repository = DjangoORMCategoryRepository()
+        repository = CachingRepository(DjangoORMCategoryRepository())
         use_case = CreateCategory(repository)
         input = CreateCategoryInput(
             **request_serializer.validated_data,
@@ -85,6 +165,61 @@ class CategoryViewSet(viewsets.ViewSet):
         response_serializer = CreateCategoryResponseSerializer(instance=output)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
+    @action(detail=False, methods=["post"])
+    def bulk(self, request: Request) -> Response:
+        request_serializer = CreateCategoryRequestSerializer(
+            data=request.data, many=True, max_length=BULK_MAX_ITEMS
+        )
+        request_serializer.is_valid(raise_exception=True)
+        use_case = CreateCategories(CachingRepository(DjangoORMCategoryRepository()))
+        input = CreateCategoriesInput(
+            items=[
+                CreateCategoryInput(**item)
+                for item in request_serializer.validated_data
+            ]
+        )
+        try:
+            output = use_case.execute(input)
+        except InvalidCategoriesDataException as e:
+            return Response(
+                {"detail": str(e), "errors": e.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(
+            render_create_categories_response(output), status=status.HTTP_201_CREATED
+        )
+
+    @bulk.mapping.patch
+    def bulk_partial_update(self, request: Request) -> Response:
+        request_serializer = BulkPartialUpdateCategoryRequestSerializer(
+            data=request.data
+        )
+        request_serializer.is_valid(raise_exception=True)
+        use_case = UpdateCategories(CachingRepository(DjangoORMCategoryRepository()))
+        output = use_case.execute(
+            UpdateCategoriesInput(
+                ids=set(request_serializer.validated_data["ids"]),
+                is_active=request_serializer.validated_data["is_active"],
+            )
+        )
+        return Response(
+            BulkPartialUpdateCategoryResponseSerializer(output).data,
+            status=status.HTTP_200_OK,
+        )
+
+    @bulk.mapping.delete
+    def bulk_destroy(self, request: Request) -> Response:
+        request_serializer = BulkDeleteCategoryRequestSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        use_case = DeleteCategories(CachingRepository(DjangoORMCategoryRepository()))
+        output = use_case.execute(
+            DeleteCategoriesInput(ids=set(request_serializer.validated_data["ids"]))
+        )
+        return Response(
+            BulkDeleteCategoryResponseSerializer(output).data,
+            status=status.HTTP_200_OK,
+        )
+
     def update(self, request: Request, pk=None) -> Response:
         request_payload_serializer = UpdateCategoryRequestSerializer(
             data={
@@ -93,16 +228,24 @@ class CategoryViewSet(viewsets.ViewSet):
             }
         )
         request_payload_serializer.is_valid(raise_exception=True)
-        repository = DjangoORMCategoryRepository()
+        repository = CachingRepository(DjangoORMCategoryRepository())
         use_case = UpdateCategory(repository)
-        input = UpdateCategoryInput(**request_payload_serializer.validated_data)
+        input = UpdateCategoryInput(
+            **request_payload_serializer.validated_data,
+            version=if_match_version(request),
+        )
         try:
             output = use_case.execute(input)
         except CategoryNotFoundException as e:
             return Response({"detail": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except CategoryVersionConflictException as e:
+            return Response(
+                {"detail": str(e)}, status=status.HTTP_412_PRECONDITION_FAILED
+            )
         return Response(
             status=status.HTTP_200_OK,
             data=UpdateCategoryResponseSerializer(output).data,
+            headers={"ETag": etag_for_version(output.version)},
         )
 
     def partial_update(self, request: Request, pk=None) -> Response:
@@ -113,22 +256,30 @@ class CategoryViewSet(viewsets.ViewSet):
             }
         )
         serializer.is_valid(raise_exception=True)
-        repository = DjangoORMCategoryRepository()
+        repository = CachingRepository(DjangoORMCategoryRepository())
         use_case = UpdateCategory(repository)
-        input = UpdateCategoryInput(**serializer.validated_data)
+        input = UpdateCategoryInput(
+            **serializer.validated_data,
+            version=if_match_version(request),
+        )
         try:
             output = use_case.execute(input)
         except CategoryNotFoundException as e:
             return Response({"detail": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except CategoryVersionConflictException as e:
+            return Response(
+                {"detail": str(e)}, status=status.HTTP_412_PRECONDITION_FAILED
+            )
         return Response(
             PartialUpdateCategoryResponseSerializer(output).data,
             status=status.HTTP_200_OK,
+            headers={"ETag": etag_for_version(output.version)},
         )
 
     def destroy(self, request: Request, pk=None) -> Response:
         request_serializer = DeleteCategoryRequestSerializer(data={"id": pk})
         request_serializer.is_valid(raise_exception=True)
-        repository = DjangoORMCategoryRepository()
+        repository = CachingRepository(DjangoORMCategoryRepository())
         use_case = DeleteCategory(repository)
         input = DeleteCategoryInput(id=request_serializer.validated_data["id"])
         try:
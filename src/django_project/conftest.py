@@ -0,0 +1,9 @@
+import pytest
+from django.core.cache import caches
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    # Cached entities and responses must not outlive the test database.
+    for cache in caches.all():
+        cache.clear()
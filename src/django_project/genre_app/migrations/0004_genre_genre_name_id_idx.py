@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-18 18:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("category_app", "0003_category_category_name_id_idx"),
+        ("genre_app", "0003_alter_genre_categories"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="genre",
+            index=models.Index(fields=["name", "id"], name="genre_name_id_idx"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-18 18:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("genre_app", "0004_genre_genre_name_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="genre",
+            name="version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -8,12 +8,17 @@ class Genre(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4)
     name = models.CharField(max_length=255)
     is_active = models.BooleanField(default=True)
+    version = models.PositiveIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     categories = models.ManyToManyField("category_app.Category", related_name="genres")
 
     class Meta:
         db_table = "genre"
         verbose_name_plural = "Genres"
         verbose_name = "Genre"
+        indexes = [
+            models.Index(fields=["name", "id"], name="genre_name_id_idx"),
+        ]
 
     def __str__(self):
         return self.name
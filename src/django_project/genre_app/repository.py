@@ -1,13 +1,29 @@
+from collections import defaultdict
+from typing import Iterator
 from uuid import UUID
 
 from django.db import transaction
+from django.db.models import F, QuerySet
+from django.utils import timezone
 
+from src.core._shared.pagination import Cursor
 from src.core.genre.domain.genre import Genre
-from src.core.genre.domain.genre_repository import GenreRepository
+from src.core.genre.domain.genre_repository import (
+    AsyncGenreRepository,
+    GenreRepository,
+)
+from src.django_project._shared.caching import (
+    bump_list_generation,
+    touch_dependents,
+)
+from src.django_project._shared.export import chunked
+from src.django_project._shared.pagination import seek
 from src.django_project.genre_app.models import Genre as GenreModel
+from src.django_project.video_app.models import Video as VideoModel
+from src.django_project.video_app.repository import DjangoORMVideoRepository
 
 
-class DjangoORMGenreRepository(GenreRepository):
+class DjangoORMGenreRepository(GenreRepository, AsyncGenreRepository):
     def __init__(self, genre_model: GenreModel | None = None):
         self.genre_model = genre_model or GenreModel
 
@@ -17,61 +33,267 @@ class DjangoORMGenreRepository(GenreRepository):
                 id=genre.id,
                 name=genre.name,
                 is_active=genre.is_active,
+                version=genre.version,
+                updated_at=genre.updated_at,
             )
             persisted_genre.categories.set(genre.categories)
+        bump_list_generation("genres")
         return Genre(
             id=persisted_genre.id,
             name=persisted_genre.name,
             is_active=persisted_genre.is_active,
             categories=persisted_genre.categories.all(),
+            version=persisted_genre.version,
+            updated_at=persisted_genre.updated_at,
         )
 
+    def save_many(self, genres: list[Genre]) -> list[Genre]:
+        with transaction.atomic():
+            genre_models = self.genre_model.objects.bulk_create(
+                [
+                    self.genre_model(
+                        id=genre.id,
+                        name=genre.name,
+                        is_active=genre.is_active,
+                        version=genre.version,
+                    )
+                    for genre in genres
+                ]
+            )
+            self.genre_model.categories.through.objects.bulk_create(
+                [
+                    self.genre_model.categories.through(
+                        genre_id=genre.id, category_id=category_id
+                    )
+                    for genre in genres
+                    for category_id in genre.categories
+                ]
+            )
+        bump_list_generation("genres")
+        for genre, genre_model in zip(genres, genre_models):
+            genre.updated_at = genre_model.updated_at
+        return genres
+
     def get_by_id(self, id: UUID) -> Genre | None:
         try:
             genre = self.genre_model.objects.get(id=id)
         except self.genre_model.DoesNotExist:
             return None
-        return Genre(
+        return Genre.reconstitute(
             id=genre.id,
             name=genre.name,
             is_active=genre.is_active,
-            categories={category.id for category in genre.categories.all()},
+            categories=set(
+                self._genre_categories()
+                .filter(genre_id=genre.id)
+                .values_list("category_id", flat=True)
+            ),
+            version=genre.version,
+            updated_at=genre.updated_at,
+        )
+
+    async def aget_by_id(self, id: UUID) -> Genre | None:
+        try:
+            genre = await self.genre_model.objects.aget(id=id)
+        except self.genre_model.DoesNotExist:
+            return None
+        return Genre.reconstitute(
+            id=genre.id,
+            name=genre.name,
+            is_active=genre.is_active,
+            categories={
+                category_id
+                async for category_id in self._genre_categories()
+                .filter(genre_id=genre.id)
+                .values_list("category_id", flat=True)
+            },
+            version=genre.version,
+            updated_at=genre.updated_at,
+        )
+
+    def find_existing_ids(self, ids: set[UUID]) -> set[UUID]:
+        if not ids:
+            return set()
+        return set(
+            self.genre_model.objects.filter(id__in=ids).values_list("id", flat=True)
         )
 
     def delete(self, id: UUID) -> None:
-        self.genre_model.objects.filter(id=id).delete()
+        with transaction.atomic():
+            touch_dependents(
+                VideoModel.objects.filter(genres=id),
+                DjangoORMVideoRepository.__name__,
+            )
+            self.genre_model.objects.filter(id=id).delete()
+        bump_list_generation("genres", "videos")
+
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        with transaction.atomic():
+            existing_ids = self.find_existing_ids(ids)
+            if not existing_ids:
+                return existing_ids
+            touch_dependents(
+                VideoModel.objects.filter(genres__in=existing_ids),
+                DjangoORMVideoRepository.__name__,
+            )
+            self.genre_model.objects.filter(id__in=existing_ids).delete()
+        bump_list_generation("genres", "videos")
+        return existing_ids
+
+    def list_after(
+        self, order_by: str, cursor: Cursor | None, limit: int
+    ) -> list[Genre]:
+        genres = list(seek(self.genre_model.objects.all(), order_by, cursor)[:limit])
+        category_ids_by_genre = self._category_ids_by_genre(
+            self._genre_categories().filter(genre_id__in=[genre.id for genre in genres])
+        )
+        return [
+            Genre.reconstitute(
+                id=genre.id,
+                name=genre.name,
+                is_active=genre.is_active,
+                categories=category_ids_by_genre[genre.id],
+                version=genre.version,
+                updated_at=genre.updated_at,
+            )
+            for genre in genres
+        ]
+
+    async def alist_after(
+        self, order_by: str, cursor: Cursor | None, limit: int
+    ) -> list[Genre]:
+        genres = [
+            genre
+            async for genre in seek(self.genre_model.objects.all(), order_by, cursor)[
+                :limit
+            ]
+        ]
+        category_ids_by_genre = await self._acategory_ids_by_genre(
+            self._genre_categories().filter(genre_id__in=[genre.id for genre in genres])
+        )
+        return [
+            Genre.reconstitute(
+                id=genre.id,
+                name=genre.name,
+                is_active=genre.is_active,
+                categories=category_ids_by_genre[genre.id],
+                version=genre.version,
+                updated_at=genre.updated_at,
+            )
+            for genre in genres
+        ]
+
+    async def alist(self) -> list[Genre]:
+        category_ids_by_genre = await self._acategory_ids_by_genre(
+            self._genre_categories()
+        )
+        return [
+            Genre.reconstitute(
+                id=genre.id,
+                name=genre.name,
+                is_active=genre.is_active,
+                categories=category_ids_by_genre[genre.id],
+                version=genre.version,
+                updated_at=genre.updated_at,
+            )
+            async for genre in self.genre_model.objects.all()
+        ]
+
+    def iterate(self, chunk_size: int) -> Iterator[Genre]:
+        genres = self.genre_model.objects.order_by("id").iterator(chunk_size=chunk_size)
+        # Categories are looked up per chunk so only one chunk is held at once.
+        for chunk in chunked(genres, chunk_size):
+            category_ids_by_genre = self._category_ids_by_genre(
+                self._genre_categories().filter(
+                    genre_id__in=[genre.id for genre in chunk]
+                )
+            )
+            for genre in chunk:
+                yield Genre.reconstitute(
+                    id=genre.id,
+                    name=genre.name,
+                    is_active=genre.is_active,
+                    categories=category_ids_by_genre[genre.id],
+                    version=genre.version,
+                    updated_at=genre.updated_at,
+                )
 
     def list(self) -> list[Genre]:
+        category_ids_by_genre = self._category_ids_by_genre(self._genre_categories())
         return [
-            Genre(
+            Genre.reconstitute(
                 id=genre.id,
                 name=genre.name,
                 is_active=genre.is_active,
-                categories={category.id for category in genre.categories.all()},
+                categories=category_ids_by_genre[genre.id],
+                version=genre.version,
+                updated_at=genre.updated_at,
             )
             for genre in self.genre_model.objects.all()
         ]
 
     def update(self, genre: Genre) -> Genre | None:
-        try:
-            with transaction.atomic():
-                persisted_genre = self.genre_model.objects.select_for_update().get(
-                    id=genre.id
-                )
-                update_fields = {
-                    "name": genre.name,
-                    "is_active": genre.is_active,
-                }
-                self.genre_model.objects.filter(id=genre.id).update(**update_fields)
-                persisted_genre.categories.set(genre.categories)
-                persisted_genre.refresh_from_db()
-                return Genre(
-                    id=persisted_genre.id,
-                    name=persisted_genre.name,
-                    is_active=persisted_genre.is_active,
-                    categories={
-                        category.id for category in persisted_genre.categories.all()
-                    },
-                )
-        except self.genre_model.DoesNotExist:
-            return None
+        updated_at = timezone.now()
+        with transaction.atomic():
+            updated_rows = self.genre_model.objects.filter(
+                id=genre.id,
+                version=genre.version,
+            ).update(
+                name=genre.name,
+                is_active=genre.is_active,
+                version=F("version") + 1,
+                updated_at=updated_at,
+            )
+            if not updated_rows:
+                return None
+            self._genre_categories().filter(genre_id=genre.id).exclude(
+                category_id__in=genre.categories
+            ).delete()
+            self.genre_model.categories.through.objects.bulk_create(
+                [
+                    self.genre_model.categories.through(
+                        genre_id=genre.id, category_id=category_id
+                    )
+                    for category_id in genre.categories
+                ],
+                ignore_conflicts=True,
+            )
+        bump_list_generation("genres")
+        genre.version += 1
+        genre.updated_at = updated_at
+        return genre
+
+    def update_many(self, ids: set[UUID], is_active: bool) -> set[UUID]:
+        with transaction.atomic():
+            existing_ids = self.find_existing_ids(ids)
+            self.genre_model.objects.filter(id__in=existing_ids).update(
+                is_active=is_active,
+                version=F("version") + 1,
+                updated_at=timezone.now(),
+            )
+        if existing_ids:
+            bump_list_generation("genres")
+        return existing_ids
+
+    def _genre_categories(self) -> QuerySet:
+        return self.genre_model.categories.through.objects.all()
+
+    def _category_ids_by_genre(
+        self, genre_categories: QuerySet
+    ) -> dict[UUID, set[UUID]]:
+        category_ids_by_genre = defaultdict(set)
+        for genre_id, category_id in genre_categories.values_list(
+            "genre_id", "category_id"
+        ):
+            category_ids_by_genre[genre_id].add(category_id)
+        return category_ids_by_genre
+
+    async def _acategory_ids_by_genre(
+        self, genre_categories: QuerySet
+    ) -> dict[UUID, set[UUID]]:
+        category_ids_by_genre = defaultdict(set)
+        async for genre_id, category_id in genre_categories.values_list(
+            "genre_id", "category_id"
+        ):
+            category_ids_by_genre[genre_id].add(category_id)
+        return category_ids_by_genre
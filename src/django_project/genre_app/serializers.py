@@ -1,5 +1,8 @@
 from rest_framework import serializers
 
+from src.django_project._shared.bulk import BULK_MAX_ITEMS
+from src.django_project._shared.fast_serializers import compile_serializer
+
 
 class GenreSerializer(serializers.Serializer):
     id = serializers.UUIDField()
@@ -8,10 +11,29 @@ class GenreSerializer(serializers.Serializer):
     categories = serializers.ListField(child=serializers.UUIDField())
 
 
+class ListGenreRequestSerializer(serializers.Serializer):
+    order_by = serializers.ChoiceField(
+        choices=["id", "name", "is_active"],
+        default="name",
+    )
+    page_size = serializers.IntegerField(min_value=1, max_value=100, default=2)
+    cursor = serializers.CharField(required=False, allow_blank=True)
+
+
 class ListGenreResponseSerializer(serializers.Serializer):
     data = GenreSerializer(many=True)
 
 
+class ListGenreCursorMetaSerializer(serializers.Serializer):
+    page_size = serializers.IntegerField()
+    next_cursor = serializers.CharField(allow_null=True)
+
+
+class ListGenreCursorResponseSerializer(serializers.Serializer):
+    data = GenreSerializer(many=True)
+    meta = ListGenreCursorMetaSerializer()
+
+
 class RetrieveGenreRequestSerializer(serializers.Serializer):
     id = serializers.UUIDField()
 
@@ -45,6 +67,10 @@ class CreateGenreResponseSerializer(serializers.Serializer):
     categories = serializers.ListField(child=serializers.UUIDField())
 
 
+class CreateGenresResponseSerializer(serializers.Serializer):
+    data = CreateGenreResponseSerializer(many=True)
+
+
 class UpdateGenreRequestSerializer(serializers.Serializer):
     id = serializers.UUIDField()
     name = serializers.CharField(max_length=100)
@@ -72,3 +98,35 @@ class PartialUpdateGenreResponseSerializer(UpdateGenreResponseSerializer):
 
 class DeleteGenreRequestSerializer(serializers.Serializer):
     id = serializers.UUIDField()
+
+
+class BulkDeleteGenreRequestSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.UUIDField(), allow_empty=False, max_length=BULK_MAX_ITEMS
+    )
+
+
+class BulkDeleteGenreResponseSerializer(serializers.Serializer):
+    deleted_ids = serializers.ListField(child=serializers.UUIDField())
+    missing_ids = serializers.ListField(child=serializers.UUIDField())
+
+
+class BulkPartialUpdateGenreRequestSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.UUIDField(), allow_empty=False, max_length=BULK_MAX_ITEMS
+    )
+    is_active = serializers.BooleanField()
+
+
+class BulkPartialUpdateGenreResponseSerializer(serializers.Serializer):
+    updated_ids = serializers.ListField(child=serializers.UUIDField())
+    missing_ids = serializers.ListField(child=serializers.UUIDField())
+
+
+render_genre = compile_serializer(GenreSerializer)
+render_list_genre_response = compile_serializer(ListGenreResponseSerializer)
+render_list_genre_cursor_response = compile_serializer(
+    ListGenreCursorResponseSerializer
+)
+render_create_genres_response = compile_serializer(CreateGenresResponseSerializer)
+render_retrieve_genre_response = compile_serializer(RetrieveGenreResponseSerializer)
@@ -1,5 +1,6 @@
 import uuid
 import pytest
+from asgiref.sync import async_to_sync
 
 from src.core.category.domain.category import Category
 from src.core.genre.domain.genre import Genre
@@ -47,6 +48,30 @@ class TestSave:
         assert category_adventure.id in categories
 
 
+@pytest.mark.django_db
+class TestSaveMany:
+    def test_inserts_genres_and_category_links_in_bulk(self, django_assert_num_queries):
+        category_repository = DjangoORMCategoryRepository()
+        category_action = category_repository.save(Category(name="Action"))
+        category_drama = category_repository.save(Category(name="Drama"))
+        genres = [
+            Genre(name=f"Genre {index}", categories={category_action.id})
+            for index in range(10)
+        ] + [Genre(name="Both", categories={category_action.id, category_drama.id})]
+        genre_repository = DjangoORMGenreRepository()
+
+        # Savepoint, one INSERT per table and the savepoint release.
+        with django_assert_num_queries(4):
+            genre_repository.save_many(genres)
+
+        assert GenreModel.objects.count() == 11
+        assert GenreModel.categories.through.objects.count() == 12
+        assert genre_repository.get_by_id(genres[-1].id).categories == {
+            category_action.id,
+            category_drama.id,
+        }
+
+
 @pytest.mark.django_db
 class TestGetById:
     def test_returns_genre_by_id(self):
@@ -56,12 +81,39 @@ class TestGetById:
         )
         assert genre_repository.get_by_id(genre.id) == genre
 
+    def test_returns_genre_with_category_ids(self):
+        category_repository = DjangoORMCategoryRepository()
+        category_action = category_repository.save(Category(name="Action"))
+        genre_repository = DjangoORMGenreRepository()
+        genre = genre_repository.save(
+            Genre(name="Action", is_active=True, categories={category_action.id})
+        )
+        assert genre_repository.get_by_id(genre.id).categories == {category_action.id}
+
     def test_returns_none_when_genre_does_not_exist(self):
         genre_repository = DjangoORMGenreRepository()
         non_existing_genre_id = uuid.uuid4()
         assert genre_repository.get_by_id(non_existing_genre_id) is None
 
 
+@pytest.mark.django_db
+class TestFindExistingIds:
+    def test_returns_only_persisted_ids(self, django_assert_num_queries):
+        genre_repository = DjangoORMGenreRepository()
+        genre = genre_repository.save(Genre(name="Action", categories=set()))
+        non_existing_genre_id = uuid.uuid4()
+        with django_assert_num_queries(1):
+            existing_ids = genre_repository.find_existing_ids(
+                {genre.id, non_existing_genre_id}
+            )
+        assert existing_ids == {genre.id}
+
+    def test_does_not_query_when_no_ids_are_given(self, django_assert_num_queries):
+        genre_repository = DjangoORMGenreRepository()
+        with django_assert_num_queries(0):
+            assert genre_repository.find_existing_ids(set()) == set()
+
+
 @pytest.mark.django_db
 class TestListGenres:
     def test_returns_list_of_genres(self):
@@ -78,6 +130,89 @@ class TestListGenres:
         genre_repository = DjangoORMGenreRepository()
         assert genre_repository.list() == []
 
+    @pytest.mark.parametrize("genres_count", [1, 5, 20])
+    def test_fetches_categories_with_a_fixed_number_of_queries(
+        self, genres_count, django_assert_num_queries
+    ):
+        category_repository = DjangoORMCategoryRepository()
+        category_action = category_repository.save(Category(name="Action"))
+        category_drama = category_repository.save(Category(name="Drama"))
+        genre_repository = DjangoORMGenreRepository()
+        for index in range(genres_count):
+            genre_repository.save(
+                Genre(
+                    name=f"Genre {index}",
+                    categories={category_action.id, category_drama.id},
+                )
+            )
+        with django_assert_num_queries(2):
+            genres = genre_repository.list()
+        assert len(genres) == genres_count
+        assert all(
+            genre.categories == {category_action.id, category_drama.id}
+            for genre in genres
+        )
+        with django_assert_num_queries(2):
+            genres_page = genre_repository.list_after(
+                order_by="name", cursor=None, limit=genres_count
+            )
+        assert {genre.id for genre in genres_page} == {genre.id for genre in genres}
+
+    def test_iterate_fetches_categories_once_per_chunk(self, django_assert_num_queries):
+        category = DjangoORMCategoryRepository().save(Category(name="Action"))
+        genre_repository = DjangoORMGenreRepository()
+        for index in range(5):
+            genre_repository.save(
+                Genre(name=f"Genre {index}", categories={category.id})
+            )
+
+        # One cursor over the genres, then one category query per chunk of 2.
+        with django_assert_num_queries(4):
+            genres = list(genre_repository.iterate(chunk_size=2))
+
+        assert len(genres) == 5
+        assert all(genre.categories == {category.id} for genre in genres)
+
+
+@pytest.mark.django_db
+class TestAsyncReads:
+    def test_aget_by_id_returns_genre_with_category_ids(self):
+        category = DjangoORMCategoryRepository().save(Category(name="Action"))
+        genre_repository = DjangoORMGenreRepository()
+        genre = genre_repository.save(Genre(name="Action", categories={category.id}))
+
+        found_genre = async_to_sync(genre_repository.aget_by_id)(genre.id)
+
+        assert found_genre == genre
+        assert found_genre.categories == {category.id}
+
+    def test_aget_by_id_returns_none_when_genre_does_not_exist(self):
+        genre_repository = DjangoORMGenreRepository()
+        assert async_to_sync(genre_repository.aget_by_id)(uuid.uuid4()) is None
+
+    def test_async_lists_match_sync_lists_with_the_same_queries(
+        self, django_assert_num_queries
+    ):
+        category = DjangoORMCategoryRepository().save(Category(name="Action"))
+        genre_repository = DjangoORMGenreRepository()
+        for index in range(3):
+            genre_repository.save(
+                Genre(name=f"Genre {index}", categories={category.id})
+            )
+
+        with django_assert_num_queries(2):
+            genres = async_to_sync(genre_repository.alist)()
+        with django_assert_num_queries(2):
+            genres_page = async_to_sync(genre_repository.alist_after)(
+                order_by="name", cursor=None, limit=2
+            )
+
+        assert genres == genre_repository.list()
+        assert genres_page == genre_repository.list_after(
+            order_by="name", cursor=None, limit=2
+        )
+        assert all(genre.categories == {category.id} for genre in genres)
+
 
 @pytest.mark.django_db
 class TestUpdate:
@@ -94,6 +229,24 @@ class TestUpdate:
         assert updated_genre.name == genre.name
         assert updated_genre.is_active == genre.is_active
 
+    def test_replaces_categories_without_reading_the_genre_back(
+        self, django_assert_max_num_queries
+    ):
+        category_repository = DjangoORMCategoryRepository()
+        category_action = category_repository.save(Category(name="Action"))
+        category_drama = category_repository.save(Category(name="Drama"))
+        genre_repository = DjangoORMGenreRepository()
+        genre = genre_repository.save(
+            Genre(name="Action", categories={category_action.id})
+        )
+        genre.categories = {category_drama.id}
+        with django_assert_max_num_queries(5) as captured:
+            genre_repository.update(genre)
+        assert not any(
+            query["sql"].startswith("SELECT") for query in captured.captured_queries
+        )
+        assert genre_repository.get_by_id(genre.id).categories == {category_drama.id}
+
     def test_returns_none_when_genre_does_not_exist(self):
         genre_repository = DjangoORMGenreRepository()
         non_existing_genre = Genre(
@@ -101,6 +254,16 @@ class TestUpdate:
         )
         assert genre_repository.update(non_existing_genre) is None
 
+    def test_does_not_update_genre_with_stale_version(self):
+        genre_repository = DjangoORMGenreRepository()
+        genre = genre_repository.save(Genre(name="Action", categories=set()))
+        concurrent_genre = genre_repository.get_by_id(genre.id)
+        concurrent_genre.change_name("Adventure")
+        assert genre_repository.update(concurrent_genre).version == 2
+        genre.change_name("Drama")
+        assert genre_repository.update(genre) is None
+        assert genre_repository.get_by_id(genre.id).name == "Adventure"
+
 
 @pytest.mark.django_db
 class TestDelete:
@@ -119,3 +282,17 @@ class TestDelete:
         assert GenreModel.objects.all().count() == 0
         genre_repository.delete(non_existing_genre_id)
         assert GenreModel.objects.all().count() == 0
+
+
+@pytest.mark.django_db
+class TestCategoryDeleteTouchesGenres:
+    def test_deleting_category_bumps_genre_version(self):
+        category_repository = DjangoORMCategoryRepository()
+        category = category_repository.save(Category(name="Action"))
+        genre_repository = DjangoORMGenreRepository()
+        genre = genre_repository.save(Genre(name="Action", categories={category.id}))
+        category_repository.delete(category.id)
+        updated_genre = genre_repository.get_by_id(genre.id)
+        assert updated_genre.categories == set()
+        assert updated_genre.version == 2
+        assert updated_genre.updated_at > genre.updated_at
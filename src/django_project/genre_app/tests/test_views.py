@@ -1,3 +1,5 @@
+import gzip
+import json
 import uuid
 import pytest
 from rest_framework import status
@@ -99,6 +101,61 @@ class TestListAPI(CommonFixtures):
         assert genre_drama_response["is_active"] == genre_drama.is_active
         assert genre_drama_response["categories"] == []
 
+    def test_list_genres_with_cursor(
+        self,
+        category_repository,
+        genre_repository,
+        genre_romance,
+        genre_drama,
+        client,
+    ):
+        list_genres_path = "/api/genres/"
+        first_response = client.get(
+            path=list_genres_path, data={"cursor": "", "page_size": 1}
+        )
+        assert first_response.status_code == status.HTTP_200_OK
+        assert [genre["id"] for genre in first_response.data["data"]] == [
+            str(genre_drama.id)
+        ]
+        second_response = client.get(
+            path=list_genres_path,
+            data={
+                "cursor": first_response.data["meta"]["next_cursor"],
+                "page_size": 1,
+            },
+        )
+        assert [genre["id"] for genre in second_response.data["data"]] == [
+            str(genre_romance.id)
+        ]
+        assert second_response.data["meta"] == {"page_size": 1, "next_cursor": None}
+
+
+class TestExportAPI(CommonFixtures):
+    def test_streams_one_genre_per_line(
+        self, category_repository, genre_repository, genre_romance, client
+    ):
+        response = client.get("/api/genres/export/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        genres = {genre["id"]: genre for genre in map(json.loads, lines)}
+        assert len(genres) == 2
+        assert genres[str(genre_romance.id)]["name"] == "Romance"
+        assert set(genres[str(genre_romance.id)]["categories"]) == {
+            str(category_id) for category_id in genre_romance.categories
+        }
+
+    def test_compresses_export_when_client_accepts_gzip(
+        self, category_repository, genre_repository, client
+    ):
+        response = client.get("/api/genres/export/", HTTP_ACCEPT_ENCODING="gzip")
+
+        assert response["Content-Encoding"] == "gzip"
+        body = gzip.decompress(b"".join(response.streaming_content))
+        assert len(body.splitlines()) == 2
+
 
 class TestRetrieveAPI(CommonFixtures):
     def test_retrieve_genre_successfully(
@@ -177,6 +234,45 @@ class TestCreateGenreAPI(CommonFixtures):
         }
 
 
+class TestBulkCreateGenreAPI(CommonFixtures):
+    def test_creates_genres_with_their_categories(
+        self, client, category_repository, category_movie
+    ):
+        response = client.post(
+            "/api/genres/bulk/",
+            [
+                {"name": "Action", "is_active": True, "categories": []},
+                {
+                    "name": "Drama",
+                    "is_active": True,
+                    "categories": [str(category_movie.id)],
+                },
+            ],
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        drama = response.data["data"][1]
+        assert drama["categories"] == [str(category_movie.id)]
+        assert DjangoORMGenreRepository().get_by_id(
+            uuid.UUID(drama["id"])
+        ).categories == {category_movie.id}
+
+    def test_reports_items_with_missing_categories(self, client):
+        response = client.post(
+            "/api/genres/bulk/",
+            [
+                {"name": "Action", "is_active": True, "categories": []},
+                {"name": "Drama", "is_active": True, "categories": [str(uuid.uuid4())]},
+            ],
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response.data["errors"]) == [1]
+        assert DjangoORMGenreRepository().list() == []
+
+
 class TestPartialUpdateAPI(CommonFixtures):
     def test_partial_update_genre(
         self,
@@ -204,6 +300,23 @@ class TestPartialUpdateAPI(CommonFixtures):
             str(category_documentary.id),
         }
 
+    def test_partial_update_genre_with_stale_if_match_returns_412(
+        self,
+        client,
+        category_repository,
+        genre_repository,
+        genre_romance,
+    ):
+        genre_path = f"/api/genres/{genre_romance.id}/"
+        etag = client.get(genre_path).headers["ETag"]
+        response = client.patch(genre_path, {"name": "Romantic"}, format="json")
+        assert response.headers["ETag"] == '"2"'
+        response = client.patch(
+            genre_path, {"name": "Lost update"}, format="json", HTTP_IF_MATCH=etag
+        )
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        assert client.get(genre_path).data["name"] == "Romantic"
+
     def test_partial_update_genre_with_non_existing_genre(self, client):
         non_existing_genre_id = uuid.uuid4()
         partial_update_path = f"/api/genres/{non_existing_genre_id}/"
@@ -282,6 +395,26 @@ class TestPartialUpdateAPI(CommonFixtures):
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+class TestBulkDeleteGenreAPI(CommonFixtures):
+    def test_deletes_genres_and_reports_missing_ids(
+        self, client, category_repository, genre_repository, genre_romance, genre_drama
+    ):
+        missing_id = uuid.uuid4()
+
+        response = client.delete(
+            "/api/genres/bulk/",
+            {"ids": [str(genre_romance.id), str(missing_id)]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "deleted_ids": [str(genre_romance.id)],
+            "missing_ids": [str(missing_id)],
+        }
+        assert [genre.id for genre in genre_repository.list()] == [genre_drama.id]
+
+
 class TestDeleteGenreAPI(CommonFixtures):
     def test_when_genre_does_not_exist_then_raise_404(self, client):
         non_existing_genre_id = uuid.uuid4()
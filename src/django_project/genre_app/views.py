@@ -1,50 +1,112 @@
 from uuid import UUID
 
-from rest_framework import viewsets
+from django.http import StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.gzip import gzip_page
+from rest_framework.decorators import action
 from rest_framework.views import Request, Response, status
 
+from src.core._shared.pagination import InvalidCursorException
 from src.core.category.application.use_cases.exceptions import CategoryNotFoundException
 from src.core.genre.application.exceptions import (
     GenreNotFoundException,
+    GenreVersionConflictException,
     InvalidGenreDataException,
+    InvalidGenresDataException,
     RelatedCategoriesNotFoundException,
 )
-from src.core.genre.application.use_cases.create_genre import CreateGenre
-from src.core.genre.application.use_cases.delete_genre import DeleteGenre
+from src.core.genre.application.use_cases.create_genre import CreateGenre, CreateGenres
+from src.core.genre.application.use_cases.delete_genre import DeleteGenre, DeleteGenres
 from src.core.genre.application.use_cases.get_genre import GetGenre
-from src.core.genre.application.use_cases.list_genre import ListGenre
-from src.core.genre.application.use_cases.update_genre import UpdateGenre
+from src.core.genre.application.use_cases.list_genre import (
+    ListGenre,
+    ListGenreWithCursor,
+)
+from src.core.genre.application.use_cases.update_genre import UpdateGenre, UpdateGenres
+from src.django_project._shared.async_views import AsyncViewSet
+from src.django_project._shared.bulk import BULK_MAX_ITEMS
+from src.django_project._shared.caching import CachingRepository
+from src.django_project._shared.conditional import (
+    aconditional_list_response,
+    entity_validators,
+    not_modified,
+)
+from src.django_project._shared.etags import etag_for_version, if_match_version
+from src.django_project._shared.export import EXPORT_CHUNK_SIZE, ndjson_response
+from src.django_project._shared.unit_of_work import UnitOfWork
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.genre_app.models import Genre as GenreModel
 from src.django_project.genre_app.repository import DjangoORMGenreRepository
 from src.django_project.genre_app.serializers import (
+    BulkDeleteGenreRequestSerializer,
+    BulkDeleteGenreResponseSerializer,
+    BulkPartialUpdateGenreRequestSerializer,
+    BulkPartialUpdateGenreResponseSerializer,
     CreateGenreRequestSerializer,
     CreateGenreResponseSerializer,
     DeleteGenreRequestSerializer,
-    ListGenreResponseSerializer,
+    ListGenreRequestSerializer,
     PartialUpdateGenreRequestSerializer,
     PartialUpdateGenreResponseSerializer,
     RetrieveGenreRequestSerializer,
-    RetrieveGenreResponseSerializer,
     UpdateGenreRequestSerializer,
     UpdateGenreResponseSerializer,
+    render_create_genres_response,
+    render_genre,
+    render_list_genre_cursor_response,
+    render_list_genre_response,
+    render_retrieve_genre_response,
 )
 
 
-class GenreViewSet(viewsets.ViewSet):
-    def list(self, request: Request) -> Response:
-        genre_repository = DjangoORMGenreRepository()
+class GenreViewSet(AsyncViewSet):
+    async def list(self, request: Request) -> Response:
+        request_serializer = ListGenreRequestSerializer(data=request.query_params)
+        request_serializer.is_valid(raise_exception=True)
+        return await aconditional_list_response(
+            request,
+            "genres",
+            request_serializer.validated_data,
+            GenreModel.objects.all(),
+            self._list,
+        )
+
+    async def _list(self, params) -> Response:
+        genre_repository = CachingRepository(DjangoORMGenreRepository())
+        if "cursor" in params:
+            return await self._list_with_cursor(genre_repository, params)
         use_case = ListGenre(repository=genre_repository)
         input = ListGenre.Input()
-        output = use_case.execute(input)
-        response_serializer = ListGenreResponseSerializer(output)
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        output = await use_case.aexecute(input)
+        return Response(render_list_genre_response(output), status=status.HTTP_200_OK)
+
+    async def _list_with_cursor(self, genre_repository, params) -> Response:
+        use_case = ListGenreWithCursor(repository=genre_repository)
+        input = ListGenreWithCursor.Input(**params)
+        try:
+            output = await use_case.aexecute(input)
+        except InvalidCursorException as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(
+            render_list_genre_cursor_response(output), status=status.HTTP_200_OK
+        )
+
+    @action(detail=False, methods=["get"])
+    @method_decorator(gzip_page)
+    def export(self, request: Request) -> StreamingHttpResponse:
+        return ndjson_response(
+            DjangoORMGenreRepository().iterate(chunk_size=EXPORT_CHUNK_SIZE),
+            render_genre,
+            "genres",
+        )
 
     def create(self, request):
         request_serializer = CreateGenreRequestSerializer(data=request.data)
         request_serializer.is_valid(raise_exception=True)
+        unit_of_work = UnitOfWork()
         use_case = CreateGenre(
-            genre_repository=DjangoORMGenreRepository(),
-            category_repository=DjangoORMCategoryRepository(),
+            genre_repository=unit_of_work.repository(DjangoORMGenreRepository()),
+            category_repository=unit_of_work.repository(DjangoORMCategoryRepository()),
         )
         input = CreateGenre.Input(
             name=request_serializer.validated_data["name"],
@@ -52,7 +114,8 @@ class GenreViewSet(viewsets.ViewSet):
             is_active=request_serializer.validated_data["is_active"],
         )
         try:
-            output = use_case.execute(input)
+            with unit_of_work:
+                output = use_case.execute(input)
         except (InvalidGenreDataException, RelatedCategoriesNotFoundException) as err:
             return Response(
                 data={"error": str(err)}, status=status.HTTP_400_BAD_REQUEST
@@ -61,21 +124,92 @@ class GenreViewSet(viewsets.ViewSet):
         response_serializer = CreateGenreResponseSerializer(instance=output)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
-    def retrieve(self, request, pk=None):
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        request_serializer = CreateGenreRequestSerializer(
+            data=request.data, many=True, max_length=BULK_MAX_ITEMS
+        )
+        request_serializer.is_valid(raise_exception=True)
+        use_case = CreateGenres(
+            genre_repository=DjangoORMGenreRepository(),
+            category_repository=DjangoORMCategoryRepository(),
+        )
+        input = CreateGenres.Input(
+            items=[
+                CreateGenre.Input(
+                    name=item["name"],
+                    category_ids=set(item["categories"]),
+                    is_active=item["is_active"],
+                )
+                for item in request_serializer.validated_data
+            ]
+        )
+        try:
+            output = use_case.execute(input)
+        except InvalidGenresDataException as err:
+            return Response(
+                data={"error": str(err), "errors": err.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(
+            render_create_genres_response(output), status=status.HTTP_201_CREATED
+        )
+
+    @bulk.mapping.patch
+    def bulk_partial_update(self, request):
+        request_serializer = BulkPartialUpdateGenreRequestSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        use_case = UpdateGenres(
+            repository=CachingRepository(DjangoORMGenreRepository())
+        )
+        output = use_case.execute(
+            UpdateGenres.Input(
+                ids=set(request_serializer.validated_data["ids"]),
+                is_active=request_serializer.validated_data["is_active"],
+            )
+        )
+        return Response(
+            BulkPartialUpdateGenreResponseSerializer(output).data,
+            status=status.HTTP_200_OK,
+        )
+
+    @bulk.mapping.delete
+    def bulk_destroy(self, request):
+        request_serializer = BulkDeleteGenreRequestSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        use_case = DeleteGenres(
+            repository=CachingRepository(DjangoORMGenreRepository())
+        )
+        output = use_case.execute(
+            DeleteGenres.Input(ids=set(request_serializer.validated_data["ids"]))
+        )
+        return Response(
+            BulkDeleteGenreResponseSerializer(output).data,
+            status=status.HTTP_200_OK,
+        )
+
+    async def retrieve(self, request, pk=None):
         request_serializer = RetrieveGenreRequestSerializer(data={"id": pk})
         request_serializer.is_valid(raise_exception=True)
-        repository = DjangoORMGenreRepository()
+        repository = CachingRepository(DjangoORMGenreRepository())
         use_case = GetGenre(repository=repository)
         input = GetGenre.Input(**request_serializer.validated_data)
         try:
-            output = use_case.execute(input)
+            output = await use_case.aexecute(input)
         except GenreNotFoundException as e:
             return Response(
                 {"detail": str(e)},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        response_serializer = RetrieveGenreResponseSerializer(instance=output.data)
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        validators = entity_validators(output.data)
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+        return validators.apply(
+            Response(
+                render_retrieve_genre_response(output.data), status=status.HTTP_200_OK
+            )
+        )
 
     def update(self, request, pk: UUID | None = None):
         request_serializer = UpdateGenreRequestSerializer(
@@ -85,21 +219,36 @@ class GenreViewSet(viewsets.ViewSet):
             }
         )
         request_serializer.is_valid(raise_exception=True)
-        repository = DjangoORMGenreRepository()
-        category_repository = DjangoORMCategoryRepository()
+        unit_of_work = UnitOfWork()
         use_case = UpdateGenre(
-            repository=repository, category_repository=category_repository
+            repository=unit_of_work.repository(
+                CachingRepository(DjangoORMGenreRepository())
+            ),
+            category_repository=unit_of_work.repository(DjangoORMCategoryRepository()),
+        )
+        input = UpdateGenre.Input(
+            **request_serializer.validated_data,
+            version=if_match_version(request),
         )
-        input = UpdateGenre.Input(**request_serializer.validated_data)
         try:
-            output = use_case.execute(input)
+            with unit_of_work:
+                output = use_case.execute(input)
         except GenreNotFoundException as e:
             return Response(
                 {"detail": str(e)},
                 status=status.HTTP_404_NOT_FOUND,
             )
+        except GenreVersionConflictException as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
         response_serializer = UpdateGenreResponseSerializer(instance=output)
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        return Response(
+            response_serializer.data,
+            status=status.HTTP_200_OK,
+            headers={"ETag": etag_for_version(output.version)},
+        )
 
     def partial_update(self, request, pk: UUID | None = None):
         request_serializer = PartialUpdateGenreRequestSerializer(
@@ -109,26 +258,41 @@ class GenreViewSet(viewsets.ViewSet):
             }
         )
         request_serializer.is_valid(raise_exception=True)
-        repository = DjangoORMGenreRepository()
-        category_repository = DjangoORMCategoryRepository()
+        unit_of_work = UnitOfWork()
         use_case = UpdateGenre(
-            repository=repository, category_repository=category_repository
+            repository=unit_of_work.repository(
+                CachingRepository(DjangoORMGenreRepository())
+            ),
+            category_repository=unit_of_work.repository(DjangoORMCategoryRepository()),
+        )
+        input = UpdateGenre.Input(
+            **request_serializer.validated_data,
+            version=if_match_version(request),
         )
-        input = UpdateGenre.Input(**request_serializer.validated_data)
         try:
-            output = use_case.execute(input)
+            with unit_of_work:
+                output = use_case.execute(input)
         except (GenreNotFoundException, CategoryNotFoundException) as e:
             return Response(
                 {"detail": str(e)},
                 status=status.HTTP_404_NOT_FOUND,
             )
+        except GenreVersionConflictException as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
         response_serializer = PartialUpdateGenreResponseSerializer(instance=output)
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        return Response(
+            response_serializer.data,
+            status=status.HTTP_200_OK,
+            headers={"ETag": etag_for_version(output.version)},
+        )
 
     def destroy(self, request: Request, pk: UUID | None = None) -> Response:
         request_serializer = DeleteGenreRequestSerializer(data={"id": pk})
         request_serializer.is_valid(raise_exception=True)
-        repository = DjangoORMGenreRepository()
+        repository = CachingRepository(DjangoORMGenreRepository())
         use_case = DeleteGenre(repository=repository)
         input = DeleteGenre.Input(**request_serializer.validated_data)
         try:
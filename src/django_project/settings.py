@@ -87,6 +87,51 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Read-through cache of catalog entities, see CachingRepository.
+    "entities": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "entities",
+        "TIMEOUT": 60,
+        "OPTIONS": {"MAX_ENTRIES": 10_000},
+    },
+    # List responses and their generation counters, see ListResponseCache.
+    "responses": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "responses",
+        "TIMEOUT": 300,
+        "OPTIONS": {"MAX_ENTRIES": 1_000},
+    },
+}
+
+# Worker threads that check a new video's categories, genres and cast members
+# concurrently (three covers one request). 0 runs the checks one after
+# another; keep it there on SQLite, which gains nothing from parallel reads.
+RELATED_ENTITY_CHECK_WORKERS = 0
+
+# Where uploaded media is stored, and the size of every chunk but an upload's
+# last. Chunks are streamed to disk, so this bounds request length, not memory.
+MEDIA_ROOT = BASE_DIR / "media"
+MEDIA_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+# Django REST framework
+# https://www.django-rest-framework.org/api-guide/settings/
+
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "src.django_project._shared.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-18 18:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="video",
+            name="version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.1 on 2026-10-18 19:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cast_member_app", "0004_castmember_updated_at"),
+        ("category_app", "0005_category_updated_at"),
+        ("genre_app", "0006_genre_updated_at"),
+        ("video_app", "0003_video_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(
+                fields=["published", "rating", "launch_year"],
+                name="video_published_rating_year",
+            ),
+        ),
+    ]
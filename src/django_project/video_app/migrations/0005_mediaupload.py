@@ -0,0 +1,57 @@
+# Generated by Django 5.0.1 on 2026-10-18 19:40
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video_app", "0004_video_video_published_rating_year"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MediaUpload",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "media_type",
+                    models.CharField(
+                        choices=[
+                            ("BANNER", "BANNER"),
+                            ("THUMBNAIL", "THUMBNAIL"),
+                            ("THUMBNAIL_HALF", "THUMBNAIL_HALF"),
+                            ("TRAILER", "TRAILER"),
+                            ("VIDEO", "VIDEO"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("name", models.CharField(max_length=150)),
+                ("size", models.BigIntegerField()),
+                ("chunk_size", models.PositiveIntegerField()),
+                ("offset", models.BigIntegerField(default=0)),
+                ("check_sum", models.CharField(blank=True, max_length=64)),
+                ("version", models.PositiveIntegerField(default=1)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "video",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="media_uploads",
+                        to="video_app.video",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -1,7 +1,7 @@
 from uuid import uuid4
 from django.db import models
 
-from src.core.video.domain.value_objects import MediaStatus, Rating
+from src.core.video.domain.value_objects import MediaStatus, MediaType, Rating
 
 
 class Video(models.Model):
@@ -13,6 +13,8 @@ class Video(models.Model):
     duration = models.DecimalField(max_digits=10, decimal_places=2)
     published = models.BooleanField(default=False)
     rating = models.CharField(max_length=10, choices=RATING_CHOICES)
+    version = models.PositiveIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     categories = models.ManyToManyField("category_app.Category", related_name="videos")
     genres = models.ManyToManyField("genre_app.Genre", related_name="videos")
     cast_members = models.ManyToManyField(
@@ -50,6 +52,16 @@ class Video(models.Model):
         on_delete=models.SET_NULL,
     )
 
+    class Meta:
+        indexes = [
+            # Storefront filters: equality on published, a rating set, then a
+            # launch year range.
+            models.Index(
+                fields=["published", "rating", "launch_year"],
+                name="video_published_rating_year",
+            ),
+        ]
+
 
 class ImageMedia(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
@@ -66,3 +78,21 @@ class AudioVideoMedia(models.Model):
     raw_location = models.CharField(max_length=255)
     encoded_location = models.CharField(max_length=255)
     status = models.CharField(max_length=255, choices=STATUS_CHOICE)
+
+
+class MediaUpload(models.Model):
+    MEDIA_TYPE_CHOICES = [
+        (media_type.name, media_type.name) for media_type in MediaType
+    ]
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    video = models.ForeignKey(
+        "Video", related_name="media_uploads", on_delete=models.CASCADE
+    )
+    media_type = models.CharField(max_length=20, choices=MEDIA_TYPE_CHOICES)
+    name = models.CharField(max_length=150)
+    size = models.BigIntegerField()
+    chunk_size = models.PositiveIntegerField()
+    offset = models.BigIntegerField(default=0)
+    check_sum = models.CharField(max_length=64, blank=True)
+    version = models.PositiveIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
@@ -1,62 +1,450 @@
+from collections import defaultdict
 from uuid import UUID
+
+from django.db import transaction
+from django.db.models import F, QuerySet
+from django.utils import timezone
+
+from src.core._shared.pagination import Page
+from src.core.video.domain.media_upload import MediaUpload
+from src.core.video.domain.media_upload_repository import MediaUploadRepository
+from src.core.video.domain.value_objects import (
+    AudioVideoMedia,
+    ImageMedia,
+    MediaStatus,
+    MediaType,
+    Rating,
+)
 from src.core.video.domain.video import Video
-from src.core.video.domain.video_repository import VideoRepository
-from src.django_project.video_app.models import Video as VideoModel
+from src.core.video.domain.video_repository import (
+    AsyncVideoRepository,
+    VideoFilter,
+    VideoRepository,
+)
+from src.django_project._shared.caching import bump_list_generation
+from src.django_project.video_app.models import (
+    AudioVideoMedia as AudioVideoMediaModel,
+    ImageMedia as ImageMediaModel,
+    MediaUpload as MediaUploadModel,
+    Video as VideoModel,
+)
+
+IMAGE_MEDIA_FIELDS = ("banner", "thumbnail", "thumbnail_half")
+AUDIO_VIDEO_MEDIA_FIELDS = ("trailer", "video")
+RELATED_ID_FIELDS = {
+    "categories": "category_id",
+    "genres": "genre_id",
+    "cast_members": "castmember_id",
+}
 
 
-class DjangoORMVideoRepository(VideoRepository):
+class DjangoORMVideoRepository(VideoRepository, AsyncVideoRepository):
     def __init__(self, model: VideoModel | None = None) -> None:
         self.model = model or VideoModel
 
     def save(self, video: Video) -> Video:
-        persisted_video = VideoModelMapper.from_entity_to_model(video)
-        return VideoModelMapper.from_model_to_entity(persisted_video)
+        """Insert the video in one transaction with a fixed number of statements.
+
+        One INSERT per kind of media it carries, one for the row, and one bulk
+        INSERT per non-empty relation, however many ids each relation holds.
+        """
+        persisted_video = VideoModelMapper.from_entity_to_model(video, self.model)
+        media = self._media_models(video)
+        with transaction.atomic():
+            self._insert_media(media.values())
+            for field, media_model in media.items():
+                setattr(persisted_video, field, media_model)
+            persisted_video.save(force_insert=True)
+            for field, id_field in RELATED_ID_FIELDS.items():
+                self._insert_links(video.id, field, id_field, getattr(video, field))
+        bump_list_generation("videos")
+        return VideoModelMapper.from_model_to_entity(
+            persisted_video,
+            categories=set(video.categories),
+            genres=set(video.genres),
+            cast_members=set(video.cast_members),
+        )
 
     def get_by_id(self, id: UUID) -> Video | None:
-        raise NotImplementedError
+        try:
+            video = self._videos().get(id=id)
+        except self.model.DoesNotExist:
+            return None
+        related_ids = {
+            field: set(
+                self._links(field)
+                .filter(video_id=id)
+                .values_list(RELATED_ID_FIELDS[field], flat=True)
+            )
+            for field in RELATED_ID_FIELDS
+        }
+        return VideoModelMapper.from_model_to_entity(video, **related_ids)
 
     def delete(self, id: UUID) -> None:
-        raise NotImplementedError
+        with transaction.atomic():
+            media = self.model.objects.filter(id=id).values(
+                *(f"{field}_id" for field in IMAGE_MEDIA_FIELDS),
+                *(f"{field}_id" for field in AUDIO_VIDEO_MEDIA_FIELDS),
+            )
+            media_ids = {media_id for row in media for media_id in row.values()}
+            self.model.objects.filter(id=id).delete()
+            # Media rows belong to their video and are not shared.
+            ImageMediaModel.objects.filter(id__in=media_ids).delete()
+            AudioVideoMediaModel.objects.filter(id__in=media_ids).delete()
+        bump_list_generation("videos")
 
     def list(self) -> list[Video]:
-        raise NotImplementedError
+        related_ids = {
+            field: self._related_ids_by_video(self._links(field), field)
+            for field in RELATED_ID_FIELDS
+        }
+        return [
+            VideoModelMapper.from_model_to_entity(
+                video,
+                **{field: related_ids[field][video.id] for field in RELATED_ID_FIELDS},
+            )
+            for video in self._videos()
+        ]
+
+    def list_page(
+        self, filter: VideoFilter, order_by: str, offset: int, limit: int
+    ) -> Page[Video]:
+        queryset = self._filtered(filter)
+        videos = list(
+            queryset.select_related(
+                *IMAGE_MEDIA_FIELDS, *AUDIO_VIDEO_MEDIA_FIELDS
+            ).order_by(order_by, "id")[offset : offset + limit]
+        )
+        video_ids = [video.id for video in videos]
+        related_ids = {
+            field: self._related_ids_by_video(
+                self._links(field).filter(video_id__in=video_ids), field
+            )
+            for field in RELATED_ID_FIELDS
+        }
+        return Page(
+            items=[
+                VideoModelMapper.from_model_to_entity(
+                    video,
+                    **{
+                        field: related_ids[field][video.id]
+                        for field in RELATED_ID_FIELDS
+                    },
+                )
+                for video in videos
+            ],
+            total_items=queryset.count(),
+        )
+
+    async def alist_page(
+        self, filter: VideoFilter, order_by: str, offset: int, limit: int
+    ) -> Page[Video]:
+        queryset = self._filtered(filter)
+        videos = [
+            video
+            async for video in queryset.select_related(
+                *IMAGE_MEDIA_FIELDS, *AUDIO_VIDEO_MEDIA_FIELDS
+            ).order_by(order_by, "id")[offset : offset + limit]
+        ]
+        video_ids = [video.id for video in videos]
+        related_ids = {
+            field: await self._arelated_ids_by_video(
+                self._links(field).filter(video_id__in=video_ids), field
+            )
+            for field in RELATED_ID_FIELDS
+        }
+        return Page(
+            items=[
+                VideoModelMapper.from_model_to_entity(
+                    video,
+                    **{
+                        field: related_ids[field][video.id]
+                        for field in RELATED_ID_FIELDS
+                    },
+                )
+                for video in videos
+            ],
+            total_items=await queryset.acount(),
+        )
 
     def update(self, video: Video) -> Video | None:
-        raise NotImplementedError
+        updated_at = timezone.now()
+        with transaction.atomic():
+            updated_rows = self.model.objects.filter(
+                id=video.id,
+                version=video.version,
+            ).update(
+                title=video.title,
+                description=video.description,
+                launch_year=video.launch_year,
+                duration=video.duration,
+                published=video.published,
+                rating=video.rating.name,
+                version=F("version") + 1,
+                updated_at=updated_at,
+            )
+            if not updated_rows:
+                return None
+            for field, id_field in RELATED_ID_FIELDS.items():
+                self._replace_links(video.id, field, id_field, getattr(video, field))
+            self._replace_media(video)
+        bump_list_generation("videos")
+        video.version += 1
+        video.updated_at = updated_at
+        return video
+
+    def _videos(self) -> QuerySet:
+        return self.model.objects.select_related(
+            *IMAGE_MEDIA_FIELDS, *AUDIO_VIDEO_MEDIA_FIELDS
+        )
+
+    def _filtered(self, filter: VideoFilter) -> QuerySet:
+        """Videos matching `filter`, one through-table join per relation.
+
+        Each relation is filtered on the through table's own column, so the
+        join never reaches the related table and uses its foreign key index.
+        A video links to an id at most once, so no DISTINCT is needed.
+        """
+        queryset = self.model.objects.all()
+        if filter.category_id is not None:
+            queryset = queryset.filter(categories=filter.category_id)
+        if filter.genre_id is not None:
+            queryset = queryset.filter(genres=filter.genre_id)
+        if filter.cast_member_id is not None:
+            queryset = queryset.filter(cast_members=filter.cast_member_id)
+        if filter.published is not None:
+            queryset = queryset.filter(published=filter.published)
+        if filter.ratings is not None:
+            queryset = queryset.filter(
+                rating__in=sorted(rating.name for rating in filter.ratings)
+            )
+        if filter.min_launch_year is not None:
+            queryset = queryset.filter(launch_year__gte=filter.min_launch_year)
+        if filter.max_launch_year is not None:
+            queryset = queryset.filter(launch_year__lte=filter.max_launch_year)
+        return queryset
+
+    def _links(self, field: str) -> QuerySet:
+        return getattr(self.model, field).through.objects.all()
+
+    def _related_ids_by_video(
+        self, links: QuerySet, field: str
+    ) -> dict[UUID, set[UUID]]:
+        related_ids_by_video = defaultdict(set)
+        for video_id, related_id in links.values_list(
+            "video_id", RELATED_ID_FIELDS[field]
+        ):
+            related_ids_by_video[video_id].add(related_id)
+        return related_ids_by_video
+
+    async def _arelated_ids_by_video(
+        self, links: QuerySet, field: str
+    ) -> dict[UUID, set[UUID]]:
+        related_ids_by_video = defaultdict(set)
+        async for video_id, related_id in links.values_list(
+            "video_id", RELATED_ID_FIELDS[field]
+        ):
+            related_ids_by_video[video_id].add(related_id)
+        return related_ids_by_video
+
+    def _replace_links(
+        self, video_id: UUID, field: str, id_field: str, related_ids: set[UUID]
+    ) -> None:
+        self._links(field).filter(video_id=video_id).exclude(
+            **{f"{id_field}__in": related_ids}
+        ).delete()
+        self._insert_links(video_id, field, id_field, related_ids)
+
+    def _insert_links(
+        self, video_id: UUID, field: str, id_field: str, related_ids: set[UUID]
+    ) -> None:
+        if not related_ids:
+            return
+        through = getattr(self.model, field).through
+        through.objects.bulk_create(
+            [
+                through(video_id=video_id, **{id_field: related_id})
+                for related_id in related_ids
+            ],
+            ignore_conflicts=True,
+        )
+
+    def _media_models(
+        self, video: Video
+    ) -> dict[str, ImageMediaModel | AudioVideoMediaModel]:
+        media = {
+            field: VideoModelMapper.media_to_model(getattr(video, field))
+            for field in IMAGE_MEDIA_FIELDS + AUDIO_VIDEO_MEDIA_FIELDS
+        }
+        return {field: model for field, model in media.items() if model is not None}
+
+    def _insert_media(self, media_models) -> None:
+        ImageMediaModel.objects.bulk_create(
+            [model for model in media_models if isinstance(model, ImageMediaModel)]
+        )
+        AudioVideoMediaModel.objects.bulk_create(
+            [model for model in media_models if isinstance(model, AudioVideoMediaModel)]
+        )
+
+    def _replace_media(self, video: Video) -> None:
+        """Store the media that changed; unchanged media cost one read only."""
+        stored = self._videos().get(id=video.id)
+        changes, replaced_ids = {}, []
+        for field in IMAGE_MEDIA_FIELDS + AUDIO_VIDEO_MEDIA_FIELDS:
+            media = getattr(video, field)
+            stored_media = getattr(stored, field)
+            if media == VideoModelMapper.media_to_entity(stored_media):
+                continue
+            if stored_media is not None:
+                replaced_ids.append(stored_media.id)
+            changes[field] = VideoModelMapper.media_to_model(media)
+        if not changes:
+            return
+        self._insert_media(changes.values())
+        self.model.objects.filter(id=video.id).update(**changes)
+        ImageMediaModel.objects.filter(id__in=replaced_ids).delete()
+        AudioVideoMediaModel.objects.filter(id__in=replaced_ids).delete()
 
 
 class VideoModelMapper:
     @staticmethod
-    def from_entity_to_model(video: Video) -> VideoModel:
-        model = VideoModel(
+    def from_entity_to_model(video: Video, video_model=VideoModel) -> VideoModel:
+        """The unsaved row of `video`; media and relations are the caller's."""
+        return video_model(
             id=video.id,
             title=video.title,
             description=video.description,
             launch_year=video.launch_year,
             duration=video.duration,
             published=video.published,
-            rating=video.rating,
+            rating=video.rating.name,
+            version=video.version,
         )
-        model.save()
-        if video.categories:
-            model.categories.set(video.categories)
-        if video.genres:
-            model.genres.set(video.genres)
-        if video.cast_members:
-            model.cast_members.set(video.cast_members)
-        return model
 
     @staticmethod
-    def from_model_to_entity(video: VideoModel) -> Video:
-        return Video(
+    def from_model_to_entity(
+        video: VideoModel,
+        categories: set[UUID],
+        genres: set[UUID],
+        cast_members: set[UUID],
+    ) -> Video:
+        """Rebuild a video from its row and the ids of its relations.
+
+        The related ids are passed in rather than read from the row's
+        managers, so mapping never issues a query of its own.
+        """
+        return Video.reconstitute(
             id=video.id,
             title=video.title,
             description=video.description,
             launch_year=video.launch_year,
             duration=video.duration,
             published=video.published,
-            rating=video.rating,
-            categories=video.categories,
-            genres=video.genres,
-            cast_members=video.cast_members,
+            rating=Rating[video.rating],
+            categories=categories,
+            genres=genres,
+            cast_members=cast_members,
+            banner=VideoModelMapper.media_to_entity(video.banner),
+            thumbnail=VideoModelMapper.media_to_entity(video.thumbnail),
+            thumbnail_half=VideoModelMapper.media_to_entity(video.thumbnail_half),
+            trailer=VideoModelMapper.media_to_entity(video.trailer),
+            video=VideoModelMapper.media_to_entity(video.video),
+            version=video.version,
+            updated_at=video.updated_at,
+        )
+
+    @staticmethod
+    def media_to_model(
+        media: ImageMedia | AudioVideoMedia | None,
+    ) -> ImageMediaModel | AudioVideoMediaModel | None:
+        """The unsaved row of `media`, or None when there is none."""
+        if media is None:
+            return None
+        if isinstance(media, ImageMedia):
+            return ImageMediaModel(
+                checksum=media.check_sum,
+                name=media.name,
+                raw_location=media.location,
+            )
+        return AudioVideoMediaModel(
+            checksum=media.check_sum,
+            name=media.name,
+            raw_location=media.raw_location,
+            encoded_location=media.encoded_location,
+            status=media.status.name,
+        )
+
+    @staticmethod
+    def media_to_entity(
+        media: ImageMediaModel | AudioVideoMediaModel | None,
+    ) -> ImageMedia | AudioVideoMedia | None:
+        if media is None:
+            return None
+        if isinstance(media, ImageMediaModel):
+            return ImageMedia(
+                check_sum=media.checksum,
+                name=media.name,
+                location=media.raw_location,
+            )
+        return AudioVideoMedia(
+            check_sum=media.checksum,
+            name=media.name,
+            raw_location=media.raw_location,
+            encoded_location=media.encoded_location,
+            status=MediaStatus[media.status],
+        )
+
+
+class DjangoORMMediaUploadRepository(MediaUploadRepository):
+    def __init__(self, model: MediaUploadModel | None = None) -> None:
+        self.model = model or MediaUploadModel
+
+    def save(self, media_upload: MediaUpload) -> MediaUpload:
+        self.model.objects.create(
+            id=media_upload.id,
+            video_id=media_upload.video_id,
+            media_type=media_upload.media_type.name,
+            name=media_upload.name,
+            size=media_upload.size,
+            chunk_size=media_upload.chunk_size,
+            offset=media_upload.offset,
+            check_sum=media_upload.check_sum,
+            version=media_upload.version,
+        )
+        return media_upload
+
+    def get_by_id(self, id: UUID) -> MediaUpload | None:
+        try:
+            media_upload = self.model.objects.get(id=id)
+        except self.model.DoesNotExist:
+            return None
+        return MediaUpload.reconstitute(
+            id=media_upload.id,
+            video_id=media_upload.video_id,
+            media_type=MediaType[media_upload.media_type],
+            name=media_upload.name,
+            size=media_upload.size,
+            chunk_size=media_upload.chunk_size,
+            offset=media_upload.offset,
+            check_sum=media_upload.check_sum,
+            version=media_upload.version,
+            updated_at=media_upload.updated_at,
+        )
+
+    def update(self, media_upload: MediaUpload) -> MediaUpload | None:
+        """Only progress changes, and only if no other chunk was recorded since."""
+        updated_at = timezone.now()
+        updated_rows = self.model.objects.filter(
+            id=media_upload.id,
+            version=media_upload.version,
+        ).update(
+            offset=media_upload.offset,
+            check_sum=media_upload.check_sum,
+            version=F("version") + 1,
+            updated_at=updated_at,
         )
+        if not updated_rows:
+            return None
+        media_upload.version += 1
+        media_upload.updated_at = updated_at
+        return media_upload
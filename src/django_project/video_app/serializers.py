@@ -1,5 +1,8 @@
 from rest_framework import serializers
 
+from src.core.video.domain.value_objects import MediaType, Rating
+from src.django_project._shared.fast_serializers import compile_serializer
+
 
 class SetField(serializers.ListField):
     def to_internal_value(self, data):
@@ -9,6 +12,30 @@ class SetField(serializers.ListField):
         return list(super().to_representation(value))
 
 
+class RatingField(serializers.ChoiceField):
+    def __init__(self, **kwargs):
+        super().__init__(choices=[rating.name for rating in Rating], **kwargs)
+
+    def to_internal_value(self, data):
+        return Rating[super().to_internal_value(data)]
+
+    def to_representation(self, value):
+        return value.name
+
+
+class MediaTypeField(serializers.ChoiceField):
+    def __init__(self, **kwargs):
+        super().__init__(
+            choices=[media_type.name for media_type in MediaType], **kwargs
+        )
+
+    def to_internal_value(self, data):
+        return MediaType[super().to_internal_value(data)]
+
+    def to_representation(self, value):
+        return value.name
+
+
 class CategoriesSetField(SetField): ...
 
 
@@ -23,7 +50,7 @@ class CreateVideoWithoutMediaRequestSerializer(serializers.Serializer):
     description = serializers.CharField()
     launch_year = serializers.IntegerField()
     duration = serializers.IntegerField()
-    rating = serializers.FloatField()
+    rating = RatingField()
     categories = CategoriesSetField(child=serializers.UUIDField())
     genres = GenresSetField(child=serializers.UUIDField())
     cast_members = CastMembersSetField(child=serializers.UUIDField())
@@ -35,7 +62,83 @@ class CreateVideoWithoutMediaResponseSerializer(serializers.Serializer):
     description = serializers.CharField()
     launch_year = serializers.IntegerField()
     duration = serializers.IntegerField()
-    rating = serializers.FloatField()
+    rating = RatingField()
     categories = CategoriesSetField(child=serializers.UUIDField())
     genres = GenresSetField(child=serializers.UUIDField())
     cast_members = CastMembersSetField(child=serializers.UUIDField())
+
+
+class ListVideosRequestSerializer(serializers.Serializer):
+    order_by = serializers.ChoiceField(
+        choices=["id", "title", "launch_year", "duration"],
+        default="title",
+    )
+    current_page = serializers.IntegerField(min_value=1, default=1)
+    page_size = serializers.IntegerField(min_value=1, max_value=100, default=2)
+    category_id = serializers.UUIDField(required=False)
+    genre_id = serializers.UUIDField(required=False)
+    cast_member_id = serializers.UUIDField(required=False)
+    published = serializers.BooleanField(allow_null=True, default=None)
+    max_rating = RatingField(required=False)
+    min_launch_year = serializers.IntegerField(required=False)
+    max_launch_year = serializers.IntegerField(required=False)
+
+
+class VideoSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    title = serializers.CharField()
+    description = serializers.CharField()
+    launch_year = serializers.IntegerField()
+    duration = serializers.IntegerField()
+    published = serializers.BooleanField()
+    rating = RatingField()
+    categories = CategoriesSetField(child=serializers.UUIDField())
+    genres = GenresSetField(child=serializers.UUIDField())
+    cast_members = CastMembersSetField(child=serializers.UUIDField())
+
+
+class ListVideosMetaSerializer(serializers.Serializer):
+    current_page = serializers.IntegerField()
+    page_size = serializers.IntegerField()
+    total_items = serializers.IntegerField()
+    total_pages = serializers.IntegerField()
+
+
+class ListVideosResponseSerializer(serializers.Serializer):
+    data = VideoSerializer(many=True)
+    meta = ListVideosMetaSerializer()
+
+
+class StartMediaUploadRequestSerializer(serializers.Serializer):
+    media_type = MediaTypeField()
+    name = serializers.CharField(max_length=150)
+    size = serializers.IntegerField(min_value=1)
+
+
+class MediaUploadRequestSerializer(serializers.Serializer):
+    video_id = serializers.UUIDField()
+    id = serializers.UUIDField(required=False)
+
+
+class UploadMediaChunkRequestSerializer(serializers.Serializer):
+    video_id = serializers.UUIDField()
+    id = serializers.UUIDField()
+    offset = serializers.IntegerField(min_value=0)
+
+
+class MediaUploadResponseSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    video_id = serializers.UUIDField()
+    media_type = MediaTypeField()
+    name = serializers.CharField()
+    size = serializers.IntegerField()
+    chunk_size = serializers.IntegerField()
+    offset = serializers.IntegerField()
+    check_sum = serializers.CharField()
+
+
+render_create_video_without_media_response = compile_serializer(
+    CreateVideoWithoutMediaResponseSerializer
+)
+render_list_videos_response = compile_serializer(ListVideosResponseSerializer)
+render_media_upload_response = compile_serializer(MediaUploadResponseSerializer)
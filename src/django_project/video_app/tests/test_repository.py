@@ -0,0 +1,406 @@
+import uuid
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
+from src.core.category.domain.category import Category
+from src.core.genre.domain.genre import Genre
+from src.core.video.domain.media_upload import MediaUpload
+from src.core.video.domain.value_objects import (
+    AudioVideoMedia,
+    ImageMedia,
+    MediaStatus,
+    MediaType,
+    Rating,
+)
+from src.core.video.domain.video import Video
+from src.core.video.domain.video_repository import VideoFilter
+from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+from src.django_project.video_app.models import (
+    AudioVideoMedia as AudioVideoMediaModel,
+    ImageMedia as ImageMediaModel,
+    Video as VideoModel,
+)
+from src.django_project.video_app.repository import (
+    DjangoORMMediaUploadRepository,
+    DjangoORMVideoRepository,
+)
+
+
+class CommonFixtures:
+    @pytest.fixture
+    def categories(self) -> list[Category]:
+        return DjangoORMCategoryRepository().save_many(
+            [Category(name="Movie"), Category(name="Documentary")]
+        )
+
+    @pytest.fixture
+    def genre(self) -> Genre:
+        return DjangoORMGenreRepository().save(Genre(name="Drama", categories=set()))
+
+    @pytest.fixture
+    def cast_member(self) -> CastMember:
+        return DjangoORMCastMemberRepository().save(
+            CastMember(name="John Doe", type=CastMemberType.ACTOR)
+        )
+
+    @pytest.fixture
+    def make_video(self, categories, genre, cast_member):
+        def make_video(title: str = "Inception", **kwargs) -> Video:
+            attributes = dict(
+                title=title,
+                description="A thief who steals corporate secrets.",
+                launch_year=2010,
+                duration=Decimal("148.00"),
+                rating=Rating.AGE_14,
+                categories={categories[0].id},
+                genres={genre.id},
+                cast_members={cast_member.id},
+            )
+            return Video(**{**attributes, **kwargs})
+
+        return make_video
+
+    @pytest.fixture
+    def banner(self) -> ImageMedia:
+        return ImageMedia(check_sum="abc", name="banner.png", location="/banner.png")
+
+    @pytest.fixture
+    def trailer(self) -> AudioVideoMedia:
+        return AudioVideoMedia(
+            check_sum="def",
+            name="trailer.mp4",
+            raw_location="/raw/trailer.mp4",
+            encoded_location="",
+            status=MediaStatus.PENDING,
+        )
+
+
+@pytest.mark.django_db
+class TestSaveAndGetById(CommonFixtures):
+    def test_round_trips_relations_and_media_as_plain_values(
+        self, make_video, categories, genre, cast_member, banner, trailer
+    ):
+        repository = DjangoORMVideoRepository()
+        saved_video = repository.save(make_video(banner=banner, trailer=trailer))
+
+        video = repository.get_by_id(saved_video.id)
+
+        assert video == saved_video
+        assert video.rating == Rating.AGE_14
+        assert video.duration == Decimal("148.00")
+        assert video.categories == {categories[0].id}
+        assert video.genres == {genre.id}
+        assert video.cast_members == {cast_member.id}
+        assert video.banner == banner
+        assert video.trailer == trailer
+        assert video.thumbnail is None
+
+    def test_save_returns_related_ids_as_sets(self, make_video, categories, genre):
+        saved_video = DjangoORMVideoRepository().save(make_video())
+
+        assert saved_video.categories == {categories[0].id}
+        assert saved_video.genres == {genre.id}
+
+    @pytest.mark.parametrize("relations_count", [1, 50])
+    def test_save_uses_a_fixed_number_of_statements(
+        self, relations_count, make_video, banner, trailer, django_assert_num_queries
+    ):
+        categories = DjangoORMCategoryRepository().save_many(
+            [Category(name=f"Category {index}") for index in range(relations_count)]
+        )
+        genres = DjangoORMGenreRepository().save_many(
+            [
+                Genre(name=f"Genre {index}", categories=set())
+                for index in range(relations_count)
+            ]
+        )
+        cast_members = DjangoORMCastMemberRepository().save_many(
+            [
+                CastMember(name=f"Member {index}", type=CastMemberType.ACTOR)
+                for index in range(relations_count)
+            ]
+        )
+        video = make_video(
+            categories={category.id for category in categories},
+            genres={genre.id for genre in genres},
+            cast_members={cast_member.id for cast_member in cast_members},
+            banner=banner,
+            trailer=trailer,
+        )
+
+        # Savepoint, both media, the video, one bulk insert per relation,
+        # release.
+        with django_assert_num_queries(8):
+            DjangoORMVideoRepository().save(video)
+
+        stored_video = DjangoORMVideoRepository().get_by_id(video.id)
+        assert len(stored_video.categories) == relations_count
+        assert len(stored_video.genres) == relations_count
+        assert len(stored_video.cast_members) == relations_count
+        assert stored_video.banner == banner
+
+    def test_get_by_id_uses_a_fixed_number_of_queries(
+        self, make_video, banner, trailer, django_assert_num_queries
+    ):
+        repository = DjangoORMVideoRepository()
+        video = repository.save(make_video(banner=banner, trailer=trailer))
+
+        # The video joined with its media, then one query per relation.
+        with django_assert_num_queries(4):
+            assert repository.get_by_id(video.id).banner == banner
+
+    def test_get_by_id_returns_none_when_video_does_not_exist(self):
+        assert DjangoORMVideoRepository().get_by_id(uuid.uuid4()) is None
+
+
+@pytest.mark.django_db
+class TestList(CommonFixtures):
+    @pytest.mark.parametrize("videos_count", [1, 5, 20])
+    def test_uses_the_same_number_of_queries_for_any_number_of_videos(
+        self, videos_count, make_video, categories, banner, django_assert_num_queries
+    ):
+        repository = DjangoORMVideoRepository()
+        for index in range(videos_count):
+            repository.save(make_video(title=f"Video {index}", banner=banner))
+
+        with django_assert_num_queries(4):
+            videos = repository.list()
+
+        assert len(videos) == videos_count
+        assert all(video.categories == {categories[0].id} for video in videos)
+        assert all(video.banner == banner for video in videos)
+
+    def test_returns_empty_list_when_there_are_no_videos(self):
+        assert DjangoORMVideoRepository().list() == []
+
+
+@pytest.mark.django_db
+class TestListPage(CommonFixtures):
+    @pytest.fixture
+    def catalog(self, make_video, categories, genre, cast_member) -> dict[str, Video]:
+        repository = DjangoORMVideoRepository()
+        videos = {
+            "kids": make_video(
+                title="Kids", rating=Rating.L, launch_year=2018, published=True
+            ),
+            "teen": make_video(
+                title="Teen", rating=Rating.AGE_12, launch_year=2016, published=True
+            ),
+            "old": make_video(
+                title="Old", rating=Rating.AGE_10, launch_year=2001, published=True
+            ),
+            "adult": make_video(
+                title="Adult", rating=Rating.AGE_18, launch_year=2020, published=True
+            ),
+            "draft": make_video(
+                title="Draft", rating=Rating.L, launch_year=2019, published=False
+            ),
+        }
+        videos["other"] = make_video(title="Other", rating=Rating.L, launch_year=2017)
+        videos["other"].categories = {categories[1].id}
+        videos["other"].published = True
+        for video in videos.values():
+            repository.save(video)
+        return videos
+
+    def titles(self, page) -> list[str]:
+        return [video.title for video in page.items]
+
+    def test_combines_relation_and_column_filters(self, catalog, categories):
+        page = DjangoORMVideoRepository().list_page(
+            filter=VideoFilter(
+                category_id=categories[0].id,
+                published=True,
+                max_rating=Rating.AGE_12,
+                min_launch_year=2015,
+            ),
+            order_by="title",
+            offset=0,
+            limit=10,
+        )
+
+        assert self.titles(page) == ["Kids", "Teen"]
+        assert page.total_items == 2
+
+    def test_filters_by_genre_cast_member_and_year_range(
+        self, catalog, genre, cast_member
+    ):
+        page = DjangoORMVideoRepository().list_page(
+            filter=VideoFilter(
+                genre_id=genre.id,
+                cast_member_id=cast_member.id,
+                min_launch_year=2016,
+                max_launch_year=2019,
+            ),
+            order_by="launch_year",
+            offset=0,
+            limit=10,
+        )
+
+        assert self.titles(page) == ["Teen", "Other", "Kids", "Draft"]
+
+    def test_pages_in_the_database_and_counts_all_matches(
+        self, catalog, django_assert_num_queries
+    ):
+        # Count, the page with its media, then one query per relation.
+        with django_assert_num_queries(5):
+            page = DjangoORMVideoRepository().list_page(
+                filter=VideoFilter(published=True),
+                order_by="title",
+                offset=1,
+                limit=2,
+            )
+
+        assert self.titles(page) == ["Kids", "Old"]
+        assert page.total_items == 5
+        assert all(video.genres for video in page.items)
+
+    def test_alist_page_matches_list_page(self, catalog, categories):
+        repository = DjangoORMVideoRepository()
+        arguments = dict(
+            filter=VideoFilter(category_id=categories[0].id, max_rating=Rating.L),
+            order_by="title",
+            offset=0,
+            limit=10,
+        )
+
+        page = async_to_sync(repository.alist_page)(**arguments)
+
+        assert page == repository.list_page(**arguments)
+        assert self.titles(page) == ["Draft", "Kids"]
+
+
+@pytest.mark.django_db
+class TestUpdate(CommonFixtures):
+    def test_diffs_relation_membership(self, make_video, categories, genre):
+        repository = DjangoORMVideoRepository()
+        video = repository.save(make_video())
+        video.categories = {categories[1].id}
+        video.genres = set()
+        video.update(
+            title="Inception (Director's Cut)",
+            description=video.description,
+            launch_year=video.launch_year,
+            duration=video.duration,
+            published=True,
+            rating=Rating.AGE_16,
+        )
+
+        updated_video = repository.update(video)
+
+        assert updated_video.version == 2
+        stored_video = repository.get_by_id(video.id)
+        assert stored_video.title == "Inception (Director's Cut)"
+        assert stored_video.published is True
+        assert stored_video.rating == Rating.AGE_16
+        assert stored_video.categories == {categories[1].id}
+        assert stored_video.genres == set()
+        assert stored_video.cast_members == video.cast_members
+
+    def test_does_not_touch_relations_or_media_that_did_not_change(
+        self, make_video, banner, django_assert_num_queries
+    ):
+        repository = DjangoORMVideoRepository()
+        video = repository.save(make_video(banner=banner))
+
+        # Savepoint, update, per relation a no-op delete and an
+        # insert-or-ignore, one read of the stored media, release.
+        with django_assert_num_queries(10):
+            repository.update(video)
+
+        assert ImageMediaModel.objects.count() == 1
+
+    def test_replaces_changed_media_and_drops_the_old_rows(
+        self, make_video, banner, trailer
+    ):
+        repository = DjangoORMVideoRepository()
+        video = repository.save(make_video(banner=banner))
+        new_banner = ImageMedia(check_sum="xyz", name="new.png", location="/new.png")
+        video.update_banner(new_banner)
+        video.update_trailer(trailer)
+
+        repository.update(video)
+
+        stored_video = repository.get_by_id(video.id)
+        assert stored_video.banner == new_banner
+        assert stored_video.trailer == trailer
+        assert ImageMediaModel.objects.count() == 1
+        assert AudioVideoMediaModel.objects.count() == 1
+
+    def test_returns_none_when_version_is_stale(self, make_video):
+        repository = DjangoORMVideoRepository()
+        video = repository.save(make_video())
+        repository.update(repository.get_by_id(video.id))
+
+        assert repository.update(video) is None
+        assert repository.get_by_id(video.id).version == 2
+
+    def test_returns_none_when_video_does_not_exist(self, make_video):
+        assert DjangoORMVideoRepository().update(make_video()) is None
+
+
+@pytest.mark.django_db
+class TestDelete(CommonFixtures):
+    def test_deletes_video_with_its_relations_and_media(
+        self, make_video, banner, trailer
+    ):
+        repository = DjangoORMVideoRepository()
+        video = repository.save(make_video(banner=banner, trailer=trailer))
+
+        repository.delete(video.id)
+
+        assert VideoModel.objects.count() == 0
+        assert VideoModel.categories.through.objects.count() == 0
+        assert ImageMediaModel.objects.count() == 0
+        assert AudioVideoMediaModel.objects.count() == 0
+
+    def test_does_not_fail_when_video_does_not_exist(self):
+        DjangoORMVideoRepository().delete(uuid.uuid4())
+
+
+@pytest.mark.django_db
+class TestMediaUploadRepository(CommonFixtures):
+    @pytest.fixture
+    def upload(self, make_video) -> MediaUpload:
+        video = DjangoORMVideoRepository().save(make_video())
+        return DjangoORMMediaUploadRepository().save(
+            MediaUpload(
+                video_id=video.id,
+                media_type=MediaType.TRAILER,
+                name="trailer.mp4",
+                size=10,
+                chunk_size=4,
+            )
+        )
+
+    def test_round_trips_progress(self, upload):
+        repository = DjangoORMMediaUploadRepository()
+        upload.record_chunk(4, b"\x00" * 32)
+
+        assert repository.update(upload) is upload
+        stored = repository.get_by_id(upload.id)
+
+        assert (stored.offset, stored.check_sum, stored.version) == (
+            4,
+            upload.check_sum,
+            2,
+        )
+        assert stored.media_type == MediaType.TRAILER
+
+    def test_update_returns_none_when_another_chunk_was_recorded(self, upload):
+        repository = DjangoORMMediaUploadRepository()
+        stale = repository.get_by_id(upload.id)
+        upload.record_chunk(4, b"\x00" * 32)
+        repository.update(upload)
+        stale.record_chunk(4, b"\x01" * 32)
+
+        assert repository.update(stale) is None
+        assert repository.get_by_id(upload.id).check_sum == upload.check_sum
+
+    def test_get_by_id_returns_none_when_upload_does_not_exist(self):
+        assert DjangoORMMediaUploadRepository().get_by_id(uuid.uuid4()) is None
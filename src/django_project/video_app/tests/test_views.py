@@ -0,0 +1,228 @@
+import hashlib
+from decimal import Decimal
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from src.core.category.domain.category import Category
+from src.core.genre.domain.genre import Genre
+from src.core.video.domain.value_objects import MediaStatus, Rating
+from src.core.video.domain.video import Video
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+from src.django_project.video_app.repository import DjangoORMVideoRepository
+
+
+@pytest.mark.django_db
+class CommonFixtures:
+    @pytest.fixture
+    def client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def category(self) -> Category:
+        return DjangoORMCategoryRepository().save(Category(name="Movie"))
+
+    @pytest.fixture
+    def genre(self) -> Genre:
+        return DjangoORMGenreRepository().save(Genre(name="Drama", categories=set()))
+
+    @pytest.fixture
+    def create_video(self, category, genre):
+        def create_video(title, rating, launch_year, published=True, categories=None):
+            return DjangoORMVideoRepository().save(
+                Video(
+                    title=title,
+                    description=f"{title} description",
+                    launch_year=launch_year,
+                    duration=Decimal("120.00"),
+                    rating=rating,
+                    published=published,
+                    categories={category.id} if categories is None else categories,
+                    genres={genre.id},
+                    cast_members=set(),
+                )
+            )
+
+        return create_video
+
+
+class TestListVideosAPI(CommonFixtures):
+    def test_lists_filtered_page_of_videos(self, client, create_video, category, genre):
+        kids = create_video("Kids", Rating.L, 2018)
+        create_video("Teen", Rating.AGE_12, 2016)
+        create_video("Old", Rating.AGE_10, 2001)
+        create_video("Adult", Rating.AGE_18, 2020)
+        create_video("Draft", Rating.L, 2019, published=False)
+        create_video("Uncategorized", Rating.L, 2019, categories=set())
+
+        response = client.get(
+            "/api/videos/",
+            {
+                "category_id": str(category.id),
+                "published": "true",
+                "max_rating": "AGE_12",
+                "min_launch_year": 2015,
+                "page_size": 1,
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "data": [
+                {
+                    "id": str(kids.id),
+                    "title": "Kids",
+                    "description": "Kids description",
+                    "launch_year": 2018,
+                    "duration": 120,
+                    "published": True,
+                    "rating": "L",
+                    "categories": [str(category.id)],
+                    "genres": [str(genre.id)],
+                    "cast_members": [],
+                }
+            ],
+            "meta": {
+                "current_page": 1,
+                "page_size": 1,
+                "total_items": 2,
+                "total_pages": 2,
+            },
+        }
+
+    def test_published_filter_is_optional(self, client, create_video):
+        create_video("Kids", Rating.L, 2018)
+        create_video("Draft", Rating.L, 2019, published=False)
+
+        response = client.get("/api/videos/", {"page_size": 10})
+
+        assert [video["title"] for video in response.json()["data"]] == [
+            "Draft",
+            "Kids",
+        ]
+
+    def test_new_videos_invalidate_cached_pages(self, client, create_video):
+        create_video("Kids", Rating.L, 2018)
+        assert client.get("/api/videos/").json()["meta"]["total_items"] == 1
+
+        create_video("Teen", Rating.AGE_12, 2016)
+
+        assert client.get("/api/videos/").json()["meta"]["total_items"] == 2
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"max_rating": "PG-13"},
+            {"category_id": "not-a-uuid"},
+            {"order_by": "rating"},
+            {"page_size": 101},
+        ],
+    )
+    def test_rejects_invalid_filters(self, client, params):
+        response = client.get("/api/videos/", params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestMediaUploadAPI(CommonFixtures):
+    @pytest.fixture(autouse=True)
+    def media_settings(self, settings, tmp_path):
+        settings.MEDIA_ROOT = tmp_path
+        settings.MEDIA_UPLOAD_CHUNK_SIZE = 4
+
+    @pytest.fixture
+    def video(self, create_video):
+        return create_video("Kids", Rating.L, 2018)
+
+    def start(self, client, video, **data):
+        return client.post(
+            f"/api/videos/{video.id}/uploads/",
+            {"media_type": "VIDEO", "name": "master.mp4", "size": 10, **data},
+            format="json",
+        )
+
+    def send(self, client, video, upload_id, offset, chunk):
+        return client.patch(
+            f"/api/videos/{video.id}/uploads/{upload_id}/",
+            chunk,
+            content_type="application/offset+octet-stream",
+            HTTP_UPLOAD_OFFSET=str(offset),
+        )
+
+    def test_uploads_in_chunks_and_attaches_pending_media(
+        self, client, video, tmp_path
+    ):
+        started = self.start(client, video)
+        assert started.status_code == status.HTTP_201_CREATED
+        upload = started.json()
+        assert (upload["chunk_size"], upload["offset"]) == (4, 0)
+
+        for offset, chunk in [(0, b"abcd"), (4, b"efgh"), (8, b"ij")]:
+            response = self.send(client, video, upload["id"], offset, chunk)
+            assert response.status_code == status.HTTP_200_OK
+            assert response["Upload-Offset"] == str(offset + len(chunk))
+
+        location = f"videos/{video.id}/{upload['id']}/master.mp4"
+        assert (tmp_path / location).read_bytes() == b"abcdefghij"
+        media = DjangoORMVideoRepository().get_by_id(video.id).video
+        assert media.status == MediaStatus.PENDING
+        assert media.raw_location == location
+        assert media.check_sum == response.json()["check_sum"]
+        check_sum = ""
+        for chunk in [b"abcd", b"efgh", b"ij"]:
+            check_sum = hashlib.sha256(
+                bytes.fromhex(check_sum) + hashlib.sha256(chunk).digest()
+            ).hexdigest()
+        assert media.check_sum == check_sum
+
+    def test_resumes_from_the_stored_offset(self, client, video, tmp_path):
+        upload_id = self.start(client, video, size=6).json()["id"]
+        self.send(client, video, upload_id, 0, b"abcd")
+
+        retried = self.send(client, video, upload_id, 0, b"abcd")
+        assert retried.status_code == status.HTTP_409_CONFLICT
+        assert retried.json()["offset"] == 4
+
+        status_response = client.get(f"/api/videos/{video.id}/uploads/{upload_id}/")
+        assert status_response.json()["offset"] == 4
+        assert status_response["Upload-Offset"] == "4"
+
+        assert self.send(client, video, upload_id, 4, b"ef").status_code == 200
+        location = f"videos/{video.id}/{upload_id}/master.mp4"
+        assert (tmp_path / location).read_bytes() == b"abcdef"
+
+    def test_rejects_chunk_of_the_wrong_size(self, client, video):
+        upload_id = self.start(client, video).json()["id"]
+
+        response = self.send(client, video, upload_id, 0, b"abcdef")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        status_response = client.get(f"/api/videos/{video.id}/uploads/{upload_id}/")
+        assert status_response.json()["offset"] == 0
+
+    def test_requires_the_upload_offset_header(self, client, video):
+        upload_id = self.start(client, video).json()["id"]
+
+        response = client.patch(
+            f"/api/videos/{video.id}/uploads/{upload_id}/",
+            b"abcd",
+            content_type="application/offset+octet-stream",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_start_returns_404_for_unknown_video(self, client):
+        response = client.post(
+            "/api/videos/2e9c1a54-64f2-4a1e-9c55-4f3d0c7b6f10/uploads/",
+            {"media_type": "BANNER", "name": "banner.png", "size": 10},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_start_rejects_paths_as_names(self, client, video):
+        response = self.start(client, video, name="../../etc/passwd")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -1,3 +1,5 @@
+from django.conf import settings
+from django.db import transaction
 from rest_framework import status, viewsets
 from rest_framework.views import Request, Response
 
@@ -5,39 +7,189 @@ from src.core.video.application.use_cases.create_video_without_media import (
     CreateVideoWithoutMedia,
 )
 from src.core.video.application.use_cases.exceptions import (
+    InvalidChunkException,
+    InvalidMediaUploadException,
     InvalidVideoDataException,
+    MediaUploadNotFoundException,
     RelatedEntitiesNotFoundException,
+    UploadOffsetConflictException,
+    VideoNotFoundException,
+    VideoVersionConflictException,
 )
+from src.core.video.application.use_cases.list_videos import ListVideos
+from src.core.video.application.use_cases.upload_media import (
+    GetMediaUpload,
+    MediaUploadOutput,
+    StartMediaUpload,
+    UploadMediaChunk,
+)
+from src.core.video.infra.local_media_storage import LocalMediaStorage
+from src.django_project._shared.async_views import AsyncViewSet
+from src.django_project._shared.conditional import aconditional_list_response
+from src.django_project._shared.executors import related_entity_check_executor
+from src.django_project._shared.unit_of_work import UnitOfWork
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
 from src.django_project.genre_app.repository import DjangoORMGenreRepository
 from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
-from src.django_project.video_app.repository import DjangoORMVideoRepository
+from src.django_project.video_app.models import Video as VideoModel
+from src.django_project.video_app.repository import (
+    DjangoORMMediaUploadRepository,
+    DjangoORMVideoRepository,
+)
 from src.django_project.video_app.serializers import (
     CreateVideoWithoutMediaRequestSerializer,
-    CreateVideoWithoutMediaResponseSerializer,
+    ListVideosRequestSerializer,
+    MediaUploadRequestSerializer,
+    StartMediaUploadRequestSerializer,
+    UploadMediaChunkRequestSerializer,
+    render_create_video_without_media_response,
+    render_list_videos_response,
+    render_media_upload_response,
 )
 
+# Request bodies are read in blocks of this size and written out as they
+# arrive, so a chunk never sits in memory whole.
+STREAM_BLOCK_SIZE = 64 * 1024
+
+
+class VideoViewSet(AsyncViewSet):
+    async def list(self, request: Request) -> Response:
+        request_serializer = ListVideosRequestSerializer(data=request.query_params)
+        request_serializer.is_valid(raise_exception=True)
+        return await aconditional_list_response(
+            request,
+            "videos",
+            request_serializer.validated_data,
+            VideoModel.objects.all(),
+            self._list,
+        )
+
+    async def _list(self, params) -> Response:
+        use_case = ListVideos(repository=DjangoORMVideoRepository())
+        output = await use_case.aexecute(ListVideos.Input(**params))
+        return Response(render_list_videos_response(output), status=status.HTTP_200_OK)
 
-class VideoViewSet(viewsets.ViewSet):
     def create(self, request: Request) -> Response:
         request_serializer = CreateVideoWithoutMediaRequestSerializer(data=request.data)
         request_serializer.is_valid(raise_exception=True)
-        repository = DjangoORMVideoRepository()
-        category_repository = DjangoORMCategoryRepository()
-        genre_repository = DjangoORMGenreRepository()
-        cast_member_repository = DjangoORMCastMemberRepository()
+        unit_of_work = UnitOfWork()
         use_case = CreateVideoWithoutMedia(
-            repository=repository,
-            category_repository=category_repository,
-            genre_repository=genre_repository,
-            cast_member_repository=cast_member_repository,
+            repository=unit_of_work.repository(DjangoORMVideoRepository()),
+            category_repository=unit_of_work.repository(DjangoORMCategoryRepository()),
+            genre_repository=unit_of_work.repository(DjangoORMGenreRepository()),
+            cast_member_repository=unit_of_work.repository(
+                DjangoORMCastMemberRepository()
+            ),
+            executor=related_entity_check_executor(),
         )
         input = CreateVideoWithoutMedia.Input(**request_serializer.validated_data)
         try:
-            output = use_case.execute(input)
-            response_serializer = CreateVideoWithoutMediaResponseSerializer(
-                instance=output
-            )
+            with unit_of_work:
+                output = use_case.execute(input)
         except (RelatedEntitiesNotFoundException, InvalidVideoDataException) as e:
             return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
-        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+        return Response(
+            render_create_video_without_media_response(output),
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class MediaUploadViewSet(viewsets.ViewSet):
+    """Chunked uploads of a video's media, resumable after a disconnect.
+
+    POST starts an upload and answers the chunk size. Each chunk is then sent
+    with PATCH as the raw request body, its position in the `Upload-Offset`
+    header. After a disconnect, GET tells the offset to resume from; a chunk
+    sent at any other offset gets a 409 carrying it. The last chunk attaches
+    the media to the video.
+    """
+
+    def create(self, request: Request, video_id: str) -> Response:
+        request_serializer = StartMediaUploadRequestSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        path_serializer = MediaUploadRequestSerializer(data={"video_id": video_id})
+        path_serializer.is_valid(raise_exception=True)
+        use_case = StartMediaUpload(
+            video_repository=DjangoORMVideoRepository(),
+            media_upload_repository=DjangoORMMediaUploadRepository(),
+            chunk_size=settings.MEDIA_UPLOAD_CHUNK_SIZE,
+        )
+        try:
+            output = use_case.execute(
+                StartMediaUpload.Input(
+                    **path_serializer.validated_data,
+                    **request_serializer.validated_data,
+                )
+            )
+        except VideoNotFoundException as e:
+            return Response({"detail": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except InvalidMediaUploadException as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return self._response(output, status.HTTP_201_CREATED)
+
+    def retrieve(self, request: Request, video_id: str, pk: str) -> Response:
+        request_serializer = MediaUploadRequestSerializer(
+            data={"video_id": video_id, "id": pk}
+        )
+        request_serializer.is_valid(raise_exception=True)
+        use_case = GetMediaUpload(
+            media_upload_repository=DjangoORMMediaUploadRepository()
+        )
+        try:
+            output = use_case.execute(
+                GetMediaUpload.Input(**request_serializer.validated_data)
+            )
+        except MediaUploadNotFoundException as e:
+            return Response({"detail": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        return self._response(output, status.HTTP_200_OK)
+
+    def partial_update(self, request: Request, video_id: str, pk: str) -> Response:
+        request_serializer = UploadMediaChunkRequestSerializer(
+            data={
+                "video_id": video_id,
+                "id": pk,
+                "offset": request.headers.get("Upload-Offset"),
+            }
+        )
+        request_serializer.is_valid(raise_exception=True)
+        use_case = UploadMediaChunk(
+            video_repository=DjangoORMVideoRepository(),
+            media_upload_repository=DjangoORMMediaUploadRepository(),
+            storage=LocalMediaStorage(settings.MEDIA_ROOT),
+        )
+        input = UploadMediaChunk.Input(
+            **request_serializer.validated_data, content=self._body(request)
+        )
+        try:
+            with transaction.atomic():
+                output = use_case.execute(input)
+        except MediaUploadNotFoundException as e:
+            return Response({"detail": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except UploadOffsetConflictException as e:
+            return Response(
+                {"detail": str(e), "offset": e.offset},
+                status=status.HTTP_409_CONFLICT,
+                headers={"Upload-Offset": str(e.offset)},
+            )
+        except VideoVersionConflictException as e:
+            return Response({"detail": str(e)}, status=status.HTTP_409_CONFLICT)
+        except InvalidChunkException as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except VideoNotFoundException as e:
+            return Response({"detail": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        return self._response(output, status.HTTP_200_OK)
+
+    @staticmethod
+    def _body(request: Request):
+        stream = request.stream
+        if stream is None:
+            return iter(())
+        return iter(lambda: stream.read(STREAM_BLOCK_SIZE), b"")
+
+    @staticmethod
+    def _response(output: MediaUploadOutput, status_code: int) -> Response:
+        return Response(
+            render_media_upload_response(output),
+            status=status_code,
+            headers={"Upload-Offset": str(output.offset)},
+        )